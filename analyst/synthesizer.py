@@ -1,18 +1,18 @@
 import json
 from datetime import datetime
 from typing import Tuple, List, Dict, Any
-from openai import OpenAI
 
 # MIGRATION CONFIG
 from core.settings import settings
 
 from memory.vector_manager import VectorManager
 from brain.router import IntentRouter
+from brain.clients import shared_clients
 
 
 class Synthesizer:
     def __init__(self, graph_manager: Any = None):
-        self.client = OpenAI(base_url=settings.LLM_BASE_URL, api_key="ollama")
+        self.client = shared_clients().openai(settings.LLM_BASE_URL)
         self.vector_db = VectorManager()
         self.router = IntentRouter()
         # Note: SESSION_ID n'est pas dans settings, on scanne ou on génère un nom générique
@@ -82,9 +82,9 @@ class Synthesizer:
 
         # B. Recherche Graphique
         if self.graph:
-            active_nodes = [n for n in self.graph.nodes.values() if n.activation > 0]
-            active_nodes.sort(key=lambda x: x.get_current_weight(), reverse=True)
-            for node in active_nodes[:3]:
+            with self.graph.lock:
+                active = self.graph.active_nodes(3)
+            for node in active:
                 rag_docs.append(f"[CONSCIENCE SYSTÈME] Note activée : [[{node.title}]]")
 
         if rag_docs:
@@ -0,0 +1,148 @@
+"""
+Serveur Whisper factice (API OpenAI /v1/audio/transcriptions) pour tester la
+transcription sans GPU ni modèle. L'audio de test est "parlé" en tons purs :
+chaque mot du vocabulaire (WORDS) est une bouffée sinusoïdale de fréquence propre,
+que le serveur redécode. Comme un vrai Whisper, un mot coupé par le bord de la
+fenêtre est perdu : les fenêtres chevauchantes doivent être recollées.
+
+Usage : python -m benchmarks.fake_whisper [--port 8000] [--rtf 0.1]
+        puis WHISPER_BASE_URL=http://localhost:8000/v1
+"""
+import io
+import json
+import time
+import wave
+import argparse
+import threading
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import numpy as np
+
+from benchmarks.vault_generator import WORDS
+
+WORD_SECONDS = 0.25
+GAP_SECONDS = 0.1
+BASE_HZ = 400.0
+STEP_HZ = 60.0
+FRAME_SECONDS = 0.01
+# Un mot tronqué en dessous de cette fraction de sa durée n'est pas reconnu
+MIN_WORD_FRACTION = 0.7
+
+
+def speak(words: List[str], sample_rate: int = 16000) -> np.ndarray:
+    """Audio float32 d'une suite de mots du vocabulaire (ton par mot, silence entre les mots)."""
+    t = np.arange(int(WORD_SECONDS * sample_rate)) / sample_rate
+    gap = np.zeros(int(GAP_SECONDS * sample_rate), dtype=np.float32)
+    parts = []
+    for word in words:
+        freq = BASE_HZ + STEP_HZ * WORDS.index(word)
+        parts.append((0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32))
+        parts.append(gap)
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+
+def listen(audio: np.ndarray, sample_rate: int) -> List[Tuple[str, float, float]]:
+    """Décode les mots (mot, début, fin) d'un audio produit par speak()."""
+    frame = int(FRAME_SECONDS * sample_rate)
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
+    rms = np.sqrt((audio[:n_frames * frame].reshape(n_frames, frame) ** 2).mean(axis=1))
+    voiced = np.concatenate([[False], rms > 0.05, [False]])
+    edges = np.flatnonzero(voiced[1:] != voiced[:-1])
+
+    words = []
+    for begin, end in zip(edges[::2], edges[1::2]):
+        if (end - begin) * FRAME_SECONDS < MIN_WORD_FRACTION * WORD_SECONDS:
+            continue  # Mot coupé par le bord de la fenêtre
+        burst = audio[begin * frame:end * frame]
+        spectrum = np.abs(np.fft.rfft(burst))
+        freq = np.argmax(spectrum) * sample_rate / len(burst)
+        index = int(round((freq - BASE_HZ) / STEP_HZ))
+        if 0 <= index < len(WORDS):
+            words.append((WORDS[index], begin * FRAME_SECONDS, end * FRAME_SECONDS))
+    return words
+
+
+def decode_upload(upload: bytes, filename: str, content_type: str, pcm_rate: int = 16000):
+    """WAV (module wave), PCM int16 brut (audio/pcm) ou tout format lisible par soundfile (FLAC, Ogg/Opus)."""
+    if content_type in ("audio/pcm", "audio/raw") or filename.endswith(".pcm"):
+        return np.frombuffer(upload, dtype=np.int16).astype(np.float32) / 32767, pcm_rate
+    if filename.endswith(".wav"):
+        with wave.open(io.BytesIO(upload), "rb") as wf:
+            audio = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16).astype(np.float32) / 32767
+            return audio, wf.getframerate()
+    import soundfile
+    audio, sample_rate = soundfile.read(io.BytesIO(upload), dtype="float32")
+    return audio, sample_rate
+
+
+class FakeWhisperHandler(BaseHTTPRequestHandler):
+    rtf = 0.0  # Temps de calcul simulé par seconde d'audio
+
+    def do_POST(self):
+        if not self.path.endswith("/audio/transcriptions"):
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        message = BytesParser().parsebytes(
+            b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body)
+        part = next((part for part in message.get_payload()
+                     if part.get_param("name", header="content-disposition") == "file"), None)
+        if part is None:
+            self.send_error(400, "Champ 'file' manquant")
+            return
+        try:
+            audio, sample_rate = decode_upload(part.get_payload(decode=True), part.get_filename() or "",
+                                               part.get_content_type())
+        except Exception as e:
+            self.send_error(400, f"Audio illisible : {e}")
+            return
+        time.sleep(self.rtf * len(audio) / sample_rate)
+
+        words = listen(audio, sample_rate)
+        text = " ".join(w for w, _, _ in words)
+        if text:
+            text = text[0].upper() + text[1:] + "."
+        payload = json.dumps({
+            "text": text,
+            "language": "fr",
+            "duration": len(audio) / sample_rate,
+            "segments": [{"id": i, "start": s, "end": e, "text": w} for i, (w, s, e) in enumerate(words)]
+        }).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port: int = 8000, rtf: float = 0.0, background: bool = False) -> ThreadingHTTPServer:
+    handler = type("Handler", (FakeWhisperHandler,), {"rtf": rtf})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur Whisper factice (tons purs).")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--rtf", type=float, default=0.0, help="Secondes de calcul simulées par seconde d'audio")
+    args = parser.parse_args()
+    server = serve(args.port, args.rtf)
+    print(f"[FakeWhisper] 🎧 http://127.0.0.1:{args.port}/v1/audio/transcriptions")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
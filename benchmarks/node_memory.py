@@ -0,0 +1,130 @@
+"""
+Benchmark mémoire des nœuds du graphe (octets par nœud).
+Compare l'ancienne représentation (dataclass : Path, datetime, deux set de str)
+à la représentation compacte de brain.graph.node.GraphNode, sur un Vault synthétique.
+
+Usage : python -m benchmarks.node_memory [--notes 100000] [--tags 5000]
+"""
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from core.settings import settings
+from brain.graph.node import GraphNode
+
+
+@dataclass
+class LegacyGraphNode:
+    """Réplique de l'ancien GraphNode (champs uniquement) pour la comparaison."""
+    full_path: Path
+    filename: str
+    uid: str
+    title: str
+    tags: Set[str]
+    links: Set[str]
+    base_weight: float
+    date_updated: datetime
+    aliases: Set[str] = field(default_factory=set)
+    activation: float = 0.0
+    consecutive_activations: int = 0
+    _static_score: float = 0.0
+
+
+FOLDERS = ["", "00_Inbox", "10_Zettelkasten", "20_Projets", "30_Ressources", "30_Ressources/Lectures"]
+CORE_TAGS = ([f"type/{t}" for t in ("concept", "personne", "lieu", "oeuvre", "projet")]
+             + ["état/graine", "état/sapling", "état/arbre", "archives"])
+
+
+def tag_vocabulary(n_tags: int) -> List[str]:
+    """Tags structurels + sujets libres (un vrai Vault en accumule des milliers)."""
+    return CORE_TAGS + [f"sujet/{i:05d}" for i in range(max(n_tags - len(CORE_TAGS), 1))]
+
+
+def synthetic_records(n_notes: int, n_tags: int = 5000, seed: int = 42) -> Iterator[Dict]:
+    """
+    Génère des records comparables à ceux du Scanner. Chaque chaîne est recréée
+    pour chaque note, comme lors du parsing de vrais fichiers.
+    Les sujets suivent une loi de Pareto : quelques-uns très courants, une longue traîne de rares.
+    """
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1)
+    vocabulary = tag_vocabulary(n_tags)
+    subjects = vocabulary[len(CORE_TAGS):]
+    for i in range(n_notes):
+        n_links = min(int(rng.paretovariate(1.5)) - 1, 40)
+        tags = {rng.choice(CORE_TAGS)}
+        for _ in range(rng.randint(0, 3)):
+            tags.add(subjects[min(int(rng.paretovariate(0.8)) - 1, len(subjects) - 1)])
+        yield {
+            "folder": rng.choice(FOLDERS),
+            "filename": f"Note {i:06d}.md",
+            "uid": f"{20240101000000 + i}",
+            "title": f"Note {i:06d}",
+            "tags": {"%s" % t for t in tags},
+            "links": {f"Note {rng.randrange(n_notes):06d}.md" for _ in range(n_links)},
+            "aliases": {f"Alias {i}"} if rng.random() < 0.2 else set(),
+            "base_weight": 1.0,
+            "date_updated": now - timedelta(days=rng.randrange(1000))
+        }
+
+
+def _build(node_cls, record: Dict):
+    vault = settings.OBSIDIAN_VAULT_PATH
+    folder = record["folder"]
+    return node_cls(
+        full_path=(vault / folder / record["filename"]) if folder else vault / record["filename"],
+        filename=record["filename"],
+        uid=record["uid"],
+        title=record["title"],
+        tags=record["tags"],
+        links=record["links"],
+        base_weight=record["base_weight"],
+        date_updated=record["date_updated"],
+        aliases=record["aliases"]
+    )
+
+
+def measure(node_cls, n_notes: int, n_tags: int) -> Tuple[float, float]:
+    """
+    Octets alloués (et conservés) par nœud, y compris les tables d'internement,
+    et coût d'une lecture de `.tags` (µs/nœud, comme _calculate_static_potential ou le Jardinier).
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    nodes = {r["filename"]: _build(node_cls, r) for r in synthetic_records(n_notes, n_tags)}
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    started = time.perf_counter()
+    for node in nodes.values():
+        node.tags
+    read_us = 1e6 * (time.perf_counter() - started) / n_notes
+    del nodes
+    gc.collect()
+    return retained / n_notes, read_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--tags", type=int, default=5000, help="Taille du vocabulaire de tags")
+    args = parser.parse_args()
+
+    print(f"[Bench] 🧠 Mémoire des nœuds ({args.notes} notes synthétiques, {args.tags} tags)...")
+    legacy, legacy_read = measure(LegacyGraphNode, args.notes, args.tags)
+    compact, compact_read = measure(GraphNode, args.notes, args.tags)
+    print(f"[Bench] Avant (dataclass)  : {legacy:8.0f} octets/nœud  (.tags : {legacy_read:.2f} µs)")
+    print(f"[Bench] Après (compact)    : {compact:8.0f} octets/nœud  (.tags : {compact_read:.2f} µs)")
+    print(f"[Bench] Gain               : x{legacy / compact:.2f}")
+    print("[Bench] (Hors tableaux du moteur : ~44 octets/nœud + 4 octets/lien résolu)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark des opérations du graphe (ADR-019 / ADR-022) sur des Vaults synthétiques.
+Pour chaque taille, un processus neuf génère (ou réutilise) le Vault puis mesure
+la latence (p50/p95/p99) et le pic de mémoire (RSS) de chaque opération.
+Les résultats sont écrits en JSON pour comparer les exécutions dans le temps.
+
+Usage : python -m benchmarks.run_graph [--sizes 1000 10000 100000] [--repeat 50]
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.settings import settings
+from benchmarks.vault_generator import VaultSpec, generate_vault, WORDS
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus (Mo), ou None si non mesurable."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux : Kio, macOS : octets
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def _measure(fn: Callable[[], None], repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict:
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        "n": repeat,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(np.mean(samples)), 3),
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def _utterances(titles: List[str], count: int, seed: int) -> List[str]:
+    """Énoncés synthétiques mentionnant quelques titres de notes."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        words = rng.choices(WORDS, k=rng.randint(10, 40))
+        for title in rng.sample(titles, min(3, len(titles))):
+            words.insert(rng.randrange(len(words) + 1), title.lower())
+        texts.append(" ".join(words))
+    return texts
+
+
+def bench_size(notes: int, workdir: str, repeat: int, seed: int) -> Dict:
+    """Exécuté dans un processus dédié : le pic RSS mesuré est propre à la taille."""
+    workdir = Path(workdir)
+    vault = generate_vault(workdir / f"vault_{notes}", VaultSpec(notes=notes, seed=seed))
+    # Vault, manifeste et état isolés du Cerveau réel
+    settings.OBSIDIAN_VAULT_PATH = vault
+    settings.LOGS_DIR = workdir / f"logs_{notes}"
+    settings.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    settings.SCANNER_WORKERS = 0
+
+    from brain.graph.manager import GraphStateManager
+    from brain.graph.gardener import Gardener
+
+    results = {"rss_start_mb": peak_rss_mb()}
+    graph = GraphStateManager()
+    manifest = settings.LOGS_DIR / "vault_manifest.json"
+    cold_runs = max(1, min(3, repeat))
+
+    def fresh_load():
+        nonlocal graph
+        graph = GraphStateManager()
+        graph.load_state()
+
+    results["load_state_cold"] = _measure(fresh_load, cold_runs, setup=lambda: manifest.unlink(missing_ok=True))
+    results["load_state_warm"] = _measure(fresh_load, cold_runs)
+
+    # peek() : lecture sans promotion des nœuds froids
+    titles = [graph.nodes.peek(fname).title for fname in graph.nodes]
+    texts = iter(_utterances(titles, repeat, seed) * 2)
+    results["inject_stimulus"] = _measure(lambda: graph.inject_stimulus(next(texts), ""), repeat)
+    results["propagate_activation"] = _measure(graph.propagate_activation, repeat)
+    results["decay_all"] = _measure(graph.decay_all, repeat)
+
+    snapshot = settings.LOGS_DIR / "brain_activity.json"
+    results["export_activity_snapshot"] = _measure(
+        lambda: graph.export_activity_snapshot(snapshot), repeat,
+        setup=lambda: graph.inject_stimulus(next(texts), "")
+    )
+
+    # Modification d'une note pendant la session (chemin du VaultWatcher)
+    paths = [graph.nodes.peek(fname).full_path for fname in graph.nodes]
+    rng = random.Random(seed)
+
+    originals: Dict[Path, bytes] = {}
+    touched: List[Path] = []
+
+    def touch_note():
+        path = rng.choice(paths)
+        originals.setdefault(path, path.read_bytes())
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"\n{rng.choice(WORDS)}\n")
+        touched.append(path)
+
+    results["apply_vault_changes"] = _measure(lambda: graph.apply_vault_changes([touched[-1]]), repeat,
+                                              setup=touch_note)
+    # Le Vault généré reste identique à sa spec pour les exécutions suivantes
+    for path, content in originals.items():
+        path.write_bytes(content)
+
+    # Jardinage : cycle complet (toutes les notes sales) puis cycle incrémental
+    gardener = Gardener(graph)
+    results["gardening_cycle_full"] = _measure(gardener.run_cycle, max(1, min(5, repeat)),
+                                               setup=lambda: graph.mark_dirty(graph.nodes.keys()))
+    results["gardening_cycle_incremental"] = _measure(gardener.run_cycle, repeat,
+                                                      setup=lambda: graph.mark_dirty([rng.choice(paths).name]))
+
+    results["nodes"] = len(graph.nodes)
+    results["tiers"] = graph.nodes.stats()
+    results["edges"] = int(graph.engine.indptr[-1])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des opérations du graphe.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", type=Path, default=settings.LOGS_DIR / "benchmarks")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Fichier JSON (défaut : <workdir>/graph_<horodatage>.json)")
+    args = parser.parse_args()
+
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": {}
+    }
+
+    context = multiprocessing.get_context("spawn")
+    for notes in args.sizes:
+        print(f"[Bench] ⏱️ Graphe de {notes} notes...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(bench_size, notes, str(args.workdir), args.repeat, args.seed).result()
+        report["sizes"][str(notes)] = result
+        for op, stats in result.items():
+            if isinstance(stats, dict) and "p50_ms" in stats:
+                print(f"    {op:<26} p50={stats['p50_ms']:>9.2f} ms  p95={stats['p95_ms']:>9.2f} ms"
+                      f"  p99={stats['p99_ms']:>9.2f} ms  rss={stats['peak_rss_mb'] or 0:.0f} Mo")
+
+    output = args.output or args.workdir / f"graph_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[Bench] ✅ Résultats : {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark de la transcription en continu contre le serveur Whisper factice.
+Une longue phrase synthétique (benchmarks.fake_whisper.speak) est découpée comme le
+ferait le VADSegmenter (PartialWindowPlanner), chaque fenêtre est transcrite par HTTP
+au fil de la "parole", et le TranscriptStitcher recolle les textes.
+On compare le texte final à la vérité terrain et la latence du texte complet
+(fin de parole -> transcription disponible) au mode segment entier.
+
+Usage : python -m benchmarks.stream_stt [--words 60] [--interval 5] [--window 7] [--rtf 0.1]
+"""
+import io
+import json
+import time
+import uuid
+import wave
+import random
+import argparse
+import urllib.request
+from typing import Dict, List
+
+import numpy as np
+
+from core.settings import settings
+from benchmarks.fake_whisper import serve, speak
+from benchmarks.vault_generator import WORDS
+from brain.transcript_stitcher import TranscriptStitcher
+from ears.stream_windows import PartialWindowPlanner
+
+
+def transcribe(url: str, audio: np.ndarray, sample_rate: int) -> str:
+    """POST multipart d'un WAV int16, comme InferenceClient.process_audio (sans dépendance openai)."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+    boundary = uuid.uuid4().hex
+    fields = [("model", "whisper-1"), ("language", "fr"), ("response_format", "verbose_json")]
+    body = b"".join(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        for name, value in fields)
+    body += (f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+             f'Content-Type: audio/wav\r\n\r\n').encode() + buffer.getvalue() + f"\r\n--{boundary}--\r\n".encode()
+
+    request = urllib.request.Request(f"{url}/audio/transcriptions", data=body,
+                                     headers={"Content-Type": f"multipart/form-data; boundary={boundary}"})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())["text"]
+
+
+def word_accuracy(reference: List[str], hypothesis: List[str]) -> float:
+    """1 - taux d'erreur de mots (distance d'édition)."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref in enumerate(reference, 1):
+        current = [i]
+        for j, hyp in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref != hyp)))
+        previous = current
+    return 1.0 - previous[-1] / max(1, len(reference))
+
+
+def run_stream(url: str, audio: np.ndarray, sample_rate: int, interval: float, window: float) -> Dict:
+    """Simule la parole en temps réel : les fenêtres partent dès qu'elles sont dues."""
+    planner = PartialWindowPlanner(sample_rate, interval, window)
+    planner.start(0)
+    stitcher = TranscriptStitcher(1, planner.overlap / sample_rate)
+    chunk = 512
+    started = time.perf_counter()
+    first_text = None
+
+    for pos in range(chunk, len(audio) + 1, chunk):
+        span = planner.due(pos)
+        if span is None:
+            continue
+        # Le temps "parlé" jusqu'ici s'écoule (appel bloquant : la fenêtre suivante attend)
+        time.sleep(max(0.0, pos / sample_rate - (time.perf_counter() - started)))
+        stitcher.add_window(transcribe(url, audio[span[0]:span[1]], sample_rate),
+                            (span[1] - span[0]) / sample_rate, is_final=False)
+        if first_text is None and stitcher.words:
+            first_text = time.perf_counter() - started
+
+    time.sleep(max(0.0, len(audio) / sample_rate - (time.perf_counter() - started)))
+    end_of_speech = time.perf_counter()
+    start, end = planner.final(len(audio))
+    stitcher.add_window(transcribe(url, audio[start:end], sample_rate), (end - start) / sample_rate, is_final=True)
+    return {"text": stitcher.text, "windows": stitcher.windows,
+            "final_latency_s": time.perf_counter() - end_of_speech,
+            "first_text_s": first_text}
+
+
+def run_whole(url: str, audio: np.ndarray, sample_rate: int) -> Dict:
+    """Mode segment entier : tout est transcrit après la fin de la parole."""
+    started = time.perf_counter()
+    text = transcribe(url, audio, sample_rate)
+    return {"text": text, "windows": 1, "final_latency_s": time.perf_counter() - started,
+            "first_text_s": len(audio) / sample_rate + time.perf_counter() - started}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la transcription en continu.")
+    parser.add_argument("--words", type=int, default=60, help="Nombre de mots de la phrase")
+    parser.add_argument("--interval", type=float, default=settings.STT_PARTIAL_INTERVAL_SECONDS)
+    parser.add_argument("--window", type=float, default=settings.STT_PARTIAL_WINDOW_SECONDS)
+    parser.add_argument("--rtf", type=float, default=0.1, help="Secondes de calcul Whisper par seconde d'audio")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    reference = [rng.choice(WORDS) for _ in range(args.words)]
+    sample_rate = 16000
+    audio = speak(reference, sample_rate)
+
+    server = serve(args.port, args.rtf, background=True)
+    url = f"http://127.0.0.1:{args.port}/v1"
+    try:
+        results = {"audio_seconds": len(audio) / sample_rate,
+                   "whole": run_whole(url, audio, sample_rate),
+                   "stream": run_stream(url, audio, sample_rate, args.interval, args.window)}
+    finally:
+        server.shutdown()
+
+    for mode in ("whole", "stream"):
+        r = results[mode]
+        r["word_accuracy"] = word_accuracy(reference, [w.strip(".").lower() for w in r["text"].split()])
+        first = f"{r['first_text_s']:.2f}s" if r["first_text_s"] is not None else "-"
+        print(f"[{mode:6}] {r['windows']:3d} fenêtres | précision {r['word_accuracy']:.1%} | "
+              f"premier texte {first} | texte complet {r['final_latency_s'] * 1000:.0f} ms après la parole")
+
+    out_dir = settings.LOGS_DIR / "benchmarks"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"stream_stt_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    results["reference"] = " ".join(reference)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Résultats : {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark des envois à Whisper par encodage (WAV, PCM brut, FLAC, Opus).
+Pour chaque encodage, un InferenceClient (pool partagé de connexions persistantes) transcrit
+les mêmes segments de parole synthétique ; on rapporte les octets envoyés et le temps
+d'aller-retour par seconde d'audio, ainsi que le coût d'encodage côté client.
+Sans --url, le serveur Whisper factice (benchmarks.fake_whisper) est lancé localement :
+le temps mesuré est alors celui du transport et de l'encodage, pas de la transcription.
+
+Usage : python -m benchmarks.stt_upload [--segments 50] [--seconds 8] [--url http://localhost:8000/v1]
+"""
+import json
+import time
+import random
+import argparse
+from typing import Dict, List
+
+import numpy as np
+
+from core.settings import settings
+from benchmarks.fake_whisper import serve, speak
+from benchmarks.vault_generator import WORDS
+from brain.audio_encoding import AudioEncoder
+from brain.clients import shared_clients
+
+
+def make_segments(count: int, seconds: float, seed: int) -> List[np.ndarray]:
+    """Segments de parole synthétique (tons) avec un léger bruit de fond, comme un micro."""
+    rng = random.Random(seed)
+    noise = np.random.default_rng(seed)
+    words_per_segment = max(1, int(seconds / 0.35))
+    segments = []
+    for _ in range(count):
+        audio = speak([rng.choice(WORDS) for _ in range(words_per_segment)])
+        segments.append(audio + noise.normal(0, 0.003, len(audio)).astype(np.float32))
+    return segments
+
+
+def run_encoding(encoding: str, segments: List[np.ndarray], sample_rate: int) -> Dict:
+    from brain.inference_client import InferenceClient
+
+    client = InferenceClient(encoding=encoding)
+    if client.encoder.encoding != encoding:
+        return {"encoding": encoding, "skipped": "encodage indisponible (soundfile)"}
+
+    # Coût d'encodage seul (tampons déjà alloués après le premier segment)
+    client.encoder.encode(segments[0], sample_rate)
+    started = time.perf_counter()
+    for audio in segments:
+        client.encoder.encode(audio, sample_rate)
+    encode_seconds = time.perf_counter() - started
+
+    client.process_audio(segments[0], sample_rate)  # Ouverture de la connexion
+    client.requests, client.bytes_sent, client.audio_seconds, client.round_trip_seconds = 0, 0, 0.0, 0.0
+    empty = sum(1 for audio in segments if not client.process_audio(audio, sample_rate)[0])
+    stats = client.stats()
+
+    audio_seconds = sum(len(a) for a in segments) / sample_rate
+    stats["encode_us_per_audio_second"] = round(1e6 * encode_seconds / audio_seconds, 1)
+    stats["empty_transcripts"] = empty
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des encodages d'envoi à Whisper.")
+    parser.add_argument("--segments", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=8.0, help="Durée approximative d'un segment")
+    parser.add_argument("--encodings", nargs="+", default=list(AudioEncoder.ENCODINGS))
+    parser.add_argument("--url", default=None, help="Serveur Whisper réel (défaut : serveur factice local)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sample_rate = settings.SAMPLE_RATE
+    segments = make_segments(args.segments, args.seconds, args.seed)
+
+    server = None
+    if args.url is None:
+        server = serve(args.port, background=True)
+        args.url = f"http://127.0.0.1:{args.port}/v1"
+    settings.WHISPER_BASE_URL = args.url
+
+    results = {"url": args.url, "segments": args.segments,
+               "audio_seconds": round(sum(len(a) for a in segments) / sample_rate, 1), "encodings": []}
+    try:
+        for encoding in args.encodings:
+            stats = run_encoding(encoding, segments, sample_rate)
+            results["encodings"].append(stats)
+            if "skipped" in stats:
+                print(f"[{encoding:5}] ignoré : {stats['skipped']}")
+                continue
+            print(f"[{encoding:5}] {stats['bytes_per_audio_second'] / 1000:7.1f} ko/s audio | "
+                  f"aller-retour {stats['rtt_ms_per_audio_second']:6.2f} ms/s audio | "
+                  f"encodage {stats['encode_us_per_audio_second']:7.1f} µs/s audio | "
+                  f"vides : {stats['empty_transcripts']}")
+    finally:
+        shared_clients().close()
+        if server is not None:
+            server.shutdown()
+
+    out_dir = settings.LOGS_DIR / "benchmarks"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"stt_upload_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Résultats : {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Générateur déterministe de Vault Obsidian synthétique (benchmarks du graphe).
+Même spec + même graine => mêmes fichiers, octet pour octet.
+
+Usage : python -m benchmarks.vault_generator <dossier> [--notes 10000] [--seed 42]
+"""
+import json
+import random
+import shutil
+import argparse
+from bisect import bisect_left
+from itertools import accumulate
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+from core.settings import settings
+
+WORDS = (
+    "attention mémoire concept réseau énergie structure langage pensée conscience temps "
+    "signal récit synthèse graine arbre forêt lumière matière forme valeur méthode "
+    "hypothèse modèle système émotion décision habitude écoute parole silence rythme "
+    "espace frontière origine trace lien nœud seuil cycle oubli fatigue élan tension "
+    "équilibre rupture dialogue archive projet lecture carnet atelier question réponse"
+).split()
+
+FOLDERS = ["00_Inbox", "10_Zettelkasten", "20_Projets", "30_Ressources", "30_Ressources/Lectures",
+           "40_Personnes", "50_Journal", "90_Archives"]
+SUBJECTS = ["philosophie", "science", "tech", "histoire", "art", "politique", "psychologie", "musique"]
+TYPES = ["concept", "personne", "lieu", "oeuvre", "projet", "journal"]
+STATES = ["état/graine", "état/sapling", "état/evergreen"]
+
+
+@dataclass
+class VaultSpec:
+    """Paramètres du Vault synthétique."""
+    notes: int = 1000
+    seed: int = 42
+    # Degré sortant ~ Pareto(link_alpha) - 1, borné : peu de hubs, beaucoup de feuilles
+    link_alpha: float = 1.6
+    max_links: int = 60
+    # Popularité des cibles ~ Zipf : quelques notes concentrent les liens entrants
+    target_skew: float = 1.2
+    title_words_min: int = 1
+    title_words_max: int = 8
+    alias_ratio: float = 0.2
+    # Part des notes dont le Frontmatter sort du chemin rapide (repli PyYAML)
+    exotic_ratio: float = 0.05
+    no_frontmatter_ratio: float = 0.03
+    body_paragraphs: int = 3
+
+
+def generate_vault(path: Path, spec: VaultSpec) -> Path:
+    """
+    Écrit le Vault dans `path`. Si un Vault de même spec y existe déjà
+    (fichier .vault_spec.json), il est réutilisé tel quel.
+    """
+    path = Path(path)
+    marker = path / ".vault_spec.json"
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")) == asdict(spec):
+        return path
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    rng = random.Random(spec.seed)
+    titles = _make_titles(rng, spec)
+    aliases = [f"{titles[i].split()[0]} ({i})" if rng.random() < spec.alias_ratio else None
+               for i in range(spec.notes)]
+    folders = [rng.choice(FOLDERS) for _ in range(spec.notes)]
+
+    # Tirage des cibles par rang de popularité (permutation fixe des notes)
+    popularity = list(range(spec.notes))
+    rng.shuffle(popularity)
+    weights = [1.0 / (rank + 1) ** spec.target_skew for rank in range(spec.notes)]
+    cumulative = list(accumulate(weights))
+
+    created = set()
+    for i in range(spec.notes):
+        n_links = min(int(rng.paretovariate(spec.link_alpha)) - 1, spec.max_links)
+        targets = [popularity[bisect_left(cumulative, rng.random() * cumulative[-1])] for _ in range(n_links)]
+        links = [_link_text(rng, j, titles, aliases, folders) for j in targets]
+
+        note = _render_note(rng, spec, titles[i], aliases[i], links)
+        folder = path / folders[i]
+        if folders[i] not in created:
+            folder.mkdir(parents=True, exist_ok=True)
+            created.add(folders[i])
+        with open(folder / f"{titles[i]}.md", "w", encoding="utf-8", newline="\n") as f:
+            f.write(note)
+
+    marker.write_text(json.dumps(asdict(spec)), encoding="utf-8")
+    return path
+
+
+def _make_titles(rng: random.Random, spec: VaultSpec) -> List[str]:
+    titles, seen = [], set()
+    for i in range(spec.notes):
+        words = rng.choices(WORDS, k=rng.randint(spec.title_words_min, spec.title_words_max))
+        title = " ".join(words).capitalize()
+        if title.lower() in seen:
+            title = f"{title} {i}"
+        seen.add(title.lower())
+        titles.append(title)
+    return titles
+
+
+def _link_text(rng: random.Random, j: int, titles, aliases, folders) -> str:
+    """Formes variées de [[lien]] : nom, chemin, alias, étiquette, section."""
+    roll = rng.random()
+    if roll < 0.6:
+        return titles[j]
+    if roll < 0.7:
+        return f"{folders[j]}/{titles[j]}"
+    if roll < 0.8 and aliases[j]:
+        return aliases[j]
+    if roll < 0.9:
+        return f"{titles[j]}|{rng.choice(WORDS)}"
+    return f"{titles[j]}#{rng.choice(WORDS).capitalize()}"
+
+
+def _render_note(rng: random.Random, spec: VaultSpec, title: str, alias, links: List[str]) -> str:
+    parts = []
+    if rng.random() >= spec.no_frontmatter_ratio:
+        parts.append(_render_frontmatter(rng, spec, title, alias))
+
+    paragraphs = [" ".join(rng.choices(WORDS, k=rng.randint(20, 60))) for _ in range(spec.body_paragraphs)]
+    # Les liens sont répartis dans le corps du texte
+    for link in links:
+        k = rng.randrange(len(paragraphs))
+        paragraphs[k] += f" [[{link}]]"
+    parts.append(f"# {title}\n\n" + "\n\n".join(paragraphs) + "\n")
+    return "".join(parts)
+
+
+def _render_frontmatter(rng: random.Random, spec: VaultSpec, title: str, alias) -> str:
+    updated = datetime(2025, 1, 1) - timedelta(days=rng.randrange(1500))
+    tags = [f"sujet/{rng.choice(SUBJECTS)}", f"type/{rng.choice(TYPES)}", rng.choice(STATES)]
+    if rng.random() < 0.05:
+        tags.append("archives")
+
+    lines = ["---", f"uid: {updated.strftime(settings.UID_FORMAT)}"]
+    if rng.random() < 0.3:
+        lines.append(f'title: "{title}"')
+    if alias:
+        lines.append(f"aliases: [{alias}]" if rng.random() < 0.5 else f"aliases:\n  - {alias}")
+    else:
+        lines.append("aliases: []")
+    if rng.random() < 0.5:
+        lines.append("tags:\n" + "\n".join(f"  - {t}" for t in tags))
+    else:
+        lines.append(f"tags: [{', '.join(tags)}]")
+    if rng.random() < 0.3:
+        lines.append(f"poids: {rng.choice([0.5, 1.0, 1.5, 2, 3])}")
+    lines.append("source:\n  - IA")
+    lines.append(f"date_created: {updated.strftime(settings.DATE_FORMAT)}")
+    if rng.random() < 0.5:
+        lines.append(f"date_updated: {updated.strftime(settings.DATE_FORMAT)}")
+    else:
+        lines.append(f"date_updated: '{updated.strftime(settings.DATE_FORMAT)}'")
+    if rng.random() < spec.exotic_ratio:
+        # Bloc littéral YAML : hors du sous-ensemble du chemin rapide
+        lines.append("résumé: |\n  " + " ".join(rng.choices(WORDS, k=12)))
+        lines.append(f"ref: &ancre {rng.choice(WORDS)}")
+    lines.append("---\n")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère un Vault Obsidian synthétique.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--notes", type=int, default=VaultSpec.notes)
+    parser.add_argument("--seed", type=int, default=VaultSpec.seed)
+    args = parser.parse_args()
+
+    generate_vault(args.path, VaultSpec(notes=args.notes, seed=args.seed))
+    print(f"[Bench] 📝 Vault synthétique prêt : {args.path} ({args.notes} notes)")
+
+
+if __name__ == "__main__":
+    main()
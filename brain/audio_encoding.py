@@ -0,0 +1,78 @@
+import io
+import struct
+import threading
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+
+class AudioEncoder:
+    """
+    Encodage d'un segment float32 pour l'envoi à Whisper.
+      - "pcm"  : int16 brut (audio/pcm), aucun en-tête, si le serveur l'accepte
+      - "wav"  : PCM 16 bits, en-tête écrit directement (44 octets)
+      - "flac" : sans perte, environ 2x plus petit que le WAV (soundfile)
+      - "opus" : Ogg/Opus avec perte, environ 10x plus petit (soundfile, libsndfile >= 1.0.29)
+    La conversion float32 -> int16 se fait dans des tampons réutilisés (un jeu par thread :
+    l'ingestion transcrit en parallèle), agrandis seulement si un segment est plus long.
+    Sans soundfile, "flac" et "opus" se replient sur "wav".
+    """
+
+    ENCODINGS = ("wav", "pcm", "flac", "opus")
+    CONTENT_TYPES = {"wav": "audio/wav", "pcm": "audio/pcm", "flac": "audio/flac", "opus": "audio/ogg"}
+    EXTENSIONS = {"wav": "wav", "pcm": "pcm", "flac": "flac", "opus": "ogg"}
+    WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+    def __init__(self, encoding: str = "wav"):
+        encoding = encoding.lower()
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Encodage inconnu : {encoding} (attendu : {', '.join(self.ENCODINGS)})")
+        if encoding in ("flac", "opus") and soundfile is None:
+            print(f"[Inference] ⚠️ soundfile absent : encodage {encoding} remplacé par wav.")
+            encoding = "wav"
+        self.encoding = encoding
+        self._local = threading.local()
+
+    def encode(self, audio: np.ndarray, sample_rate: int) -> Tuple[str, bytes, str]:
+        """Retourne (nom de fichier, contenu, type MIME) prêts pour le formulaire multipart."""
+        pcm = self._to_int16(audio)
+        if self.encoding == "pcm":
+            content = pcm.tobytes()
+        elif self.encoding == "wav":
+            content = b"".join((self._wav_header(len(pcm), sample_rate), pcm))
+        else:
+            out = io.BytesIO()
+            if self.encoding == "flac":
+                soundfile.write(out, pcm, sample_rate, format="FLAC", subtype="PCM_16")
+            else:
+                soundfile.write(out, pcm, sample_rate, format="OGG", subtype="OPUS")
+            content = out.getvalue()
+        return f"audio.{self.EXTENSIONS[self.encoding]}", content, self.CONTENT_TYPES[self.encoding]
+
+    def _to_int16(self, audio: np.ndarray) -> np.ndarray:
+        """Vue int16 sur le tampon du thread (valide jusqu'au prochain appel de ce thread)."""
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        n = len(audio)
+        local = self._local
+        current = getattr(local, "scratch", None)
+        if current is None or len(current) < n:
+            size = n if current is None else max(n, 2 * len(current))
+            local.scratch = np.empty(size, dtype=np.float32)
+            local.pcm = np.empty(size, dtype=np.int16)
+        scratch, pcm = local.scratch[:n], local.pcm[:n]
+        # Écrêtage puis mise à l'échelle sur place, conversion sans allocation
+        np.clip(audio, -1.0, 1.0, out=scratch)
+        np.multiply(scratch, 32767, out=scratch)
+        np.copyto(pcm, scratch, casting="unsafe")
+        return pcm
+
+    @classmethod
+    def _wav_header(cls, n_samples: int, sample_rate: int) -> bytes:
+        data_size = 2 * n_samples
+        return cls.WAV_HEADER.pack(b"RIFF", 36 + data_size, b"WAVE", b"fmt ", 16, 1, 1,
+                                   sample_rate, 2 * sample_rate, 2, 16, b"data", data_size)
@@ -0,0 +1,132 @@
+import time
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import OpenAI
+
+from core.settings import settings
+
+
+class EndpointStats:
+    """Compteurs d'un point d'accès (mis à jour par le transport, depuis tous les threads)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end(self, seconds: float, failed: bool):
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.errors += int(failed)
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "requests": self.requests,
+                "errors": self.errors,
+                "latency_ms_avg": round(1000 * self.total_seconds / self.requests, 1) if self.requests else 0.0,
+                "latency_ms_max": round(1000 * self.max_seconds, 1)
+            }
+
+
+class _MeteredTransport(httpx.HTTPTransport):
+    """Transport httpx qui compte les requêtes en cours, la latence (jusqu'aux en-têtes) et les erreurs."""
+
+    def __init__(self, stats: EndpointStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.begin()
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = super().handle_request(request)
+            failed = response.status_code >= 500 or response.status_code == 429
+            return response
+        finally:
+            self.stats.end(time.perf_counter() - started, failed)
+
+
+class ClientRegistry:
+    """
+    Registre des clients OpenAI du Cerveau : un seul client par point d'accès (base_url), partagé
+    par tous les composants (Whisper, Routeur, embeddings, LLM, Synthèse, intention [READ]).
+    Chaque client repose sur un pool httpx à connexions persistantes (HTTP_MAX_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS) : plus de poignée de main TCP par composant ni par question.
+    Les nouvelles tentatives suivent la politique du SDK (LLM_MAX_RETRIES : 429, 5xx, délais) ;
+    le transport retente aussi l'ouverture de connexion (HTTP_CONNECT_RETRIES).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clients: Dict[str, Tuple[OpenAI, httpx.Client]] = {}
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def openai(self, base_url: str, api_key: str = "ollama", max_connections: Optional[int] = None,
+               timeout: Optional[float] = None, keepalive_expiry: Optional[float] = None) -> OpenAI:
+        """Client partagé du point d'accès (créé au premier appel ; les réglages suivants sont ignorés)."""
+        key = base_url.rstrip("/")
+        with self._lock:
+            entry = self.clients.get(key)
+            if entry is None:
+                connections = max_connections or settings.HTTP_MAX_CONNECTIONS
+                stats = self.endpoints.setdefault(key, EndpointStats())
+                http_client = httpx.Client(
+                    transport=_MeteredTransport(
+                        stats,
+                        limits=httpx.Limits(
+                            max_connections=connections,
+                            max_keepalive_connections=connections,
+                            keepalive_expiry=keepalive_expiry or settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+                        ),
+                        retries=settings.HTTP_CONNECT_RETRIES
+                    ),
+                    timeout=httpx.Timeout(timeout or settings.LLM_TIMEOUT_SECONDS,
+                                          connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS)
+                )
+                client = OpenAI(base_url=base_url, api_key=api_key, http_client=http_client,
+                                max_retries=settings.LLM_MAX_RETRIES)
+                entry = self.clients[key] = (client, http_client)
+            return entry[0]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Compteurs par point d'accès (base_url)."""
+        with self._lock:
+            endpoints = dict(self.endpoints)
+        return {url: stats.snapshot() for url, stats in endpoints.items()}
+
+    def close(self):
+        with self._lock:
+            for _, http_client in self.clients.values():
+                http_client.close()
+            self.clients.clear()
+
+
+_shared: Optional[ClientRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def shared_clients() -> ClientRegistry:
+    """Registre unique du processus."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ClientRegistry()
+        return _shared
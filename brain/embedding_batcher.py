@@ -0,0 +1,129 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeout
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from openai import OpenAI
+
+from core.settings import settings
+from brain.clients import shared_clients
+
+
+class EmbeddingBatcher:
+    """
+    Regroupement des demandes d'embeddings en micro-lots.
+    Les appelants (étages du pipeline, Synthèse, Librarian) déposent leurs textes ; un thread
+    attend au plus EMBEDDING_BATCH_WINDOW_MS après la première demande, fusionne les textes
+    (doublons compris) et envoie une seule requête `embeddings.create(input=[...])` par tranche
+    de EMBEDDING_MAX_BATCH textes. Chaque appelant reçoit sa matrice (n, d) dans son ordre.
+    """
+
+    def __init__(self, client: OpenAI, model: str, window_ms: float, max_batch: int, timeout: float = 30.0):
+        self.client = client
+        self.model = model
+        self.window = window_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self.timeout = timeout
+        self.requests: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+        # Statistiques
+        self.calls = 0
+        self.batches = 0
+        self.texts_sent = 0
+        self.failures = 0
+        self.fallbacks = 0
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Matrice (len(texts), d) des embeddings ; lève l'erreur du service en cas d'échec."""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        texts = list(texts)
+        future: Future = Future()
+        self.requests.put((texts, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except FuturesTimeout:
+            # Regroupeur bloqué : appel direct plutôt qu'une attente sans fin
+            print(f"[Embeddings] ⚠️ Micro-lot sans réponse après {self.timeout:g} s, appel direct.")
+            self.fallbacks += 1
+            return self._embed_now(texts)
+
+    def stats(self) -> Dict[str, float]:
+        return {"calls": self.calls, "batches": self.batches, "texts_sent": self.texts_sent,
+                "failures": self.failures, "fallbacks": self.fallbacks,
+                "avg_batch": round(self.texts_sent / self.batches, 1) if self.batches else 0.0}
+
+    def _loop(self):
+        while True:
+            pending = [self.requests.get()]
+            size = len(pending[0][0])
+            deadline = time.perf_counter() + self.window
+            # Fenêtre de regroupement : les demandes simultanées partent ensemble
+            while size < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                size += len(request[0])
+            try:
+                self._send(pending)
+            except Exception as e:  # Le thread survit à tout lot en échec
+                print(f"[Embeddings] ❌ Micro-lot : {e}")
+
+    def _send(self, pending: List[Tuple[List[str], Future]]):
+        self.calls += len(pending)
+        try:
+            vectors = self._request(list(dict.fromkeys(text for texts, _ in pending for text in texts)))
+            # Réponse incomplète ou mal indexée : KeyError / ValueError remontent à tous les appelants
+            results = [np.stack([vectors[text] for text in texts]) for texts, _ in pending]
+        except Exception as e:
+            self.failures += 1
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _embed_now(self, texts: List[str]) -> np.ndarray:
+        vectors = self._request(list(dict.fromkeys(texts)))
+        return np.stack([vectors[text] for text in texts])
+
+    def _request(self, unique: List[str]) -> Dict[str, np.ndarray]:
+        vectors: Dict[str, np.ndarray] = {}
+        for start in range(0, len(unique), self.max_batch):
+            chunk = unique[start:start + self.max_batch]
+            response = self.client.embeddings.create(model=self.model, input=chunk)
+            for item in response.data:
+                vectors[chunk[item.index]] = np.asarray(item.embedding, dtype=np.float32)
+            self.batches += 1
+            self.texts_sent += len(chunk)
+        return vectors
+
+
+_shared: Optional[EmbeddingBatcher] = None
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_batcher() -> EmbeddingBatcher:
+    """Regroupeur unique du processus (service d'embedding du routeur)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = EmbeddingBatcher(
+                shared_clients().openai(settings.ROUTER_BASE_URL),
+                settings.EMBEDDING_MODEL_NAME,
+                window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+                max_batch=settings.EMBEDDING_MAX_BATCH,
+                timeout=settings.EMBEDDING_BATCH_TIMEOUT_SECONDS
+            )
+        return _shared
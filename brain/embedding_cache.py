@@ -0,0 +1,163 @@
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.settings import settings
+
+
+class EmbeddingCache:
+    """
+    Cache des embeddings à deux niveaux, partagé par tous les IntentRouter du processus :
+      - LRU en mémoire (EMBEDDING_CACHE_SIZE entrées)
+      - SQLite dans LOGS_DIR (survit aux redémarrages), vecteurs float32 en BLOB
+    Clé : SHA-1 de (modèle, texte normalisé : Unicode NFC, espaces fusionnés). La casse et
+    la ponctuation sont conservées : elles changent l'embedding.
+    Utilisable depuis plusieurs threads (pipeline du Cerveau).
+    """
+
+    _SPACES = re.compile(r"\s+")
+
+    def __init__(self, path: Path, capacity: int):
+        self.capacity = capacity
+        self.memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistiques
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        self.db = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(str(path), check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, model TEXT NOT NULL, vector BLOB NOT NULL, created REAL NOT NULL)"
+            )
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"[Embeddings] ⚠️ Cache disque indisponible ({path}) : {e}")
+            self.db = None
+
+    @classmethod
+    def key(cls, model: str, text: str) -> bytes:
+        normalized = cls._SPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+        return hashlib.sha1(f"{model}\x00{normalized}".encode("utf-8")).digest()
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        return self.get_many(model, [text]).get(text)
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Embeddings connus parmi `texts` (mémoire puis disque, en une requête) ; les autres sont absents."""
+        found: Dict[str, np.ndarray] = {}
+        missing: Dict[bytes, List[str]] = {}
+        with self._lock:
+            for text in texts:
+                if text in found:
+                    continue
+                k = self.key(model, text)
+                vector = self.memory.get(k)
+                if vector is not None:
+                    self.memory.move_to_end(k)
+                    self.memory_hits += 1
+                    found[text] = vector
+                else:
+                    missing.setdefault(k, []).append(text)
+
+            if missing and self.db is not None:
+                keys = list(missing)
+                for start in range(0, len(keys), 500):  # Limite de paramètres SQLite
+                    chunk = keys[start:start + 500]
+                    try:
+                        rows = self.db.execute(
+                            f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                            chunk
+                        ).fetchall()
+                    except sqlite3.Error as e:
+                        print(f"[Embeddings] ⚠️ Lecture du cache disque : {e}")
+                        rows = []
+                    for k, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(k, vector)
+                        self.disk_hits += 1
+                        for text in missing.pop(k):
+                            found[text] = vector
+
+            self.misses += len(missing)
+        return found
+
+    def put(self, model: str, text: str, vector) -> np.ndarray:
+        return self.put_many(model, {text: vector})[text]
+
+    def put_many(self, model: str, vectors: Dict[str, object]) -> Dict[str, np.ndarray]:
+        """Enregistre des embeddings (mémoire + disque, une transaction) ; retourne les vecteurs float32."""
+        stored = {}
+        rows = []
+        now = time.time()
+        with self._lock:
+            for text, vector in vectors.items():
+                vector = np.array(vector, dtype=np.float32)
+                vector.setflags(write=False)  # Partagé entre appelants : lecture seule
+                k = self.key(model, text)
+                self._remember(k, vector)
+                rows.append((k, model, vector.tobytes(), now))
+                stored[text] = vector
+            self.stores += len(rows)
+            if rows and self.db is not None:
+                try:
+                    self.db.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+                    self.db.commit()
+                except sqlite3.Error as e:
+                    print(f"[Embeddings] ⚠️ Écriture du cache disque : {e}")
+        return stored
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "stores": self.stores
+        }
+
+    def close(self):
+        with self._lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+    def _remember(self, k: bytes, vector: np.ndarray):
+        self.memory[k] = vector
+        self.memory.move_to_end(k)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+
+_shared: Optional[EmbeddingCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_cache() -> Optional[EmbeddingCache]:
+    """Cache unique du processus (None si EMBEDDING_CACHE_ENABLED est faux)."""
+    global _shared
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    with _shared_lock:
+        if _shared is None:
+            _shared = EmbeddingCache(settings.LOGS_DIR / settings.EMBEDDING_CACHE_FILE,
+                                     settings.EMBEDDING_CACHE_SIZE)
+        return _shared
@@ -0,0 +1,162 @@
+import os
+import json
+import zlib
+import struct
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from brain.graph.engine import ActivationEngine
+
+# État volatile d'un nœud : (activation, fatigue, tick de la dernière mise à jour)
+NodeState = Tuple[float, int, int]
+
+
+class StateCheckpoint:
+    """
+    Persistance de l'état volatile (ADR-019 End) en deux fichiers :
+      - brain_state.npz : instantané des nœuds non éteints (noms + tableaux NumPy)
+      - brain_state.log : journal binaire en ajout seul des nœuds modifiés depuis,
+        une trame par sauvegarde (en-tête + CRC32 : une trame tronquée par un crash est ignorée)
+    Grâce à l'oubli paresseux, (activation, fatigue, tick) suffit à reconstituer
+    l'état exact : une sauvegarde ne coûte que O(nœuds modifiés).
+    Le journal porte le numéro de génération de l'instantané qu'il complète ;
+    la compaction écrit un nouvel instantané (génération + 1) puis repart d'un journal vide.
+    """
+
+    LOG_MAGIC = b"OCLG"
+    LOG_HEADER = struct.Struct("<4sI")     # magic, génération
+    FRAME_HEADER = struct.Struct("<IIqI")  # nb enregistrements, taille, tick, crc32
+    RECORD = struct.Struct("<dIqH")        # activation, fatigue, tick, longueur du nom
+    # Compaction quand le journal dépasse ce nombre d'enregistrements
+    COMPACT_RECORDS = 50_000
+
+    def __init__(self, directory: Path):
+        self.checkpoint_file = Path(directory) / "brain_state.npz"
+        self.log_file = Path(directory) / "brain_state.log"
+        self.legacy_file = Path(directory) / "brain_state.json"
+        self.generation = 0
+        self.log_records = 0
+
+    # --- Lecture ---
+    def load(self) -> Tuple[Dict[str, NodeState], Optional[int]]:
+        """
+        Retourne l'état par fichier et le tick de la dernière sauvegarde
+        (None pour un état hérité du JSON, sans tick).
+        """
+        if not self.checkpoint_file.exists():
+            return self._load_legacy(), None
+
+        states: Dict[str, NodeState] = {}
+        saved_tick = None
+        try:
+            with np.load(self.checkpoint_file, allow_pickle=False) as data:
+                self.generation = int(data["generation"])
+                saved_tick = int(data["tick"])
+                for name, a, f, s in zip(data["filenames"].tolist(), data["activation"].tolist(),
+                                         data["fatigue"].tolist(), data["stamp"].tolist()):
+                    states[name] = (a, f, s)
+        except Exception as e:
+            print(f"[Graph] ⚠️ Instantané illisible, état volatile ignoré : {e}")
+            return {}, None
+
+        self.log_records = 0
+        for tick, records in self._read_log():
+            for name, state in records:
+                states[name] = state
+            self.log_records += len(records)
+            saved_tick = tick
+        return states, saved_tick
+
+    def _load_legacy(self) -> Dict[str, NodeState]:
+        """Ancien format (brain_state.json) : activations sans tick."""
+        if not self.legacy_file.exists():
+            return {}
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {fname: (float(d.get("activation", 0.0)), int(d.get("consecutive_activations", 0)), 0)
+                    for fname, d in data.items()}
+        except Exception:
+            return {}
+
+    def _read_log(self) -> Iterator[Tuple[int, List[Tuple[str, NodeState]]]]:
+        if not self.log_file.exists():
+            return
+        with open(self.log_file, "rb") as f:
+            blob = f.read()
+        if len(blob) < self.LOG_HEADER.size:
+            return
+        magic, generation = self.LOG_HEADER.unpack_from(blob, 0)
+        if magic != self.LOG_MAGIC or generation != self.generation:
+            return  # Journal d'une génération déjà intégrée à l'instantané
+
+        offset = self.LOG_HEADER.size
+        while offset + self.FRAME_HEADER.size <= len(blob):
+            count, size, tick, crc = self.FRAME_HEADER.unpack_from(blob, offset)
+            payload = blob[offset + self.FRAME_HEADER.size:offset + self.FRAME_HEADER.size + size]
+            if len(payload) < size or zlib.crc32(payload) != crc:
+                break  # Trame incomplète (arrêt brutal pendant l'écriture)
+            offset += self.FRAME_HEADER.size + size
+
+            records, pos = [], 0
+            for _ in range(count):
+                a, fat, stamp, length = self.RECORD.unpack_from(payload, pos)
+                pos += self.RECORD.size
+                name = payload[pos:pos + length].decode("utf-8")
+                pos += length
+                records.append((name, (a, fat, stamp)))
+            yield tick, records
+
+    # --- Écriture ---
+    def append(self, engine: ActivationEngine, ids: np.ndarray):
+        """Ajoute au journal l'état courant des nœuds `ids` (une trame)."""
+        if len(ids) == 0:
+            return
+        if self.log_records + len(ids) > self.COMPACT_RECORDS or not self.checkpoint_file.exists():
+            self.write_checkpoint(engine)
+            return
+
+        payload = bytearray()
+        for i, a, f, s in zip(ids.tolist(), engine.activation[ids].tolist(),
+                              engine.fatigue[ids].tolist(), engine.stamp[ids].tolist()):
+            name = engine.filenames[i].encode("utf-8")
+            payload += self.RECORD.pack(a, f, s, len(name))
+            payload += name
+
+        frame = self.FRAME_HEADER.pack(len(ids), len(payload), engine.current_tick(), zlib.crc32(payload))
+        new_log = not self.log_file.exists()
+        with open(self.log_file, "ab") as f:
+            if new_log:
+                f.write(self.LOG_HEADER.pack(self.LOG_MAGIC, self.generation))
+            f.write(frame + payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self.log_records += len(ids)
+
+    def write_checkpoint(self, engine: ActivationEngine):
+        """Instantané complet des nœuds non éteints, puis journal vide (compaction)."""
+        engine.sync()
+        ids = np.flatnonzero((engine.activation > 0) | (engine.fatigue > 0))
+        names = [engine.filenames[i] for i in ids.tolist()]
+        generation = self.generation + 1
+
+        tmp_path = self.checkpoint_file.with_name("brain_state.tmp.npz")
+        np.savez(
+            tmp_path,
+            generation=np.int64(generation),
+            tick=np.int64(engine.current_tick()),
+            filenames=np.array(names, dtype=str) if names else np.zeros(0, dtype="<U1"),
+            activation=engine.activation[ids],
+            fatigue=engine.fatigue[ids],
+            stamp=engine.stamp[ids]
+        )
+        os.replace(tmp_path, self.checkpoint_file)
+        # Le journal de l'ancienne génération est désormais sans effet : on le remplace
+        tmp_log = self.log_file.with_suffix(".log.tmp")
+        with open(tmp_log, "wb") as f:
+            f.write(self.LOG_HEADER.pack(self.LOG_MAGIC, generation))
+        os.replace(tmp_log, self.log_file)
+
+        self.generation = generation
+        self.log_records = 0
@@ -0,0 +1,313 @@
+import time
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.settings import settings
+from brain.graph.node import GraphNode
+
+
+class ActivationEngine:
+    """
+    Moteur vectoriel de la dynamique d'attention (ADR-022).
+    L'état volatile (Activation, Fatigue, Poids Statique) est stocké dans des
+    tableaux NumPy indexés par l'ID entier du nœud, et les liens sont compilés
+    en matrice d'adjacence CSR (source -> cible).
+    Les GraphNode restent disponibles comme simples vues sur ces tableaux.
+
+    Oubli paresseux : l'activation et la fatigue sont stockées avec le "tick"
+    (période de DECAY_INTERVAL_SECONDS) de leur dernière mise à jour. La valeur
+    courante est calculée à la lecture sous forme close :
+        A(t) = A0 * DECAY_RATE^k (éteinte sous 0.1),  F(t) = max(0, F0 - k)
+    ce qui reproduit les passes discrètes GraphNode.decay()/rest() sans
+    jamais parcourir les nœuds au repos.
+    """
+
+    ACTIVATION_FLOOR = 0.1
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.filenames: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        # Horloge injectable (tests / rejeu)
+        self.clock = clock
+        self.decay_rate = settings.DECAY_RATE
+        self.decay_period = settings.DECAY_INTERVAL_SECONDS
+
+        # État par nœud
+        self.activation = np.zeros(0, dtype=np.float64)
+        self.fatigue = np.zeros(0, dtype=np.int32)
+        self.stamp = np.zeros(0, dtype=np.int64)  # Tick de la dernière matérialisation
+        self.static_score = np.zeros(0, dtype=np.float64)
+        # Nombre de liens bruts (y compris non résolus) : diviseur de la propagation
+        self.out_degree = np.zeros(0, dtype=np.float64)
+
+        # Adjacence CSR
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self._edge_src = np.zeros(0, dtype=np.int32)
+        # Adjacence inverse (CSC : cible -> sources), recalculée à la demande
+        self._reverse: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # Nœuds "dynamiques" (activation ou fatigue non nulle) : les seuls dont
+        # le poids diffère du poids statique et qui subissent l'oubli.
+        self.active: Set[int] = set()
+        # Incrémenté à chaque modification d'un poids statique
+        self.static_version = 0
+        # Incrémenté à chaque modification de l'adjacence (nœuds ou liens)
+        self.structure_version = 0
+        # Nœuds modifiés depuis la dernière sauvegarde (journal des deltas)
+        self.changed: Set[int] = set()
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def compile(self, nodes: Dict[str, GraphNode], links: Dict[str, Iterable[str]]):
+        """
+        (Re)construit les tableaux à partir des nœuds puis les rattache au moteur.
+        `links` donne, pour chaque fichier, ses cibles déjà résolues (LinkIndex.targets).
+        L'état courant des nœuds (déjà rattachés ou non) est conservé.
+        """
+        filenames = list(nodes.keys())
+        n = len(filenames)
+        index = {fname: i for i, fname in enumerate(filenames)}
+
+        activation = np.zeros(n, dtype=np.float64)
+        fatigue = np.zeros(n, dtype=np.int32)
+        static_score = np.zeros(n, dtype=np.float64)
+        out_degree = np.zeros(n, dtype=np.float64)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        targets: List[int] = []
+
+        for i, fname in enumerate(filenames):
+            node = nodes[fname]
+            activation[i] = node.activation
+            fatigue[i] = node.consecutive_activations
+            static_score[i] = node._static_score
+            out_degree[i] = node.link_count
+            targets.extend(index[t] for t in links.get(fname, ()) if t in index)
+            indptr[i + 1] = len(targets)
+
+        self.filenames = filenames
+        self.index = index
+        self.activation = activation
+        self.fatigue = fatigue
+        self.stamp = np.full(n, self.current_tick(), dtype=np.int64)
+        self.static_score = static_score
+        self.out_degree = out_degree
+        self.indptr = indptr
+        self.indices = np.asarray(targets, dtype=np.int32)
+        self._edge_src = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+        self._reset_tracking()
+
+        for i, fname in enumerate(filenames):
+            nodes[fname].bind(self, i)
+
+    def _reset_tracking(self):
+        self._reverse = None
+        self.structure_version += 1
+        self.active = set(np.flatnonzero((self.activation > 0) | (self.fatigue > 0)).tolist())
+        self.static_version += 1
+
+    def touch(self, i: int):
+        """Signale une modification de l'activation ou de la fatigue du nœud `i`."""
+        self.active.add(i)
+        self.changed.add(i)
+
+    def pop_changed(self) -> np.ndarray:
+        """IDs modifiés depuis le dernier appel (triés)."""
+        changed, self.changed = self.changed, set()
+        return np.array(sorted(changed), dtype=np.int64)
+
+    # --- Oubli paresseux (forme close) ---
+    def current_tick(self) -> int:
+        return int(self.clock() // self.decay_period)
+
+    def sync(self, ids: Optional[np.ndarray] = None, tick: Optional[int] = None):
+        """Matérialise l'oubli accumulé depuis le dernier tick (nœuds actifs, ou `ids`)."""
+        if ids is None:
+            ids = self.active_ids()
+        if len(ids) == 0:
+            return
+        tick = self.current_tick() if tick is None else tick
+
+        elapsed = np.maximum(tick - self.stamp[ids], 0)
+        stale = elapsed > 0
+        if not stale.any():
+            return
+        ids, elapsed = ids[stale], elapsed[stale]
+
+        decayed = self.activation[ids] * np.power(self.decay_rate, elapsed)
+        decayed[decayed < self.ACTIVATION_FLOOR] = 0.0
+        self.activation[ids] = decayed
+        self.fatigue[ids] = np.maximum(self.fatigue[ids] - elapsed, 0)
+        self.stamp[ids] = tick
+
+    def sync_one(self, i: int):
+        """Version scalaire de sync() (lecture/écriture via un GraphNode)."""
+        tick = self.current_tick()
+        elapsed = tick - self.stamp[i]
+        if elapsed > 0:
+            if self.activation[i] or self.fatigue[i]:
+                value = self.activation[i] * self.decay_rate ** elapsed
+                self.activation[i] = value if value >= self.ACTIVATION_FLOOR else 0.0
+                self.fatigue[i] = max(int(self.fatigue[i]) - int(elapsed), 0)
+            self.stamp[i] = tick
+
+    def active_ids(self) -> np.ndarray:
+        return np.fromiter(self.active, dtype=np.int64, count=len(self.active))
+
+    def settle(self):
+        """Matérialise l'oubli des nœuds actifs et retire ceux revenus au repos. Coût O(actifs)."""
+        self.sync()
+        self.active = {i for i in self.active if self.activation[i] > 0 or self.fatigue[i] > 0}
+
+    # --- Mises à jour incrémentales (Vault vivant) ---
+    def add_nodes(self, new_nodes: List[GraphNode]):
+        """Ajoute des nœuds en fin de tableaux (sans liens : voir set_links)."""
+        if not new_nodes:
+            return
+        start = len(self.filenames)
+        for offset, node in enumerate(new_nodes):
+            self.index[node.filename] = start + offset
+            self.filenames.append(node.filename)
+
+        self.activation = np.concatenate([self.activation, [n.activation for n in new_nodes]])
+        self.fatigue = np.concatenate([self.fatigue, np.array([n.consecutive_activations for n in new_nodes],
+                                                              dtype=np.int32)])
+        self.stamp = np.concatenate([self.stamp, np.full(len(new_nodes), self.current_tick(), dtype=np.int64)])
+        self.static_score = np.concatenate([self.static_score, [n._static_score for n in new_nodes]])
+        self.out_degree = np.concatenate([self.out_degree, [float(n.link_count) for n in new_nodes]])
+        self.indptr = np.concatenate([self.indptr, np.full(len(new_nodes), self.indptr[-1], dtype=np.int64)])
+        self._reverse = None
+        self.structure_version += 1
+
+        for offset, node in enumerate(new_nodes):
+            node.bind(self, start + offset)
+            if node.activation > 0 or node.consecutive_activations > 0:
+                self.active.add(start + offset)
+                self.changed.add(start + offset)
+        self.static_version += 1
+
+    def set_links(self, i: int, targets: List[int], out_degree: int):
+        """Remplace la ligne `i` de la matrice CSR (liens sortants d'un nœud)."""
+        begin, end = self.indptr[i], self.indptr[i + 1]
+        row = np.asarray(targets, dtype=np.int32)
+        self.indices = np.concatenate([self.indices[:begin], row, self.indices[end:]])
+        self.indptr[i + 1:] += len(row) - (end - begin)
+        self.out_degree[i] = out_degree
+        self._edge_src = np.repeat(np.arange(len(self.filenames), dtype=np.int32), np.diff(self.indptr))
+        self._reverse = None
+        self.structure_version += 1
+
+    def remove_nodes(self, filenames: List[str], nodes: Dict[str, GraphNode]):
+        """
+        Supprime des nœuds et compacte les tableaux (les arêtes entrantes disparaissent).
+        `nodes` : nœuds matérialisés (niveau chaud). Les nœuds supprimés sont détachés,
+        les survivants re-rattachés à leurs nouveaux IDs.
+        """
+        doomed = [self.index[f] for f in filenames if f in self.index]
+        if not doomed:
+            return
+        for f in filenames:
+            if f in nodes:
+                nodes[f].unbind()
+
+        keep = np.ones(len(self.filenames), dtype=bool)
+        keep[doomed] = False
+        new_ids = np.cumsum(keep) - 1
+
+        edge_keep = keep[self._edge_src] & keep[self.indices]
+        src = new_ids[self._edge_src[edge_keep]]
+        n = int(keep.sum())
+
+        self.filenames = [f for f, k in zip(self.filenames, keep) if k]
+        self.index = {f: i for i, f in enumerate(self.filenames)}
+        self.activation = self.activation[keep]
+        self.fatigue = self.fatigue[keep]
+        self.stamp = self.stamp[keep]
+        self.static_score = self.static_score[keep]
+        self.out_degree = self.out_degree[keep]
+        self.indices = new_ids[self.indices[edge_keep]].astype(np.int32)
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=n))]).astype(np.int64)
+        self._edge_src = src.astype(np.int32)
+        self._reset_tracking()
+        self.changed = {int(new_ids[i]) for i in self.changed if keep[i]}
+
+        for fname, node in nodes.items():
+            if fname in self.index:
+                node.bind(self, self.index[fname])
+
+    # --- Liens entrants ---
+    def reverse(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Adjacence inverse (in_indptr, in_sources) : sources de la cible j = in_sources[in_indptr[j]:in_indptr[j+1]]."""
+        if self._reverse is None:
+            n = len(self.filenames)
+            order = np.argsort(self.indices, kind="stable")
+            in_indptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices, minlength=n))]).astype(np.int64)
+            self._reverse = (in_indptr, self._edge_src[order])
+        return self._reverse
+
+    def in_degree(self, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Nombre de liens entrants résolus (tous les nœuds ou `ids`)."""
+        in_indptr, _ = self.reverse()
+        degree = np.diff(in_indptr)
+        return degree if ids is None else degree[ids]
+
+    def backlinks(self, i: int) -> np.ndarray:
+        in_indptr, in_sources = self.reverse()
+        return in_sources[in_indptr[i]:in_indptr[i + 1]]
+
+    def link_count(self, i: int) -> int:
+        """Liens résolus du nœud `i`, sortants et entrants."""
+        in_indptr, _ = self.reverse()
+        return int(self.indptr[i + 1] - self.indptr[i] + in_indptr[i + 1] - in_indptr[i])
+
+    # --- Dynamique ---
+    def propagate(self, rate: float, min_activation: float = 1.0) -> np.ndarray:
+        """
+        Amplification Top-Down : chaque nœud au-dessus du seuil diffuse
+        `activation * rate` répartie équitablement sur ses liens.
+        Seules les lignes CSR des nœuds actifs sont parcourues.
+        Retourne les IDs des nœuds ayant reçu de l'énergie.
+        """
+        tick = self.current_tick()
+        active = self.active_ids()
+        self.sync(active, tick)
+
+        sources = active[self.activation[active] > min_activation]
+        starts = self.indptr[sources]
+        counts = self.indptr[sources + 1] - starts
+        has_links = counts > 0
+        sources, starts, counts = sources[has_links], starts[has_links], counts[has_links]
+        if sources.size == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Positions des arêtes sortantes des sources dans `indices`
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        energy_per_link = self.activation[sources] * rate / self.out_degree[sources]
+
+        # Les deltas sont calculés d'abord puis appliqués en une fois
+        targets, inverse = np.unique(self.indices[edges], return_inverse=True)
+        delta = np.bincount(inverse, weights=np.repeat(energy_per_link, counts))
+
+        self.sync(targets, tick)
+        self.activation[targets] += delta
+        self.active.update(targets.tolist())
+        self.changed.update(targets.tolist())
+        return targets
+
+    def weights(self, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Version vectorisée de GraphNode.get_current_weight() (tous les nœuds ou `ids`)."""
+        self.sync(ids)
+        static = self.static_score if ids is None else self.static_score[ids]
+        activation = self.activation if ids is None else self.activation[ids]
+        fatigue = self.fatigue if ids is None else self.fatigue[ids]
+
+        if settings.FATIGUE_TOLERANCE > 0:
+            fatigue_ratio = fatigue / settings.FATIGUE_TOLERANCE
+            fatigue_cost = (fatigue_ratio ** 3) * static
+        else:
+            fatigue_cost = 0.0
+
+        total = (static + activation) - fatigue_cost
+        return np.maximum(total, 0.0)
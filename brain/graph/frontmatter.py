@@ -0,0 +1,185 @@
+import re
+import yaml
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+# Clés réellement exploitées par le Scanner (ADR-019 / ADR-022)
+FAST_KEYS = {"uid", "title", "tags", "aliases", "poids", "date_updated"}
+
+KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*)\s*:(?:\s+(.*))?$')
+INT_PATTERN = re.compile(r'^[-+]?(0|[1-9][0-9]*)$')
+# Comme le résolveur YAML 1.1 : pas de signe devant ".5" ("+.5" reste une chaîne)
+FLOAT_PATTERN = re.compile(r'^([-+]?[0-9]+\.[0-9]*|\.[0-9]+)([eE][-+][0-9]+)?$')
+DATE_PATTERN = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+NULL_VALUES = {"", "~", "null", "Null", "NULL"}
+BOOL_VALUES = {
+    "true": True, "True": True, "TRUE": True, "yes": True, "Yes": True, "YES": True,
+    "on": True, "On": True, "ON": True,
+    "false": False, "False": False, "FALSE": False, "no": False, "No": False, "NO": False,
+    "off": False, "Off": False, "OFF": False
+}
+# Indicateurs YAML que le chemin rapide ne sait pas interpréter
+UNSUPPORTED_START = set("&*!|>{}[]%@`#")
+
+
+class _Unsupported(Exception):
+    """Le frontmatter sort du sous-ensemble simple : repli sur PyYAML."""
+
+
+def parse_frontmatter(block: str) -> Dict[str, Any]:
+    """
+    Parse un bloc Frontmatter.
+    Chemin rapide pour les en-têtes "classiques" d'Obsidian (clé: valeur, listes simples),
+    repli sur yaml.safe_load pour tout ce qui sort de ce cadre.
+    Le résultat est identique à celui de PyYAML pour les clés FAST_KEYS (tests/test_frontmatter.py),
+    y compris pour les blocs que PyYAML rejette ({}).
+    """
+    meta = fast_frontmatter(block)
+    if meta is not None:
+        return meta
+    try:
+        return yaml.safe_load(block) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+def load_frontmatter(block: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse complet (toutes les clés, yaml.safe_load) pour réécrire un en-tête.
+    Retourne None si le bloc est illisible ou n'est pas un dictionnaire.
+    """
+    try:
+        data = yaml.safe_load(block)
+    except (yaml.YAMLError, ValueError):  # ValueError : date impossible
+        return None
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+
+def fast_frontmatter(block: str) -> Optional[Dict[str, Any]]:
+    """Retourne None si le bloc nécessite le chargeur YAML complet."""
+    try:
+        return _parse_lines(block.split("\n"))
+    except _Unsupported:
+        return None
+
+
+def _parse_lines(lines: List[str]) -> Dict[str, Any]:
+    meta: Dict[str, Any] = {}
+    current_key = None  # Clé en cours de lecture (seules les FAST_KEYS sont conservées)
+    block_list = False  # Vrai si sa valeur peut être une liste en bloc ("  - item")
+    item_indent = None  # Indentation des éléments de cette liste (identique pour tous)
+
+    for raw in lines:
+        line = raw.rstrip("\r")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if "\t" in line:
+            raise _Unsupported()
+
+        if line[0] in " -":
+            # Ligne de continuation : seule une liste en bloc simple est acceptée, y compris
+            # sous une clé ignorée (tout le reste peut être invalide pour YAML : repli)
+            if current_key is None or not block_list or (not stripped.startswith("- ") and stripped != "-"):
+                raise _Unsupported()
+            indent = len(line) - len(line.lstrip(" "))
+            if item_indent is None:
+                item_indent = indent
+            elif indent != item_indent:
+                raise _Unsupported()
+            item = stripped[1:].strip()
+            # "- #projet" : commentaire, l'élément vaut None
+            value = None if item.startswith("#") else _scalar(item)
+            if current_key in FAST_KEYS:
+                if meta[current_key] is None:
+                    meta[current_key] = []
+                meta[current_key].append(value)
+            continue
+
+        match = KEY_PATTERN.match(line)
+        if not match:
+            raise _Unsupported()
+        key, value = match.group(1), (match.group(2) or "").strip()
+        current_key, item_indent = key, None
+
+        if value == "" or value.startswith("#"):
+            # "tags:" seul vaut None en YAML, sauf si une liste en bloc suit
+            parsed, block_list = None, True
+        else:
+            # Une valeur sur la ligne de la clé ne peut pas se prolonger dessous.
+            # Elle est interprétée même pour une clé ignorée : une valeur que YAML
+            # rejetterait doit faire échouer le bloc entier, comme avec PyYAML.
+            parsed, block_list = _flow_value(value), False
+        if key in FAST_KEYS:
+            meta[key] = parsed
+
+    return meta
+
+
+def _flow_value(value: str) -> Any:
+    if value.startswith("["):
+        if not value.endswith("]"):
+            raise _Unsupported()
+        inner = value[1:-1].strip()
+        if not inner:
+            return []
+        if any(c in inner for c in "[]{}\"'#"):
+            raise _Unsupported()
+        items = [item.strip() for item in inner.split(",")]
+        if "" in items:
+            raise _Unsupported()  # "[a, ]" : virgule finale (ignorée par YAML) ou élément vide
+        return [_scalar(item) for item in items]
+    return _scalar(value)
+
+
+def _scalar(value: str) -> Any:
+    """Résolution d'un scalaire selon les règles de yaml.safe_load (sous-ensemble)."""
+    if value[:1] in UNSUPPORTED_START:
+        raise _Unsupported()
+
+    if value[:1] == "'":
+        if len(value) < 2 or not value.endswith("'"):
+            raise _Unsupported()
+        inner = value[1:-1]
+        if "'" in inner.replace("''", ""):
+            raise _Unsupported()
+        return inner.replace("''", "'")
+
+    if value[:1] == '"':
+        if len(value) < 2 or not value.endswith('"') or "\\" in value or '"' in value[1:-1]:
+            raise _Unsupported()
+        return value[1:-1]
+
+    if " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+
+    if value in ("=", "<<"):
+        raise _Unsupported()  # Étiquettes YAML spéciales (value, merge)
+    if value in NULL_VALUES:
+        return None
+    if value in BOOL_VALUES:
+        return BOOL_VALUES[value]
+    if INT_PATTERN.match(value):
+        return int(value)
+    if FLOAT_PATTERN.match(value):
+        return float(value)
+
+    date_match = DATE_PATTERN.match(value)
+    if date_match:
+        year, month, day = (int(g) for g in date_match.groups())
+        try:
+            return date(year, month, day)
+        except ValueError:
+            raise _Unsupported()  # Date impossible : PyYAML décide (erreur de syntaxe ou ValueError)
+
+    # Formes que YAML résout autrement (octal, hexadécimal, timestamps, .inf, mappings...)
+    if ": " in value or value.endswith(":") or value.startswith(("- ", "? ")):
+        raise _Unsupported()
+    if value[:1] in "0123456789.+-":
+        if (":" in value or value[:2] in ("0x", "0o", "0b")
+                or value.lstrip("+-").lower() in (".inf", ".nan")
+                or not any(c.isalpha() for c in value)):
+            raise _Unsupported()
+    return value
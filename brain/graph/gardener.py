@@ -0,0 +1,255 @@
+import time
+import yaml
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from core.settings import settings
+from brain.graph.node import GraphNode, TAGS, tags_from_ids
+
+DAY_SECONDS = 86400.0
+
+# Prédicat compilé : (nœud, contexte du cycle) -> bool
+Predicate = Callable[[GraphNode, "CycleContext"], bool]
+
+
+@dataclass
+class CycleContext:
+    """Valeurs partagées par toutes les évaluations d'un cycle."""
+    now: float
+    link_count: Callable[[str], int]
+    in_link_count: Callable[[str], int]
+
+
+class TagSelector:
+    """
+    IDs des tags (internés) qui satisfont un critère textuel (préfixe, sous-chaîne).
+    Mis à jour incrémentalement quand de nouveaux tags apparaissent dans TAGS.
+    """
+
+    def __init__(self, accept: Callable[[str], bool]):
+        self.accept = accept
+        self.ids: Set[int] = set()
+        self._seen = 0
+
+    def current(self) -> Set[int]:
+        names = TAGS.names
+        for symbol in range(self._seen, len(names)):
+            if self.accept(names[symbol]):
+                self.ids.add(symbol)
+        self._seen = len(names)
+        return self.ids
+
+    def matches(self, node: GraphNode) -> bool:
+        ids = self.current()
+        return any(symbol in ids for symbol in node.tag_ids)
+
+
+@dataclass
+class Condition:
+    test: Predicate
+    # Durées (secondes après date_updated) auxquelles le résultat peut basculer
+    boundaries: List[float] = field(default_factory=list)
+
+
+@dataclass
+class TagChange:
+    """Tags ajoutés / retirés sur une note au cours d'un cycle (pour l'écriture disque)."""
+    node: GraphNode
+    added: Set[str]
+    removed: Set[str]
+
+
+@dataclass
+class Rule:
+    name: str
+    condition: Condition
+    add_tags: List[str] = field(default_factory=list)
+    remove_tags: List[str] = field(default_factory=list)
+    log: str = ""
+
+    def apply(self, node: GraphNode):
+        for tag in self.remove_tags:
+            node.remove_tag(tag)
+        for tag in self.add_tags:
+            node.add_tag(tag)
+
+
+def _as_list(value) -> List[str]:
+    return [str(v) for v in value] if isinstance(value, (list, tuple)) else [str(value)]
+
+
+def compile_condition(spec: Dict[str, Any]) -> Condition:
+    """Compile un bloc `when` (conjonction de conditions) en prédicat."""
+    tests: List[Predicate] = []
+    boundaries: List[float] = []
+
+    for key, value in (spec or {}).items():
+        if key in ("has_tag", "lacks_tag"):
+            # IDs des tags requis/interdits, calculés une fois
+            wanted = frozenset(TAGS.intern(tag) for tag in _as_list(value))
+            if key == "has_tag":
+                tests.append(lambda n, c, w=wanted: w.issubset(n.tag_ids))
+            else:
+                tests.append(lambda n, c, w=wanted: w.isdisjoint(n.tag_ids))
+
+        elif key in ("has_tag_prefix", "lacks_tag_prefix", "has_tag_containing", "lacks_tag_containing"):
+            text = str(value)
+            if key.endswith("prefix"):
+                selector = TagSelector(lambda tag, t=text: tag.startswith(t))
+            else:
+                selector = TagSelector(lambda tag, t=text: t in tag)
+            if key.startswith("has"):
+                tests.append(lambda n, c, s=selector: s.matches(n))
+            else:
+                tests.append(lambda n, c, s=selector: not s.matches(n))
+
+        elif key == "links_gt":
+            tests.append(lambda n, c, v=int(value): c.link_count(n.filename) > v)
+        elif key == "links_lt":
+            tests.append(lambda n, c, v=int(value): c.link_count(n.filename) < v)
+        elif key == "in_links_gt":
+            tests.append(lambda n, c, v=int(value): c.in_link_count(n.filename) > v)
+
+        elif key == "days_inactive_gt":
+            # (now - date_updated).days > N  <=>  now - updated >= (N + 1) jours
+            limit = (int(value) + 1) * DAY_SECONDS
+            tests.append(lambda n, c, l=limit: c.now - n.updated_ts >= l)
+            boundaries.append(limit)
+        elif key == "days_inactive_lt":
+            limit = int(value) * DAY_SECONDS
+            tests.append(lambda n, c, l=limit: c.now - n.updated_ts < l)
+            boundaries.append(limit)
+
+        elif key == "in_folder":
+            folder = str(value).strip("/")
+            tests.append(lambda n, c, f=folder: n.folder == f or n.folder.startswith(f + "/"))
+
+        elif key == "any":
+            branches = [compile_condition(branch) for branch in value]
+            tests.append(lambda n, c, b=branches: any(branch.test(n, c) for branch in b))
+            for branch in branches:
+                boundaries.extend(branch.boundaries)
+        elif key == "not":
+            inner = compile_condition(value)
+            tests.append(lambda n, c, i=inner: not i.test(n, c))
+            boundaries.extend(inner.boundaries)
+        else:
+            raise ValueError(f"Condition inconnue : {key}")
+
+    return Condition(test=lambda n, c: all(t(n, c) for t in tests), boundaries=boundaries)
+
+
+def load_rules(path: Path) -> List[Rule]:
+    with open(path, "r", encoding="utf-8") as f:
+        spec = yaml.safe_load(f) or {}
+
+    rules = []
+    for entry in spec.get("rules", []):
+        if not entry.get("enabled", True):
+            continue
+        actions = entry.get("then") or {}
+        rules.append(Rule(
+            name=entry["name"],
+            condition=compile_condition(entry.get("when")),
+            add_tags=_as_list(actions.get("add_tags", [])),
+            remove_tags=_as_list(actions.get("remove_tags", [])),
+            log=entry.get("log", entry["name"])
+        ))
+    return rules
+
+
+class Gardener:
+    """
+    Jardinier (ADR-028) : applique les règles déclarées dans GARDENING_RULES_FILE.
+    Seules les notes marquées "sales" par le graphe (liens, tags ou contenu modifiés)
+    sont évaluées, ainsi que celles dont un seuil de durée (days_inactive_*) a été
+    franchi : ces échéances sont rangées par jour et réveillées au changement de jour.
+    Le coût d'un cycle est proportionnel aux changements, pas à la taille du Vault.
+    Les déclenchements sont résumés en une ligne par règle et par cycle (nombre de notes
+    et quelques titres) : une règle de simple signalement ne noie pas la console.
+    """
+
+    LOG_EXAMPLES = 3  # Titres cités par ligne de résumé
+
+    def __init__(self, graph, rules_file: Optional[Path] = None, clock: Callable[[], float] = time.time):
+        self.graph = graph
+        self.clock = clock
+        self.rules_file = rules_file or settings.GARDENING_RULES_FILE
+        self.rules: List[Rule] = []
+        # Jour (epoch // 86400) -> notes à réévaluer ce jour-là
+        self._timers: Dict[int, Set[str]] = {}
+        self.reload_rules()
+
+    def reload_rules(self):
+        try:
+            self.rules = load_rules(self.rules_file)
+            print(f"[Jardinier] 📜 {len(self.rules)} règle(s) chargée(s).")
+        except Exception as e:
+            print(f"[Jardinier] ❌ Règles illisibles ({self.rules_file}) : {e}")
+            self.rules = []
+            return
+        # Nouvelles règles : toutes les notes sont à réévaluer
+        self._timers = {}
+        self.graph.mark_dirty(self.graph.nodes.keys())
+
+    def run_cycle(self) -> List[TagChange]:
+        """Évalue les notes sales ; retourne les changements de tags effectués."""
+        now = self.clock()
+        today = int(now // DAY_SECONDS)
+
+        dirty = self.graph.pop_dirty()
+        for day in [d for d in self._timers if d <= today]:
+            dirty |= self._timers.pop(day)
+        if not dirty or not self.rules:
+            return []
+
+        context = CycleContext(now=now, link_count=self.graph.link_count,
+                               in_link_count=self.graph.in_link_count)
+        changes: List[TagChange] = []
+        hits: Dict[str, List[str]] = {}  # Règle -> titres des notes concernées
+        for fname in dirty:
+            # Lecture sans promotion : une note froide ne remonte que si une règle la modifie
+            node = self.graph.nodes.peek(fname)
+            if node is None:
+                continue
+            before = node.tag_ids
+            for rule in self.rules:
+                if rule.condition.test(node, context):
+                    hits.setdefault(rule.name, []).append(node.title)
+                    if rule.add_tags or rule.remove_tags:
+                        node = self.graph.nodes[fname]
+                    rule.apply(node)
+                self._schedule(rule, node, now)
+
+            after = node.tag_ids
+            if after != before:
+                # Maturité (ADR-022) : le poids statique dépend des tags
+                node._calculate_static_potential()
+                changes.append(TagChange(node, set(tags_from_ids(set(after) - set(before))),
+                                         set(tags_from_ids(set(before) - set(after)))))
+
+        self._report(hits)
+
+        # Les notes modifiées sont réévaluées au cycle suivant (règles en chaîne)
+        self.graph.mark_dirty(change.node.filename for change in changes)
+        return changes
+
+    def _report(self, hits: Dict[str, List[str]]):
+        for rule in self.rules:
+            titles = hits.get(rule.name)
+            if not titles:
+                continue
+            if len(titles) == 1:
+                print(f"[Jardinier] {rule.log} : {titles[0]}")
+                continue
+            examples = ", ".join(sorted(titles)[:self.LOG_EXAMPLES])
+            more = ", …" if len(titles) > self.LOG_EXAMPLES else ""
+            print(f"[Jardinier] {rule.log} : {len(titles)} notes ({examples}{more})")
+
+    def _schedule(self, rule: Rule, node: GraphNode, now: float):
+        for boundary in rule.condition.boundaries:
+            flip = node.updated_ts + boundary
+            if flip > now:
+                # Réveil au début du jour suivant l'échéance
+                self._timers.setdefault(int(flip // DAY_SECONDS) + 1, set()).add(node.filename)
@@ -0,0 +1,166 @@
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from brain.graph.matcher import fold_text
+from brain.graph.node import GraphNode
+
+
+def link_key(text: str) -> str:
+    """Clé de comparaison d'un nom de note (casse, accents et espaces normalisés)."""
+    return re.sub(r"\s+", " ", fold_text(text)).strip()
+
+
+class LinkIndex:
+    """
+    Résolution des [[WikiLinks]] (ADR-022, Structure S).
+    Un lien est résolu une seule fois, contre le chemin relatif, le nom de fichier,
+    le titre puis les `aliases` des notes, et l'index maintient :
+      - targets : source -> cibles résolues (adjacence avant)
+      - sources : cible -> sources (adjacence arrière / backlinks)
+      - dangling : lien non résolu -> sources (résolu dès que la note apparaît)
+    """
+
+    # Priorité des noms (plus petit = plus fort)
+    PRIO_PATH, PRIO_FILENAME, PRIO_TITLE, PRIO_ALIAS = range(4)
+
+    def __init__(self):
+        self._names: Dict[str, List[Tuple[int, str]]] = {}
+        self._keys_by_file: Dict[str, Set[Tuple[str, int]]] = {}
+        self._raw_links: Dict[str, Tuple[str, ...]] = {}
+
+        self.targets: Dict[str, Set[str]] = {}
+        self.sources: Dict[str, Set[str]] = {}
+        self.dangling: Dict[str, Set[str]] = {}
+
+    # --- Construction ---
+    def build(self, nodes: Dict[str, GraphNode]):
+        for node in nodes.values():
+            self._register_names(node)
+        for node in nodes.values():
+            self._link(node.filename, node.links)
+
+    def upsert(self, node: GraphNode) -> Set[str]:
+        """
+        Enregistre une note nouvelle ou modifiée.
+        Retourne les fichiers dont les cibles résolues ont changé (dont la note elle-même).
+        """
+        fname = node.filename
+        old_keys = self._keys_by_file.get(fname, set())
+        self._unregister_names(fname)
+        self._register_names(node)
+        new_keys = self._keys_by_file[fname]
+
+        # Notes dont un lien pourrait désormais se résoudre autrement :
+        # celles visant un nom gagné par la note, et ses backlinks si elle perd un nom
+        candidates = self._sources_for_keys({k for k, _ in new_keys - old_keys})
+        if old_keys - new_keys:
+            candidates |= self.sources.get(fname, set())
+
+        before = self.targets.get(fname)
+        self._unlink(fname)
+        self._link(fname, node.links)
+        affected = {fname} if self.targets[fname] != before else set()
+        return affected | self._relink(candidates - {fname})
+
+    def remove(self, fname: str) -> Set[str]:
+        """Oublie une note ; retourne les sources dont les cibles ont changé."""
+        keys = {k for k, _ in self._keys_by_file.get(fname, set())}
+        self._unregister_names(fname)
+        self._unlink(fname)
+        return self._relink(self._sources_for_keys(keys) | self.sources.pop(fname, set()))
+
+    # --- Requêtes ---
+    def resolve(self, raw: str) -> Optional[str]:
+        for key in self._candidate_keys(raw):
+            candidates = self._names.get(key)
+            if candidates:
+                return min(candidates)[1]
+        return None
+
+    def backlinks(self, fname: str) -> Set[str]:
+        return self.sources.get(fname, set())
+
+    # --- Interne ---
+    @staticmethod
+    def _candidate_keys(raw: str) -> List[str]:
+        name = raw[:-3] if raw.endswith(".md") else raw
+        name = re.split(r"[#^]", name, maxsplit=1)[0]
+        keys = [link_key(name)]
+        if "/" in name:
+            keys.append(link_key(name.rsplit("/", 1)[1]))  # [[Dossier/Note]] -> "Note"
+        return [k for k in keys if k]
+
+    def _node_keys(self, node: GraphNode) -> Set[Tuple[str, int]]:
+        keys = {(link_key(node.filename[:-3] if node.filename.endswith(".md") else node.filename),
+                 self.PRIO_FILENAME),
+                (link_key(node.title), self.PRIO_TITLE)}
+        keys |= {(link_key(alias), self.PRIO_ALIAS) for alias in node.aliases}
+        rel = node.rel_path
+        if not Path(rel).is_absolute():  # Note hors du Vault : pas de clé de chemin
+            keys.add((link_key(rel[:-3] if rel.endswith(".md") else rel), self.PRIO_PATH))
+        return {(k, p) for k, p in keys if k}
+
+    def _register_names(self, node: GraphNode):
+        keys = self._node_keys(node)
+        self._keys_by_file[node.filename] = keys
+        for key, prio in keys:
+            self._names.setdefault(key, []).append((prio, node.filename))
+
+    def _unregister_names(self, fname: str):
+        for key, prio in self._keys_by_file.pop(fname, set()):
+            candidates = self._names.get(key)
+            if candidates:
+                candidates.remove((prio, fname))
+                if not candidates:
+                    del self._names[key]
+
+    def _link(self, source: str, raw_links: Iterable[str]):
+        self._raw_links[source] = tuple(raw_links)
+        resolved = set()
+        for raw in self._raw_links[source]:
+            target = self.resolve(raw)
+            if target is not None:
+                resolved.add(target)
+                self.sources.setdefault(target, set()).add(source)
+            else:
+                for key in self._candidate_keys(raw)[:1]:
+                    self.dangling.setdefault(key, set()).add(source)
+        self.targets[source] = resolved
+
+    def _unlink(self, source: str):
+        for target in self.targets.pop(source, set()):
+            backlinks = self.sources.get(target)
+            if backlinks:
+                backlinks.discard(source)
+                if not backlinks:
+                    del self.sources[target]
+        for raw in self._raw_links.pop(source, ()):
+            for key in self._candidate_keys(raw)[:1]:
+                waiting = self.dangling.get(key)
+                if waiting:
+                    waiting.discard(source)
+                    if not waiting:
+                        del self.dangling[key]
+
+    def _sources_for_keys(self, keys: Set[str]) -> Set[str]:
+        """Sources dont un lien (résolu ou non) pourrait correspondre à l'une de ces clés."""
+        found = set()
+        for key in keys:
+            found |= self.dangling.get(key, set())
+            for _, fname in self._names.get(key, []):
+                found |= self.sources.get(fname, set())
+        return found
+
+    def _relink(self, sources: Set[str]) -> Set[str]:
+        changed = set()
+        for source in sources:
+            raw_links = self._raw_links.get(source)
+            if raw_links is None:
+                continue
+            before = self.targets.get(source, set())
+            self._unlink(source)
+            self._link(source, raw_links)
+            if self.targets[source] != before:
+                changed.add(source)
+        return changed
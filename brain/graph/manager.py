@@ -1,10 +1,20 @@
+import os
 import json
+import threading
+import numpy as np
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Iterable, Tuple, Union
 
 from core.settings import settings
 from brain.graph.node import GraphNode
 from brain.graph.scanner import VaultScanner
+from brain.graph.engine import ActivationEngine
+from brain.graph.matcher import TitleMatcher
+from brain.graph.topk import TopKTracker
+from brain.graph.links import LinkIndex
+from brain.graph.checkpoint import StateCheckpoint
+from brain.graph.retriever import GraphRetriever
+from brain.graph.tiers import NodeStore, TieredNodeStore
 
 
 class GraphStateManager:
@@ -13,114 +23,325 @@ class GraphStateManager:
     """
 
     def __init__(self):
-        self.state_file = settings.LOGS_DIR / "brain_state.json"
-        self.nodes: Dict[str, GraphNode] = {}
+        # État volatile : instantané binaire + journal des deltas (ancien JSON migré)
+        self.checkpoint = StateCheckpoint(settings.LOGS_DIR)
+        # Nœuds chauds en RAM, nœuds froids dans LOGS_DIR/cold_nodes.bin (promus à la lecture)
+        self.nodes: Union[NodeStore, TieredNodeStore] = None
+        self.engine = ActivationEngine()
+        self.topk = TopKTracker(self.engine)
+        self.retriever = GraphRetriever(self.engine)
+        self.matcher = TitleMatcher()
+        self.scanner = VaultScanner()
+        # Résolution des liens (fichier, chemin, titre, alias) et liens entrants
+        self.links = LinkIndex()
+        # Notes à réévaluer par le Jardinier (liens, tags ou contenu modifiés)
+        self.dirty: Set[str] = set()
+        # Dernier contenu écrit dans brain_activity.json (écriture seulement si changement)
+        self._last_snapshot = None
+        # Accès concurrents (pipeline du Cerveau, Synthèse de fond) : à prendre par l'appelant
+        self.lock = threading.RLock()
 
     def load_state(self):
         # 1. SCAN PHYSIQUE (ADR-019 Start)
         # On charge la structure réelle pour calculer S, C, T
-        scanner = VaultScanner()
-        self.nodes = scanner.scan_vault()
-
-        # 2. Chargement État Volatile (Activations précédentes)
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for fname, n_data in data.items():
-                        if fname in self.nodes:
-                            # On restaure uniquement l'énergie (Volatile)
-                            self.nodes[fname].activation = n_data.get("activation", 0.0)
-                            self.nodes[fname].consecutive_activations = n_data.get("consecutive_activations", 0)
-            except Exception:
-                pass
+        nodes = self.scanner.scan_vault()
+        # Résolution unique des [[liens]] vers les notes (adjacence avant + arrière)
+        self.links = LinkIndex()
+        self.links.build(nodes)
+        # Compilation vectorielle (Tableaux NumPy + Adjacence CSR)
+        self.engine.compile(nodes, self.links.targets)
+        # Automate de reconnaissance des titres (Stimulus)
+        self.matcher = TitleMatcher()
+        for node in nodes.values():
+            self.index_titles(node)
+        self.dirty = set(nodes)
 
+        if self.nodes is not None:
+            self.nodes.close()
+        tiering = settings.GRAPH_TIERING_ENABLED
+        if tiering:
+            self.nodes = TieredNodeStore(self.engine, nodes, settings.LOGS_DIR / "cold_nodes.bin",
+                                         settings.GRAPH_HOT_CAPACITY)
+        else:
+            # Sans niveaux : ni fichier froid ni comptabilité LRU sur le chemin chaud
+            self.nodes = NodeStore(nodes)
+        del nodes
+
+        # 2. Chargement État Volatile (Instantané + rejeu du journal)
+        self._restore_volatile()
+        # 3. Notes anciennes et au repos : niveau froid (les nœuds actifs restent chauds)
+        if tiering:
+            self.nodes.demote_cold(self.engine.clock())
         print(f"[Graph] Cortex chargé : {len(self.nodes)} nœuds actifs.")
 
-    def save_state(self):
-        # ADR-019 End : On ne sauvegarde que le volatile ici.
-        # Le persistant (YAML) est géré par Librarian/Gardener.
-        data = {}
-        for fname, node in self.nodes.items():
-            if node.activation > 0.1:  # Optimisation
-                data[fname] = {
-                    "activation": node.activation,
-                    "consecutive_activations": node.consecutive_activations
-                }
+    def _restore_volatile(self):
+        states, saved_tick = self.checkpoint.load()
+        engine = self.engine
+        now_tick = engine.current_tick()
+        # Comme avant, l'énergie est figée pendant l'arrêt : les ticks sont recalés sur maintenant
+        offset = now_tick - saved_tick if saved_tick is not None else 0
+
+        for fname, (activation, fatigue, stamp) in states.items():
+            i = engine.index.get(fname)
+            if i is None:
+                continue
+            engine.activation[i] = activation
+            engine.fatigue[i] = fatigue
+            engine.stamp[i] = stamp + offset if saved_tick is not None else now_tick
+            engine.active.add(i)
+
+        engine.changed = set()
+        if saved_tick is None and states:
+            # Migration de l'ancien brain_state.json vers le format binaire
+            self.checkpoint.write_checkpoint(engine)
+            print(f"[Graph] 💾 État volatile migré vers {self.checkpoint.checkpoint_file.name}.")
+
+    def save_state(self, compact: bool = False):
+        """
+        ADR-019 End : On ne sauvegarde que le volatile ici.
+        Le persistant (YAML) est géré par Librarian/Gardener.
+        Seuls les nœuds modifiés depuis la dernière sauvegarde sont journalisés ;
+        `compact` réécrit un instantané complet (arrêt du Cerveau).
+        Le manifeste du Scanner, s'il a changé depuis, est écrit en même temps.
+        """
         try:
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-        except:
-            pass
+            if compact:
+                self.engine.changed = set()
+                self.checkpoint.write_checkpoint(self.engine)
+            else:
+                self.checkpoint.append(self.engine, self.engine.pop_changed())
+        except OSError as e:
+            print(f"[Graph] ⚠️ Sauvegarde de l'état impossible : {e}")
+        self.scanner.flush_manifest()
+
+    # --- Vault vivant (mises à jour incrémentales) ---
+    def apply_vault_changes(self, paths: Iterable[Path]):
+        """
+        Répercute sur le graphe en RAM des fichiers créés, modifiés ou supprimés
+        pendant la session : seul le fichier concerné est re-parsé.
+        """
+        updated, removed = 0, 0
+        for path in paths:
+            if path.is_dir():
+                # Dossier créé ou déplacé dans le Vault : on en intègre toutes les notes
+                changed = list(path.rglob("*.md"))
+            elif path.exists():
+                changed = [path] if path.suffix == ".md" else []
+            else:
+                # Fichier (ou dossier entier) supprimé / déplacé hors du Vault
+                # (retrouvé via le manifeste : les nœuds froids ne sont pas promus)
+                gone = []
+                for rel_path, fname in self.scanner.files_under(path):
+                    self.scanner.forget_file(self.scanner.vault_path / rel_path)
+                    if self.nodes.rel_path(fname) == rel_path:
+                        gone.append(fname)
+                self._remove_nodes(gone)
+                removed += len(gone)
+                continue
+
+            for file_path in changed:
+                try:
+                    node = self.scanner.refresh_file(file_path)
+                except Exception:
+                    continue  # Fichier en cours d'écriture ou corrompu : prochain événement
+                if node:
+                    self._upsert_node(node)
+                    updated += 1
+
+        if updated or removed:
+            # Le manifeste est écrit avec la sauvegarde périodique de l'état (save_state)
+            print(f"[Graph] 🔄 Vault : {updated} note(s) mise(s) à jour, {removed} retirée(s).")
+
+    def _upsert_node(self, fresh: GraphNode):
+        node = self.nodes.get(fresh.filename)
+
+        if node is None:
+            # Nouvelle note : ajout en fin de moteur
+            self.nodes[fresh.filename] = fresh
+            self.engine.add_nodes([fresh])
+            self.dirty.add(fresh.filename)
+            # Les notes qui pointaient déjà vers ce nom (ou un alias) obtiennent enfin leur arête
+            for source in self.links.upsert(fresh):
+                self._refresh_row(source)
+            self.index_titles(fresh)
+            return
+
+        # Note existante : mise à jour en place (l'activation courante est conservée)
+        node.full_path = fresh.full_path
+        node.uid = fresh.uid
+        node.title = fresh.title
+        node.tags = fresh.tags
+        node.aliases = fresh.aliases
+        node.links = fresh.links
+        node.base_weight = fresh.base_weight
+        node.date_updated = fresh.date_updated
+        node._calculate_static_potential()
+        self.dirty.add(node.filename)
+
+        # Liens ou noms modifiés : seules les lignes CSR dont les cibles changent sont réécrites
+        for source in self.links.upsert(node):
+            self._refresh_row(source)
+        self.index_titles(node)
+
+    def _remove_nodes(self, filenames: List[str]):
+        if not filenames:
+            return
+        # Les cibles des notes supprimées perdent un lien entrant
+        engine = self.engine
+        for fname in filenames:
+            i = engine.index[fname]
+            self.dirty.update(engine.filenames[t] for t in engine.indices[engine.indptr[i]:engine.indptr[i + 1]])
+        self.dirty.difference_update(filenames)
+
+        affected = set()
+        for fname in filenames:
+            affected |= self.links.remove(fname)
+            self.matcher.remove(fname)
+        # Compactage du moteur : les arêtes entrantes disparaissent avec les nœuds
+        self.engine.remove_nodes(filenames, self.nodes.hot)
+        for fname in filenames:
+            del self.nodes[fname]
+        # Un lien vers une note supprimée peut se reporter sur une autre (même alias)
+        for source in affected - set(filenames):
+            if source in self.nodes:
+                self._refresh_row(source)
+
+    def _refresh_row(self, filename: str):
+        index = self.engine.index
+        i = index[filename]
+        old_targets = self.engine.indices[self.engine.indptr[i]:self.engine.indptr[i + 1]].tolist()
+        targets = [index[t] for t in self.links.targets.get(filename, ()) if t in index]
+        # Nombre de liens bruts : inchangé pour une source froide (seule la résolution a bougé)
+        node = self.nodes.hot.get(filename)
+        out_degree = node.link_count if node is not None else int(self.engine.out_degree[i])
+        self.engine.set_links(i, targets, out_degree)
+        # Le nombre de liens (sortants + entrants) change pour la source et ses cibles
+        self.dirty.add(filename)
+        self.dirty.update(self.engine.filenames[t] for t in set(old_targets) ^ set(targets))
 
-    def inject_stimulus(self, text: str, tags: str):
+    # --- Requêtes sur les liens ---
+    def backlinks(self, filename: str) -> Set[str]:
+        """Notes pointant vers `filename` (liens résolus)."""
+        return set(self.links.backlinks(filename))
+
+    def link_count(self, filename: str) -> int:
+        """Liens résolus d'une note, sortants et entrants (Structure S)."""
+        return self.engine.link_count(self.engine.index[filename])
+
+    def in_link_count(self, filename: str) -> int:
+        return len(self.engine.backlinks(self.engine.index[filename]))
+
+    # --- Notes à réévaluer (Jardinier) ---
+    def mark_dirty(self, filenames: Iterable[str]):
+        self.dirty.update(filenames)
+
+    def pop_dirty(self) -> Set[str]:
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def index_titles(self, node: GraphNode):
+        """(Ré)indexe le titre et les alias d'une note (création ou renommage)."""
+        self.matcher.add(node.filename, {node.title, *node.aliases})
+
+    def inject_stimulus(self, text: str, tags: str, exclude: Iterable[str] = ()) -> Set[str]:
         """
         ADR-022 : Recrutement Bottom-Up (Stimulus).
         Active les nœuds pertinents par rapport au flux entrant.
+        `exclude` : notes déjà stimulées pour cet énoncé (transcription en continu).
+        Retourne les notes stimulées.
         """
-        text_lower = text.lower()
-
         # 1. Activation par correspondance directe (Keyword Match)
-        # Si le titre d'une note est mentionné, elle reçoit un fort boost.
-        for node in self.nodes.values():
-            # On nettoie le titre pour la comparaison (.md)
-            clean_title = node.title.lower()
-            if clean_title in text_lower:
-                # BOOST STIMULUS
-                # Le boost est arbitraire ici, à calibrer (ex: +20)
-                node.stimulate(20.0)
-                # print(f"[Graph] ⚡ Stimulus Direct : {node.title}")
+        # Si le titre (ou un alias) d'une note est mentionné, elle reçoit un fort boost.
+        # Une seule passe Aho-Corasick sur l'énoncé, insensible à la casse et aux accents.
+        stimulated = set(self.matcher.find(text)).difference(exclude)
+        for fname in stimulated:
+            # BOOST STIMULUS
+            # Le boost est arbitraire ici, à calibrer (ex: +20)
+            self.nodes[fname].stimulate(20.0)
+            # print(f"[Graph] ⚡ Stimulus Direct : {self.nodes[fname].title}")
 
         # 2. Activation par Intention (Tags)
         # TODO: Si le routeur détecte [PHILOSOPHIE], activer faiblement tout ce qui est tagué #sujet/philosophie
+        return stimulated
+
+    def active_nodes(self, k: int) -> List[GraphNode]:
+        """Les k nœuds activés (activation > 0) de plus fort poids courant (ADR-022)."""
+        active = self.engine.active_ids()
+        self.engine.sync(active)
+        active = active[self.engine.activation[active] > 0]
+        order = np.argsort(-self.engine.weights(active), kind="stable")[:k]
+        return [self.nodes[self.engine.filenames[i]] for i in active[order].tolist()]
+
+    def related_notes(self, text: str, k: int = None) -> List[Tuple[GraphNode, float]]:
+        """
+        Notes liées à une question (intention [READ]) : PageRank personnalisé
+        depuis les notes dont le titre ou un alias est cité dans `text`.
+        Sans note citée, les graines sont les nœuds les plus activés (pondérés par l'activation).
+        """
+        index = self.engine.index
+        seeds = {index[fname]: 1.0 for fname in self.matcher.find(text) if fname in index}
+        if not seeds:
+            active = self.engine.active_ids()
+            if active.size:
+                self.engine.sync(active)
+                seeds = {int(i): float(self.engine.activation[i]) for i in active}
+
+        results = self.retriever.query(seeds, k)
+        return [(self.nodes[self.engine.filenames[i]], score) for i, score in results]
 
     def propagate_activation(self):
         """
         ADR-022 : Amplification Top-Down.
         L'énergie se diffuse via les liens (Links).
         """
-        # On calcule les deltas d'abord pour ne pas modifier pendant l'itération
-        activations_delta = {}
-
-        for filename, node in self.nodes.items():
-            if node.activation > 1.0:
-                # Quantité d'énergie transmise aux voisins
-                energy_to_spread = node.activation * settings.PROPAGATION_RATE
-
-                # Répartition équitable ou totale ? ADR suggère Top-Down.
-                # On divise par le nombre de liens pour ne pas exploser le système
-                if node.links:
-                    energy_per_link = energy_to_spread / len(node.links)
+        # Diffusion vectorisée : les deltas sont calculés puis appliqués en une fois
+        targets = self.engine.propagate(settings.PROPAGATION_RATE)
+        # Les notes froides atteintes par une activation notable remontent au niveau chaud
+        if not self.nodes.tiered:
+            return
+        reached = targets[self.engine.activation[targets] >= settings.GRAPH_PROMOTE_ACTIVATION]
+        self.nodes.promote(self.engine.filenames[i] for i in reached.tolist())
 
-                    for target_link in node.links:
-                        # target_link est ex: "Concept.md"
-                        if target_link in self.nodes:
-                            activations_delta[target_link] = activations_delta.get(target_link, 0.0) + energy_per_link
-
-        # Application des deltas
-        for fname, amount in activations_delta.items():
-            self.nodes[fname].stimulate(amount)
+    def decay_all(self):
+        """
+        ADR-022 : Oubli & Fatigue.
+        L'oubli est calculé paresseusement (forme close) à chaque lecture :
+        cette passe se contente de le matérialiser sur les nœuds actifs
+        et d'écarter ceux revenus au repos. Coût proportionnel aux nœuds actifs.
+        """
+        self.engine.settle()
 
     def export_activity_snapshot(self, filepath: Path):
         """Génère la vue pour le Dashboard (Tri par Poids ADR-022)."""
         snapshot = {"nodes": []}
 
-        # On utilise get_current_weight() qui est la formule ADR-022 complète
+        # Formule ADR-022 complète, évaluée sur les seuls candidats au Top-K
         # W_t = Static(S,C,T) + Dynamic(Act) - Fatigue
-        sorted_nodes = sorted(self.nodes.values(), key=lambda x: x.get_current_weight(), reverse=True)
+        top_ids = self.topk.top(20)
+        weights = self.engine.weights(top_ids)
 
-        for node in sorted_nodes[:20]:
+        for i, weight in zip(top_ids, weights):
+            node = self.nodes[self.engine.filenames[i]]
             snapshot["nodes"].append({
                 "title": node.title,
-                "weight": round(node.get_current_weight(), 1),
+                "weight": round(float(weight), 1),
                 "activation": round(node.activation, 1),
                 "fatigue": node.consecutive_activations,
                 "ignited": node.activation > settings.IGNITION_THRESHOLD,
-                "links": len(node.links)
+                "links": node.link_count
             })
 
+        payload = json.dumps(snapshot)
+        if payload == self._last_snapshot:
+            return  # Rien n'a changé : pas d'écriture disque
+
+        # Écriture atomique (fichier temporaire + renommage) : le serveur Web
+        # ne lit jamais un JSON à moitié écrit.
+        tmp_path = filepath.with_suffix(".tmp")
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(snapshot, f)
-        except:
-            pass
\ No newline at end of file
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+            self._last_snapshot = payload
+        except OSError:
+            pass  # Fichier verrouillé côté lecteur (Windows) : nouvel essai au prochain cycle
@@ -0,0 +1,130 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Set
+
+
+def fold_text(text: str) -> str:
+    """Minuscules + suppression des accents ("Éthique" -> "ethique")."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class TitleMatcher:
+    """
+    Automate Aho-Corasick multi-motifs sur les titres et alias des notes (ADR-022, Stimulus).
+    L'alphabet de l'automate est le MOT (et non le caractère) : les frontières de mots
+    sont donc respectées par construction ("art" ne matche pas "artiste"),
+    et tout l'énoncé est analysé en une seule passe.
+    """
+
+    WORD_PATTERN = re.compile(r"\w+")
+
+    def __init__(self):
+        self._vocab: Dict[str, int] = {}
+        # Transitions : clé (état << 32 | id_mot) -> état suivant
+        self._next: Dict[int, int] = {}
+        self._parent: List[int] = [0]
+        self._token: List[int] = [-1]
+        self._depth: List[int] = [0]
+        self._fail: List[int] = [0]
+        self._out_link: List[int] = [0]  # Lien vers le plus long suffixe terminal
+        self._terminal: Dict[int, str] = {}
+
+        self._patterns: Dict[str, Set[str]] = {}  # motif replié -> fichiers
+        self._by_file: Dict[str, Set[str]] = {}   # fichier -> motifs repliés
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._patterns)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls.WORD_PATTERN.findall(fold_text(text))
+
+    # --- Mise à jour incrémentale ---
+    def add(self, filename: str, names: Iterable[str]):
+        """Associe (ou ré-associe, en cas de renommage) les noms d'une note."""
+        self.remove(filename)
+
+        patterns = set()
+        for name in names:
+            tokens = self.tokenize(name or "")
+            if tokens:
+                patterns.add(" ".join(tokens))
+
+        for pattern in patterns:
+            if pattern not in self._patterns:
+                self._insert(pattern)
+                self._patterns[pattern] = set()
+            self._patterns[pattern].add(filename)
+        self._by_file[filename] = patterns
+
+    def remove(self, filename: str):
+        for pattern in self._by_file.pop(filename, ()):
+            owners = self._patterns.get(pattern)
+            if owners is not None:
+                owners.discard(filename)
+                # L'état terminal reste dans le trie mais ne produit plus rien
+                if not owners:
+                    del self._patterns[pattern]
+
+    def _insert(self, pattern: str):
+        state = 0
+        for token in pattern.split(" "):
+            tid = self._vocab.setdefault(token, len(self._vocab))
+            key = (state << 32) | tid
+            nxt = self._next.get(key)
+            if nxt is None:
+                nxt = len(self._parent)
+                self._next[key] = nxt
+                self._parent.append(state)
+                self._token.append(tid)
+                self._depth.append(self._depth[state] + 1)
+                self._fail.append(0)
+                self._out_link.append(0)
+                self._dirty = True
+            state = nxt
+        self._terminal[state] = pattern
+
+    def _build_links(self):
+        """Calcule les liens d'échec (BFS par profondeur croissante)."""
+        order = sorted(range(1, len(self._parent)), key=self._depth.__getitem__)
+        for state in order:
+            parent, tid = self._parent[state], self._token[state]
+            if parent == 0:
+                self._fail[state] = 0
+            else:
+                f = self._fail[parent]
+                while f and ((f << 32) | tid) not in self._next:
+                    f = self._fail[f]
+                self._fail[state] = self._next.get((f << 32) | tid, 0)
+
+            f = self._fail[state]
+            self._out_link[state] = f if f in self._terminal else self._out_link[f]
+        self._dirty = False
+
+    # --- Recherche ---
+    def find(self, text: str) -> Set[str]:
+        """Retourne les fichiers dont un titre/alias apparaît dans le texte."""
+        if self._dirty:
+            self._build_links()
+
+        found: Set[str] = set()
+        state = 0
+        for token in self.tokenize(text):
+            tid = self._vocab.get(token)
+            if tid is None:
+                state = 0
+                continue
+
+            while state and ((state << 32) | tid) not in self._next:
+                state = self._fail[state]
+            state = self._next.get((state << 32) | tid, 0)
+
+            s = state if state in self._terminal else self._out_link[state]
+            while s:
+                owners = self._patterns.get(self._terminal[s])
+                if owners:
+                    found.update(owners)
+                s = self._out_link[s]
+        return found
@@ -1,33 +1,249 @@
 import math
-from dataclasses import dataclass
-from typing import Set
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, FrozenSet, Iterable, List
 from datetime import datetime
 from pathlib import Path
 
 # MIGRATION CONFIG
 from core.settings import settings
 
-@dataclass
+
+class SymbolTable:
+    """
+    Table d'internement : chaque chaîne distincte (tag, cible de lien, dossier)
+    n'est stockée qu'une fois et les nœuds ne gardent que son ID entier.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+
+    def __len__(self):
+        return len(self.names)
+
+
+# Tables partagées par tous les nœuds du processus
+TAGS = SymbolTable()
+LINK_TARGETS = SymbolTable()
+FOLDERS = SymbolTable()
+
+def tags_from_ids(ids: Iterable[int]) -> FrozenSet[str]:
+    names = TAGS.names
+    return frozenset(names[i] for i in ids)
+
+
+_NO_TAGS = array("i")
+_NO_LINKS = array("i")
+_NO_ALIASES = ()
+
+
 class GraphNode:
-    full_path: Path
-    filename: str
-    uid: str
-    title: str
-    tags: Set[str]
-    links: Set[str]
-    base_weight: float
-    date_updated: datetime
-
-    # Runtime
-    activation: float = 0.0
-    consecutive_activations: int = 0
-    _static_score: float = 0.0
-
-    def __post_init__(self):
+    """
+    Nœud du graphe (ADR-019 / ADR-022), en représentation compacte :
+      - attributs en __slots__ (pas de __dict__ par nœud)
+      - tags internés, stockés en petit tableau trié d'entiers (TAGS)
+      - liens bruts internés, stockés en tableau d'entiers (LINK_TARGETS)
+      - chemin relatif au Vault (dossier interné + nom de fichier)
+      - date de mise à jour en timestamp
+    `tags`, `links`, `full_path` et `date_updated` restent lisibles comme avant ;
+    les tags se modifient via add_tag()/remove_tag().
+    """
+
+    __slots__ = (
+        "filename", "uid", "title", "base_weight",
+        "_folder", "_tag_ids", "_link_ids", "_aliases", "_updated",
+        # Runtime
+        # Tant que le nœud n'est pas rattaché au moteur vectoriel (ActivationEngine),
+        # l'état dynamique vit dans ces champs locaux. Une fois rattaché, le nœud
+        # n'est plus qu'une "vue" sur les tableaux NumPy du moteur.
+        "_activation", "_consecutive_activations", "_static", "_engine", "_index"
+    )
+
+    def __init__(self, full_path: Path, filename: str, uid: str, title: str,
+                 tags: Iterable[str], links: Iterable[str], base_weight: float,
+                 date_updated: datetime, aliases: Iterable[str] = ()):
+        self.filename = filename
+        self.uid = uid
+        self.title = title
+        self.base_weight = base_weight
+        self.full_path = full_path
+        self.tags = tags
+        self.links = links
+        self.aliases = aliases
+        self.date_updated = date_updated
+
+        self._activation = 0.0
+        self._consecutive_activations = 0
+        self._static = 0.0
+        self._engine: Any = None
+        self._index = -1
         self._calculate_static_potential()
 
+    # --- Champs compacts ---
+    @property
+    def rel_path(self) -> str:
+        """Chemin relatif au Vault (posix), ou absolu si la note est hors du Vault."""
+        folder = FOLDERS.names[self._folder]
+        return f"{folder}/{self.filename}" if folder else self.filename
+
+    @property
+    def folder(self) -> str:
+        """Dossier de la note, relatif au Vault ("" à la racine)."""
+        return FOLDERS.names[self._folder]
+
+    @property
+    def full_path(self) -> Path:
+        return settings.OBSIDIAN_VAULT_PATH / self.rel_path
+
+    @full_path.setter
+    def full_path(self, value: Path):
+        value = Path(value)
+        try:
+            parent = value.parent.relative_to(settings.OBSIDIAN_VAULT_PATH).as_posix()
+        except ValueError:
+            parent = value.parent.as_posix()
+        self._folder = FOLDERS.intern("" if parent == "." else parent)
+
+    @property
+    def tags(self) -> FrozenSet[str]:
+        return tags_from_ids(self._tag_ids)
+
+    @tags.setter
+    def tags(self, value: Iterable[str]):
+        ids = sorted({TAGS.intern(tag) for tag in value})
+        self._tag_ids = array("i", ids) if ids else _NO_TAGS
+
+    @property
+    def tag_ids(self) -> array:
+        """IDs des tags (TAGS), triés. Jamais modifié sur place : add_tag/remove_tag le remplacent."""
+        return self._tag_ids
+
+    def has_tag(self, tag: str) -> bool:
+        symbol = TAGS.ids.get(tag)
+        if symbol is None:
+            return False
+        ids = self._tag_ids
+        i = bisect_left(ids, symbol)
+        return i < len(ids) and ids[i] == symbol
+
+    def add_tag(self, tag: str):
+        symbol = TAGS.intern(tag)
+        if symbol not in self._tag_ids:
+            self._tag_ids = array("i", sorted([*self._tag_ids, symbol]))
+
+    def remove_tag(self, tag: str):
+        symbol = TAGS.ids.get(tag)
+        if symbol is not None and symbol in self._tag_ids:
+            self._tag_ids = array("i", [i for i in self._tag_ids if i != symbol]) or _NO_TAGS
+
+    @property
+    def links(self) -> FrozenSet[str]:
+        names = LINK_TARGETS.names
+        return frozenset(names[i] for i in self._link_ids)
+
+    @links.setter
+    def links(self, value: Iterable[str]):
+        ids = sorted({LINK_TARGETS.intern(target) for target in value})
+        self._link_ids = array("i", ids) if ids else _NO_LINKS
+
+    @property
+    def link_count(self) -> int:
+        """Nombre de liens bruts (sans construire l'ensemble des noms)."""
+        return len(self._link_ids)
+
+    @property
+    def aliases(self) -> FrozenSet[str]:
+        return frozenset(self._aliases)
+
+    @aliases.setter
+    def aliases(self, value: Iterable[str]):
+        self._aliases = tuple(sorted(value)) or _NO_ALIASES
+
+    @property
+    def date_updated(self) -> datetime:
+        return datetime.fromtimestamp(self._updated)
+
+    @date_updated.setter
+    def date_updated(self, value: datetime):
+        self._updated = value.timestamp()
+
+    @property
+    def updated_ts(self) -> float:
+        """date_updated en timestamp (sans construire de datetime)."""
+        return self._updated
+
+    # --- Vue sur le moteur (ADR-022) ---
+    def bind(self, engine, index: int):
+        """Rattache le nœud à la ligne `index` des tableaux du moteur."""
+        self._engine = engine
+        self._index = index
+
+    def unbind(self):
+        """Détache le nœud du moteur en recopiant son état dans les champs locaux."""
+        if self._engine is not None:
+            self._activation = self.activation
+            self._consecutive_activations = self.consecutive_activations
+            self._static = self._static_score
+        self._engine = None
+        self._index = -1
+
+    @property
+    def activation(self) -> float:
+        if self._engine is None:
+            return self._activation
+        self._engine.sync_one(self._index)
+        return float(self._engine.activation[self._index])
+
+    @activation.setter
+    def activation(self, value: float):
+        if self._engine is None:
+            self._activation = value
+        else:
+            self._engine.sync_one(self._index)
+            self._engine.activation[self._index] = value
+            self._engine.touch(self._index)
+
+    @property
+    def consecutive_activations(self) -> int:
+        if self._engine is None:
+            return self._consecutive_activations
+        self._engine.sync_one(self._index)
+        return int(self._engine.fatigue[self._index])
+
+    @consecutive_activations.setter
+    def consecutive_activations(self, value: int):
+        if self._engine is None:
+            self._consecutive_activations = value
+        else:
+            self._engine.sync_one(self._index)
+            self._engine.fatigue[self._index] = value
+            self._engine.touch(self._index)
+
+    @property
+    def _static_score(self) -> float:
+        if self._engine is None:
+            return self._static
+        return float(self._engine.static_score[self._index])
+
+    @_static_score.setter
+    def _static_score(self, value: float):
+        if self._engine is None:
+            self._static = value
+        else:
+            self._engine.static_score[self._index] = value
+            self._engine.static_version += 1
+
     def _calculate_static_potential(self):
-        n_links = len(self.links)
+        n_links = self.link_count
         s_score = settings.COEF_STRUCTURE * math.log(1 + n_links)
 
         age_days = (datetime.now() - self.date_updated).days
@@ -67,5 +283,8 @@ class GraphNode:
         if self.consecutive_activations > 0:
             self.consecutive_activations -= 1
 
+    def __repr__(self):
+        return f"GraphNode(filename={self.filename!r}, title={self.title!r}, links={self.link_count})"
+
     def __hash__(self):
-        return hash(self.filename)
\ No newline at end of file
+        return hash(self.filename)
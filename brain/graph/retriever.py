@@ -0,0 +1,174 @@
+import time
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from core.settings import settings
+from brain.graph.engine import ActivationEngine
+
+# Vecteur PPR creux d'une graine : (IDs des nœuds, scores)
+SparseScores = Tuple[np.ndarray, np.ndarray]
+
+
+class GraphRetriever:
+    """
+    Récupération des notes liées à une requête (intention [READ]) par
+    PageRank personnalisé sur le graphe des liens résolus (sortants + entrants).
+    - Itérations de puissance creuses : seule la frontière atteinte (nœuds de
+      score non nul) et ses voisins sont parcourus, arrêt anticipé quand le delta L1
+      passe sous RETRIEVAL_TOLERANCE ou quand le budget de latence est épuisé.
+    - Le PPR est linéaire en la distribution de départ : le vecteur de chaque
+      graine est calculé seul et mis en cache (tronqué), une requête à plusieurs
+      graines n'est qu'une somme pondérée de vecteurs déjà connus.
+    Le cache est invalidé dès que l'adjacence du moteur change (structure_version).
+    """
+
+    def __init__(self, engine: ActivationEngine):
+        self.engine = engine
+        self.alpha = settings.RETRIEVAL_ALPHA
+        self.tolerance = settings.RETRIEVAL_TOLERANCE
+        self.max_iterations = settings.RETRIEVAL_MAX_ITERATIONS
+        self.prune = settings.RETRIEVAL_PRUNE_EPSILON
+        self.budget = settings.RETRIEVAL_BUDGET_MS / 1000.0
+        self.cache_size = settings.RETRIEVAL_CACHE_SIZE
+        self.cache_entries = settings.RETRIEVAL_CACHE_ENTRIES
+
+        self._cache: "OrderedDict[int, SparseScores]" = OrderedDict()
+        self._version = -1
+        # Adjacence symétrique (CSR) et degrés, recalculés quand le graphe change
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._neighbors = np.zeros(0, dtype=np.int32)
+        self._inv_degree = np.zeros(0, dtype=np.float64)
+        # Tampons de l'itération (taille n, nuls entre deux appels ; appelé sous graph.lock)
+        self._x = np.zeros(0, dtype=np.float64)
+        self._nxt = np.zeros(0, dtype=np.float64)
+
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+        self.last_ms = 0.0
+
+    def _refresh(self):
+        engine = self.engine
+        if self._version == engine.structure_version:
+            return
+        n = len(engine)
+        src = np.concatenate([engine._edge_src, engine.indices]).astype(np.int64)
+        dst = np.concatenate([engine.indices, engine._edge_src]).astype(np.int32)
+        order = np.argsort(src, kind="stable")
+        degree = np.bincount(src, minlength=n)
+        self._indptr = np.concatenate([[0], np.cumsum(degree)]).astype(np.int64)
+        self._neighbors = dst[order]
+        self._inv_degree = np.divide(1.0, degree, out=np.zeros(n), where=degree > 0)
+        self._x = np.zeros(n)
+        self._nxt = np.zeros(n)
+        self._cache.clear()
+        self._version = engine.structure_version
+
+    # --- API ---
+    def query(self, seeds: Dict[int, float], k: Optional[int] = None,
+              exclude_seeds: bool = False) -> List[Tuple[int, float]]:
+        """
+        Top-k (ID, score) du PageRank personnalisé depuis `seeds` (ID -> poids).
+        Les graines non encore en cache sont calculées dans la limite du budget ;
+        au-delà, la réponse est construite avec les graines déjà résolues.
+        """
+        started = time.perf_counter()
+        self._refresh()
+        k = k or settings.RETRIEVAL_TOP_K
+        seeds = {i: w for i, w in seeds.items() if 0 <= i < len(self.engine) and w > 0}
+        if not seeds:
+            return []
+        deadline = started + self.budget
+        total = sum(seeds.values())
+
+        scores: Dict[int, float] = {}
+        for seed, weight in sorted(seeds.items(), key=lambda item: -item[1]):
+            vector = self._seed_vector(seed, deadline)
+            if vector is None:
+                break  # Budget épuisé
+            for i, s in zip(*(part.tolist() for part in vector)):
+                scores[i] = scores.get(i, 0.0) + s * weight / total
+
+        if exclude_seeds:
+            for seed in seeds:
+                scores.pop(seed, None)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        self.last_ms = (time.perf_counter() - started) * 1000.0
+        return ranked
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses,
+                "cached": len(self._cache), "last_ms": round(self.last_ms, 2)}
+
+    # --- PPR d'une graine ---
+    def _seed_vector(self, seed: int, deadline: float) -> Optional[SparseScores]:
+        cached = self._cache.get(seed)
+        if cached is not None:
+            self._cache.move_to_end(seed)
+            self.hits += 1
+            return cached
+        if time.perf_counter() > deadline:
+            return None
+        self.misses += 1
+
+        vector, converged = self._power_iteration(seed, deadline)
+        if converged:
+            self._cache[seed] = vector
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def _power_iteration(self, seed: int, deadline: float) -> Tuple[SparseScores, bool]:
+        """
+        x <- alpha * e_seed + (1 - alpha) * P^T x, avec P la marche aléatoire
+        sur le graphe non orienté. La masse des nœuds sans lien retourne à la graine.
+        Chaque itération ne touche que la frontière et ses voisins (tampons de taille n
+        réutilisés, remis à zéro sur ces seuls indices), et la frontière est élaguée sous
+        RETRIEVAL_PRUNE_EPSILON : le coût ne dépend plus de la taille du Vault.
+        Retourne le vecteur tronqué aux RETRIEVAL_CACHE_ENTRIES premiers scores.
+        """
+        alpha = self.alpha
+        indptr, neighbors, inv_degree = self._indptr, self._neighbors, self._inv_degree
+        x, nxt = self._x, self._nxt
+
+        frontier = np.array([seed], dtype=np.int64)
+        x[seed] = 1.0
+        converged = False
+        try:
+            for _ in range(self.max_iterations):
+                starts = indptr[frontier]
+                counts = indptr[frontier + 1] - starts
+                # Positions des voisins de la frontière dans `neighbors` (cf. ActivationEngine.propagate)
+                edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+                share = x[frontier] * inv_degree[frontier] * (1.0 - alpha)
+                targets = neighbors[edges]
+
+                np.add.at(nxt, targets, np.repeat(share, counts))
+                stranded = x[frontier[counts == 0]].sum()
+                nxt[seed] += alpha + (1.0 - alpha) * stranded
+
+                # Seuls la frontière, ses voisins et la graine peuvent avoir changé.
+                # Les scores sous RETRIEVAL_PRUNE_EPSILON sont abandonnés : au plus 2/epsilon
+                # nœuds restent dans la frontière, quelle que soit la taille du Vault.
+                # Hystérésis (un nœud déjà présent ne sort que sous epsilon/2) : sans elle,
+                # les scores proches du seuil entrent et sortent à chaque itération.
+                touched = np.unique(np.concatenate([frontier, targets, [seed]]))
+                values = nxt[touched]
+                values[values < np.where(x[touched] != 0.0, 0.5 * self.prune, self.prune)] = 0.0
+                delta = np.abs(values - x[touched]).sum()
+                x[frontier] = 0.0
+                x[touched] = values
+                nxt[touched] = 0.0
+                frontier = touched[values != 0.0]
+                if delta < self.tolerance:
+                    converged = True
+                    break
+                if time.perf_counter() > deadline:
+                    break
+
+            keep = min(self.cache_entries, frontier.size)
+            top = frontier[np.argpartition(-x[frontier], keep - 1)[:keep]] if keep < frontier.size else frontier
+            return (top, x[top].copy()), converged
+        finally:
+            x[frontier] = 0.0  # Tampons rendus nuls pour la graine suivante
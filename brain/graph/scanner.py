@@ -1,12 +1,15 @@
 import os
 import re
-import yaml
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Iterator, List, Tuple
 
 from core.settings import settings
 from brain.graph.node import GraphNode
+from brain.graph.frontmatter import parse_frontmatter
 
 
 class VaultScanner:
@@ -14,14 +17,30 @@ class VaultScanner:
     Implémente ADR-019 (Phase 1 : Chargement).
     Lit le Frontmatter et les Wikilinks pour permettre à GraphNode
     de calculer le Poids Statique (ADR-022).
+
+    Scan incrémental : un manifeste (LOGS_DIR/vault_manifest.json) mémorise
+    pour chaque fichier (mtime, taille, hash, champs parsés). Au démarrage,
+    seuls les fichiers nouveaux ou modifiés sont relus et re-parsés.
     """
 
     LINK_PATTERN = re.compile(r'\[\[(.*?)\]\]')
     FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+    MANIFEST_VERSION = 2  # 2 : notes CRLF re-parsées (frontmatter perdu en version 1)
+    # Parsing parallèle (ProcessPool) : taille des lots et seuil de déclenchement
+    BATCH_SIZE = 256
+    PARALLEL_MIN_FILES = 1000
+
+    def __init__(self):
+        self.vault_path = settings.OBSIDIAN_VAULT_PATH
+        self.manifest_file = settings.LOGS_DIR / "vault_manifest.json"
+        # Chemin relatif (posix) -> {"mtime", "size", "hash", "node"}
+        self.manifest: Dict[str, dict] = {}
+        # Modifié depuis la dernière écriture (mises à jour unitaires) : écrit par flush_manifest()
+        self.manifest_dirty = False
 
     def scan_vault(self) -> Dict[str, GraphNode]:
         nodes = {}
-        vault_path = settings.OBSIDIAN_VAULT_PATH
+        vault_path = self.vault_path
 
         if not vault_path.exists():
             print(f"[Scanner] ⚠️ Dossier introuvable : {vault_path}")
@@ -29,36 +48,173 @@ class VaultScanner:
 
         print(f"[Scanner] 📂 Extraction des métadonnées (S, C, T)...")
 
-        for root, _, files in os.walk(vault_path):
-            for file in files:
-                if file.endswith(".md"):
-                    try:
-                        node = self._parse_file(Path(root) / file, file)
-                        if node:
-                            nodes[node.filename] = node
-                    except Exception:
-                        pass  # On ignore silencieusement les fichiers corrompus
+        previous = self._load_manifest()
+        self.manifest = {}
+        records = []  # (chemin, record)
+        stale = []    # Fichiers nouveaux ou modifiés : (chemin, rel, entrée en cache)
+
+        for entry in self._iter_markdown(vault_path):
+            rel_path = Path(entry.path).relative_to(vault_path).as_posix()
+            cached = previous.get(rel_path)
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+                self.manifest[rel_path] = cached
+                records.append((entry.path, cached["node"]))
+            else:
+                stale.append((entry.path, rel_path, cached))
+
+        parsed = 0
+        for path, rel_path, cached, manifest_entry, was_parsed in self._load_stale(stale):
+            if manifest_entry is None:
+                continue  # On ignore silencieusement les fichiers corrompus
+            if not was_parsed:
+                manifest_entry["node"] = cached["node"]  # Contenu identique (hash)
+            parsed += was_parsed
+            self.manifest[rel_path] = manifest_entry
+            records.append((path, manifest_entry["node"]))
 
+        for path, record in records:
+            try:
+                node = self._build_node(Path(path), record)
+                if node:
+                    nodes[node.filename] = node
+            except Exception:
+                pass
+
+        # Les fichiers supprimés disparaissent du manifeste (non revus ci-dessus)
+        if parsed or len(previous) != len(self.manifest):
+            self.save_manifest()
+
+        print(f"[Scanner] {len(nodes)} notes ({parsed} parsées, {len(nodes) - parsed} depuis le cache).")
         return nodes
 
+    def _load_stale(self, stale: List[tuple]) -> Iterator[tuple]:
+        """
+        Relit (et re-parse si le hash a changé) les fichiers périmés.
+        Au-delà de PARALLEL_MIN_FILES, le travail est réparti par lots sur un pool de processus.
+        """
+        jobs = [(path, cached["hash"] if cached else None) for path, _, cached in stale]
+        workers = settings.SCANNER_WORKERS or os.cpu_count() or 1
+
+        if workers > 1 and len(jobs) >= self.PARALLEL_MIN_FILES:
+            batches = [jobs[i:i + self.BATCH_SIZE] for i in range(0, len(jobs), self.BATCH_SIZE)]
+            print(f"[Scanner] ⚙️ Parsing parallèle : {len(jobs)} fichiers, {workers} processus.")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [r for batch in pool.map(_load_batch, batches) for r in batch]
+        else:
+            results = _load_batch(jobs)
+
+        for (path, rel_path, cached), (manifest_entry, was_parsed) in zip(stale, results):
+            yield path, rel_path, cached, manifest_entry, was_parsed
+
+    # --- Mise à jour unitaire (fichier créé/modifié/supprimé) ---
+    def refresh_file(self, full_path: Path) -> Optional[GraphNode]:
+        """Re-parse un seul fichier si nécessaire et met à jour le manifeste."""
+        rel_path = full_path.relative_to(self.vault_path).as_posix()
+        cached = self.manifest.get(rel_path)
+        manifest_entry, was_parsed = _load_entry(str(full_path), cached["hash"] if cached else None)
+        if manifest_entry is None:
+            raise OSError(f"Lecture impossible : {full_path}")
+        if not was_parsed:
+            manifest_entry["node"] = cached["node"]
+        self.manifest[rel_path] = manifest_entry
+        self.manifest_dirty = True
+        return self._build_node(full_path, manifest_entry["node"])
+
+    def forget_file(self, full_path: Path):
+        rel_path = full_path.relative_to(self.vault_path).as_posix()
+        if self.manifest.pop(rel_path, None) is not None:
+            self.manifest_dirty = True
+
+    def files_under(self, path: Path) -> List[Tuple[str, str]]:
+        """(chemin relatif, nom de fichier) des notes connues situées à `path` ou dans ce dossier."""
+        try:
+            rel = path.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return []
+        prefix = rel + "/"
+        return [(key, entry["node"]["filename"]) for key, entry in self.manifest.items()
+                if (key == rel or key.startswith(prefix)) and entry.get("node")]
+
+    # --- Manifeste ---
+    def _load_manifest(self) -> Dict[str, dict]:
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.MANIFEST_VERSION or data.get("vault") != str(self.vault_path):
+                return {}
+            return data.get("files", {})
+        except Exception:
+            return {}
+
+    def flush_manifest(self):
+        """Écrit le manifeste s'il a changé (appelé avec la sauvegarde périodique de l'état, pas à chaque édition)."""
+        if self.manifest_dirty:
+            self.save_manifest()
+
+    def save_manifest(self):
+        data = {
+            "version": self.MANIFEST_VERSION,
+            "vault": str(self.vault_path),
+            "files": self.manifest
+        }
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.manifest_file)
+            self.manifest_dirty = False
+        except Exception as e:
+            print(f"[Scanner] ⚠️ Manifeste non sauvegardé : {e}")
+
+    @staticmethod
+    def _iter_markdown(directory: Path) -> Iterator[os.DirEntry]:
+        # os.scandir : sous Windows, stat() est fourni gratuitement par l'énumération
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            yield entry
+            except OSError:
+                continue
+
+    # --- Parsing ---
     def _parse_file(self, full_path: Path, filename: str) -> GraphNode:
         with open(full_path, "r", encoding="utf-8") as f:
             content = f.read()
+        return self._build_node(full_path, self._parse_record(content, filename))
 
+    def _parse_record(self, content: str, filename: str) -> dict:
+        """Extrait les champs persistants d'une note (sérialisables en JSON)."""
         # 1. Parsing YAML (Pour Récence C et Maturité T)
+        # Chemin rapide pour les clés usuelles, repli sur PyYAML sinon
         meta = {}
         fm_match = self.FRONTMATTER_PATTERN.match(content)
         if fm_match:
-            try:
-                meta = yaml.safe_load(fm_match.group(1)) or {}
-            except yaml.YAMLError:
-                pass
+            meta = parse_frontmatter(fm_match.group(1))
 
         title = meta.get("title", filename.replace(".md", ""))
         tags = set(meta.get("tags", []))
 
+        # Alias Obsidian (liste ou chaîne unique)
+        aliases = meta.get("aliases") or []
+        if isinstance(aliases, str):
+            aliases = [aliases]
+        aliases = {str(a) for a in aliases if a}
+
         # Gestion Date (Récence C)
-        date_updated = datetime.now()
+        # Sans date exploitable, la note est considérée "fraîche" à chaque chargement
+        date_updated = None
         if "date_updated" in meta:
             d = meta["date_updated"]
             if isinstance(d, (datetime, str)):
@@ -81,14 +237,67 @@ class VaultScanner:
             if not target.endswith(".md"): target += ".md"
             links.add(target)
 
+        return {
+            "filename": filename,
+            "uid": str(meta.get("uid", "")),
+            "title": str(title),
+            "tags": sorted(str(t) for t in tags),
+            "aliases": sorted(aliases),
+            "links": sorted(links),
+            "base_weight": base_weight,
+            "date_updated": date_updated.isoformat() if date_updated else None
+        }
+
+    @staticmethod
+    def _build_node(full_path: Path, record: Optional[dict]) -> Optional[GraphNode]:
+        if not record:
+            return None
+
+        date_updated = datetime.now()
+        if record["date_updated"]:
+            date_updated = datetime.fromisoformat(record["date_updated"])
+
         # GraphNode calculera lui-même son _static_score dans __post_init__
         return GraphNode(
             full_path=full_path,
-            filename=filename,
-            uid=str(meta.get("uid", "")),
-            title=title,
-            tags=tags,
-            links=links,
-            base_weight=base_weight,
-            date_updated=date_updated
-        )
\ No newline at end of file
+            filename=record["filename"],
+            uid=record["uid"],
+            title=record["title"],
+            tags=record["tags"],
+            links=record["links"],
+            base_weight=record["base_weight"],
+            date_updated=date_updated,
+            aliases=record["aliases"]
+        )
+
+
+# --- Workers (fonctions de module : sérialisables pour le ProcessPool) ---
+def _load_entry(path: str, known_hash: Optional[str]) -> Tuple[Optional[dict], bool]:
+    """
+    Lit un fichier et retourne (entrée du manifeste, parsé ?).
+    Si le hash est inchangé, le parsing est évité (le record est repris du cache par l'appelant).
+    """
+    try:
+        stat = os.stat(path)
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+        record, was_parsed = None, False
+        if digest != known_hash:
+            # Fins de ligne normalisées comme en mode texte (notes CRLF enregistrées sous Windows)
+            text = raw.decode("utf-8").replace("\r\n", "\n")
+            record, was_parsed = VaultScanner()._parse_record(text, os.path.basename(path)), True
+
+        return {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "hash": digest,
+            "node": record
+        }, was_parsed
+    except Exception:
+        return None, False
+
+
+def _load_batch(jobs: List[Tuple[str, Optional[str]]]) -> List[Tuple[Optional[dict], bool]]:
+    return [_load_entry(path, known_hash) for path, known_hash in jobs]
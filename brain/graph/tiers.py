@@ -0,0 +1,345 @@
+import mmap
+import struct
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from core.settings import settings
+from brain.graph.node import GraphNode
+
+DAY_SECONDS = 86400.0
+
+
+class ColdStore:
+    """
+    Enregistrements minimaux des nœuds froids, en ajout seul dans un fichier lu par mmap.
+    Un enregistrement : en-tête binaire (date_updated, poids, taille) puis les champs texte
+    (chemin relatif, uid, titre, tags, liens, alias) séparés par des caractères de contrôle.
+    Un nœud redescendu sans modification réutilise son enregistrement ; sinon un nouveau
+    est ajouté et l'ancien devient mort (compaction quand les morts dominent).
+    """
+
+    HEADER = struct.Struct("<ddI")  # date_updated (timestamp), base_weight, taille des champs
+    FIELD_SEP = "\x1f"
+    LIST_SEP = "\x1e"
+    COMPACT_MIN_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self.size = 0
+        self.dead = 0
+
+    def reset(self):
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w+b")
+        self.size = 0
+        self.dead = 0
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @classmethod
+    def encode(cls, node: GraphNode) -> bytes:
+        sep = cls.LIST_SEP
+        text = cls.FIELD_SEP.join((
+            node.rel_path, node.uid, node.title,
+            sep.join(sorted(node.tags)), sep.join(sorted(node.links)), sep.join(sorted(node.aliases))
+        )).encode("utf-8")
+        return cls.HEADER.pack(node.updated_ts, node.base_weight, len(text)) + text
+
+    def put(self, record: bytes) -> int:
+        """Ajoute un enregistrement ; retourne son offset."""
+        offset = self.size
+        self._file.seek(offset)
+        self._file.write(record)
+        self.size += len(record)
+        return offset
+
+    def _view(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            # Des enregistrements ont été ajoutés depuis le dernier mappage
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    def record_size(self, offset: int) -> int:
+        _, _, length = self.HEADER.unpack(self._view(offset, self.HEADER.size))
+        return self.HEADER.size + length
+
+    def matches(self, offset: int, record: bytes) -> bool:
+        return self._view(offset, len(record)) == record
+
+    def rel_path(self, offset: int) -> str:
+        _, _, length = self.HEADER.unpack(self._view(offset, self.HEADER.size))
+        text = self._view(offset + self.HEADER.size, length).decode("utf-8")
+        return text.split(self.FIELD_SEP, 1)[0]
+
+    def get(self, offset: int) -> GraphNode:
+        updated, base_weight, length = self.HEADER.unpack(self._view(offset, self.HEADER.size))
+        text = self._view(offset + self.HEADER.size, length).decode("utf-8")
+        rel_path, uid, title, tags, links, aliases = text.split(self.FIELD_SEP)
+        split = lambda value: value.split(self.LIST_SEP) if value else ()
+        return GraphNode(
+            full_path=settings.OBSIDIAN_VAULT_PATH / rel_path,
+            filename=rel_path.rsplit("/", 1)[-1],
+            uid=uid,
+            title=title,
+            tags=split(tags),
+            links=split(links),
+            base_weight=base_weight,
+            date_updated=datetime.fromtimestamp(updated),
+            aliases=split(aliases)
+        )
+
+
+class ReadOnlyNode(GraphNode):
+    """
+    Copie d'un nœud froid rendue par TieredNodeStore.peek() : elle n'appartient pas au
+    niveau chaud, une écriture serait perdue. Toute affectation lève donc AttributeError ;
+    pour modifier la note, passer par store[fname] (promotion).
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Nœud froid en lecture seule ({self.filename}) : utiliser store[fname] pour le modifier")
+
+
+class NodeStore(dict):
+    """
+    Nœuds du graphe sans niveaux (GRAPH_TIERING_ENABLED=False) : un simple dict, sans
+    ColdStore ni comptabilité LRU, qui expose la même interface que TieredNodeStore
+    (tous les nœuds sont chauds ; promotion et rétrogradation ne font rien).
+    """
+
+    tiered = False
+
+    @property
+    def hot(self) -> "NodeStore":
+        return self
+
+    def peek(self, fname: str) -> Optional[GraphNode]:
+        return self.get(fname)
+
+    def rel_path(self, fname: str) -> Optional[str]:
+        node = self.get(fname)
+        return node.rel_path if node is not None else None
+
+    def is_cold(self, fname: str) -> bool:
+        return False
+
+    def promote(self, filenames: Iterable[str]):
+        pass
+
+    def demote(self, filenames: Iterable[str]):
+        pass
+
+    def demote_cold(self, now: float):
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"hot": len(self), "cold": 0, "promotions": 0, "demotions": 0, "cold_bytes": 0}
+
+    def close(self):
+        pass
+
+
+class TieredNodeStore(MutableMapping):
+    """
+    Nœuds du graphe en deux niveaux (Vaults de très grande taille) :
+      - niveau chaud : GraphNode complets, rattachés au moteur (notes récentes, mûres ou actives)
+      - niveau froid : simple offset vers un enregistrement de ColdStore (mmap)
+    Le moteur (ActivationEngine) garde une ligne pour chaque note : la propagation et
+    l'oubli ne dépendent pas du niveau. Un nœud froid est promu à la première lecture
+    (store[fname] : stimulus, propagation, Dashboard...) et les nœuds chauds les moins
+    récemment utilisés redescendent au-delà de GRAPH_HOT_CAPACITY.
+    `in`, `len` et l'itération sur les noms ne promeuvent rien ; peek() lit un nœud
+    froid sans le promouvoir (ReadOnlyNode : copie en lecture seule).
+    """
+
+    tiered = True
+
+    def __init__(self, engine, nodes: Dict[str, GraphNode], path: Path, capacity: int):
+        self.engine = engine
+        self.capacity = capacity
+        self.hot: "OrderedDict[str, GraphNode]" = OrderedDict(nodes)
+        # Nom de fichier -> offset dans le ColdStore
+        self.cold: Dict[str, int] = {}
+        # Offset de l'enregistrement d'un nœud chaud déjà écrit (réutilisé s'il n'a pas changé)
+        self._records: Dict[str, int] = {}
+        self.store = ColdStore(path)
+        self.store.reset()
+
+        # Statistiques
+        self.promotions = 0
+        self.demotions = 0
+
+    # --- Mapping ---
+    def __getitem__(self, fname: str) -> GraphNode:
+        node = self.hot.get(fname)
+        if node is not None:
+            self.hot.move_to_end(fname)
+            return node
+        offset = self.cold.get(fname)
+        if offset is None:
+            raise KeyError(fname)
+        return self._promote(fname, offset)
+
+    def __setitem__(self, fname: str, node: GraphNode):
+        self._forget(fname)
+        self.hot[fname] = node
+        self._evict()
+
+    def __delitem__(self, fname: str):
+        if fname not in self.hot and fname not in self.cold:
+            raise KeyError(fname)
+        self.hot.pop(fname, None)
+        self._forget(fname)
+
+    def __contains__(self, fname) -> bool:
+        return fname in self.hot or fname in self.cold
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self.hot)
+        yield from list(self.cold)
+
+    def __len__(self) -> int:
+        return len(self.hot) + len(self.cold)
+
+    # --- Accès sans promotion ---
+    def peek(self, fname: str) -> Optional[GraphNode]:
+        """
+        Lecture sans promotion. LECTURE SEULE : un nœud froid est rendu sous forme de
+        ReadOnlyNode (toute écriture lève AttributeError) ; pour modifier, store[fname].
+        """
+        node = self.hot.get(fname)
+        if node is not None:
+            return node
+        offset = self.cold.get(fname)
+        if offset is None:
+            return None
+        node = self.store.get(offset)
+        node.bind(self.engine, self.engine.index[fname])
+        node.__class__ = ReadOnlyNode
+        return node
+
+    def rel_path(self, fname: str) -> Optional[str]:
+        node = self.hot.get(fname)
+        if node is not None:
+            return node.rel_path
+        offset = self.cold.get(fname)
+        return self.store.rel_path(offset) if offset is not None else None
+
+    def is_cold(self, fname: str) -> bool:
+        return fname in self.cold
+
+    # --- Niveaux ---
+    def promote(self, filenames: Iterable[str]):
+        for fname in filenames:
+            offset = self.cold.get(fname)
+            if offset is not None:
+                self._promote(fname, offset)
+
+    def demote(self, filenames: Iterable[str]):
+        for fname in filenames:
+            node = self.hot.pop(fname, None)
+            if node is not None:
+                self._demote(fname, node)
+        self._maybe_compact()
+
+    def demote_cold(self, now: float):
+        """
+        Répartition initiale : restent chauds les nœuds actifs (activation ou fatigue),
+        récents (moins de GRAPH_HOT_RECENT_DAYS) ou mûrs (multiplicateur de maturité >= 1),
+        dans la limite de GRAPH_HOT_CAPACITY (par poids statique décroissant).
+        """
+        engine = self.engine
+        recent = now - settings.GRAPH_HOT_RECENT_DAYS * DAY_SECONDS
+        mature = {tag for tag, mult in settings.COEF_MATURITY.items() if mult >= 1.0}
+
+        keep = []
+        for fname, node in self.hot.items():
+            i = node._index
+            if (i in engine.active or node.updated_ts >= recent
+                    or any(node.has_tag(tag) for tag in mature)):
+                keep.append((-engine.static_score[i], fname))
+        keep = {fname for _, fname in sorted(keep)[:self.capacity]}
+
+        self.demote([fname for fname in self.hot if fname not in keep])
+        print(f"[Graph] 🧊 Niveaux : {len(self.hot)} nœuds chauds, {len(self.cold)} froids "
+              f"({self.store.size / 1e6:.1f} Mo sur disque).")
+
+    def stats(self) -> Dict[str, int]:
+        return {"hot": len(self.hot), "cold": len(self.cold),
+                "promotions": self.promotions, "demotions": self.demotions,
+                "cold_bytes": self.store.size - self.store.dead}
+
+    def close(self):
+        self.store.close()
+
+    def _promote(self, fname: str, offset: int) -> GraphNode:
+        node = self.store.get(offset)
+        # Le moteur détient déjà l'état dynamique et le poids statique de la ligne
+        node.bind(self.engine, self.engine.index[fname])
+        del self.cold[fname]
+        self._records[fname] = offset
+        self.hot[fname] = node
+        self.promotions += 1
+        self._evict()
+        return node
+
+    def _demote(self, fname: str, node: GraphNode):
+        record = ColdStore.encode(node)
+        offset = self._records.pop(fname, None)
+        if offset is None or not self.store.matches(offset, record):
+            # Nœud modifié pendant son séjour au chaud (tags, liens...) : nouvel enregistrement
+            if offset is not None:
+                self.store.dead += self.store.record_size(offset)
+            offset = self.store.put(record)
+        self.cold[fname] = offset
+        self.demotions += 1
+
+    def _forget(self, fname: str):
+        offset = self.cold.pop(fname, None)
+        if offset is None:
+            offset = self._records.pop(fname, None)
+        else:
+            self._records.pop(fname, None)
+        if offset is not None:
+            self.store.dead += self.store.record_size(offset)
+
+    def _evict(self):
+        if len(self.hot) <= self.capacity:
+            return
+        # LRU : l'entrée la plus ancienne de l'OrderedDict est la moins récemment lue
+        while len(self.hot) > self.capacity:
+            fname, node = self.hot.popitem(last=False)
+            self._demote(fname, node)
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        store = self.store
+        if store.dead < store.COMPACT_MIN_BYTES or store.dead < store.size - store.dead:
+            return
+        # Réécriture des seuls enregistrements vivants (froids et chauds déjà écrits)
+        live = {fname: store._view(offset, store.record_size(offset))
+                for table in (self.cold, self._records) for fname, offset in table.items()}
+        store.reset()
+        for fname, record in live.items():
+            offset = store.put(record)
+            if fname in self.cold:
+                self.cold[fname] = offset
+            else:
+                self._records[fname] = offset
@@ -0,0 +1,42 @@
+import numpy as np
+
+from brain.graph.engine import ActivationEngine
+
+
+class TopKTracker:
+    """
+    Maintient le Top-K des nœuds par poids courant (ADR-022) sans trier tout le graphe.
+    Un nœud au repos (activation et fatigue nulles) pèse exactement son poids statique :
+    le classement statique n'est recalculé que lorsque ces poids changent, et seuls
+    les nœuds dynamiques (engine.active) sont réévalués à chaque appel.
+    """
+
+    def __init__(self, engine: ActivationEngine):
+        self.engine = engine
+        self._static_order = np.zeros(0, dtype=np.int64)
+        self._static_version = -1
+
+    def _refresh_static_order(self):
+        engine = self.engine
+        if self._static_version == engine.static_version and len(self._static_order) == len(engine):
+            return
+        # Tri (poids statique décroissant, ID croissant) : ordre stable du classement
+        self._static_order = np.lexsort((np.arange(len(engine)), -engine.static_score))
+        self._static_version = engine.static_version
+
+    def top(self, k: int) -> np.ndarray:
+        """IDs des k nœuds de plus fort poids courant, du plus lourd au plus léger."""
+        engine = self.engine
+        if len(engine) == 0:
+            return np.zeros(0, dtype=np.int64)
+        self._refresh_static_order()
+
+        # Parmi les nœuds au repos, seuls les (k + |actifs|) premiers statiques peuvent figurer
+        # au Top-K : au moins k nœuds au repos de poids supérieur ou égal précèdent tous les autres.
+        dynamic = np.fromiter(engine.active, dtype=np.int64, count=len(engine.active))
+        static_head = self._static_order[:k + len(dynamic)]
+        candidates = np.union1d(static_head, dynamic)
+
+        weights = engine.weights(candidates)
+        order = np.lexsort((candidates, -weights))[:k]
+        return candidates[order]
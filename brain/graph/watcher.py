@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class VaultWatcher:
+    """
+    Surveille le Vault Obsidian pendant la session (ADR-019 : "Runtime").
+    Un thread de fond collecte les chemins modifiés (inotify sous Linux,
+    sinon scrutation périodique) ; le Cerveau récupère via drain() les
+    chemins "calmes" depuis `debounce` secondes, pour ne re-parser qu'une fois
+    un fichier en cours d'édition.
+    """
+
+    # Masques inotify (cf. <sys/inotify.h>)
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_ISDIR = 0x40000000
+    IN_IGNORED = 0x00008000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, vault_path: Path, debounce: float = 1.0, poll_interval: float = 5.0):
+        self.vault_path = Path(vault_path)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        self._pending: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.backend = "inotify" if self._inotify_available() else "polling"
+
+    # --- API ---
+    def start(self):
+        if not self.vault_path.exists():
+            print(f"[Watcher] ⚠️ Vault introuvable, surveillance désactivée : {self.vault_path}")
+            return
+        target = self._run_inotify if self.backend == "inotify" else self._run_polling
+        self._thread = threading.Thread(target=target, name="VaultWatcher", daemon=True)
+        self._thread.start()
+        print(f"[Watcher] 👁️ Surveillance du Vault active ({self.backend}).")
+
+    def stop(self):
+        self._stop.set()
+
+    def drain(self) -> List[Path]:
+        """Retourne (et oublie) les chemins sans nouvel événement depuis `debounce` secondes."""
+        now = time.monotonic()
+        with self._lock:
+            ready = [p for p, t in self._pending.items() if now - t >= self.debounce]
+            for p in ready:
+                del self._pending[p]
+        return [Path(p) for p in ready]
+
+    def _touch(self, path: str):
+        with self._lock:
+            self._pending[path] = time.monotonic()
+
+    @staticmethod
+    def _is_relevant(name: str) -> bool:
+        return name.endswith(".md") and not name.startswith(".")
+
+    # --- Backend inotify (Linux) ---
+    @staticmethod
+    def _inotify_available() -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return False
+        return hasattr(ctypes.CDLL(libc_name), "inotify_init1")
+
+    def _run_inotify(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            print("[Watcher] ⚠️ inotify indisponible, repli sur la scrutation.")
+            self.backend = "polling"
+            return self._run_polling()
+
+        watches: Dict[int, str] = {}
+
+        def add_tree(root: str):
+            for directory, dirs, _ in os.walk(root):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                wd = libc.inotify_add_watch(fd, os.fsencode(directory), self.WATCH_MASK)
+                if wd >= 0:
+                    watches[wd] = directory
+
+        try:
+            add_tree(str(self.vault_path))
+            while not self._stop.is_set():
+                readable, _, _ = select.select([fd], [], [], 1.0)
+                if not readable:
+                    continue
+                buffer = os.read(fd, 64 * 1024)
+                for wd, mask, name in self._parse_events(buffer):
+                    directory = watches.get(wd)
+                    if directory is None:
+                        continue
+                    if mask & self.IN_IGNORED:
+                        watches.pop(wd, None)
+                        continue
+                    path = os.path.join(directory, name) if name else directory
+
+                    if mask & self.IN_ISDIR:
+                        # Dossier créé/déplacé : on le surveille et on signale son contenu.
+                        # Dossier supprimé/sorti : le Cerveau retire les notes qu'il contenait.
+                        if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                            add_tree(path)
+                        self._touch(path)
+                    elif name and self._is_relevant(name):
+                        if mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_MOVED_FROM | self.IN_DELETE):
+                            self._touch(path)
+        except Exception as e:
+            print(f"[Watcher] ❌ Erreur inotify : {e}")
+        finally:
+            os.close(fd)
+
+    def _parse_events(self, buffer: bytes) -> List[Tuple[int, int, str]]:
+        events = []
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    # --- Backend scrutation (Windows / macOS / repli) ---
+    def _snapshot(self) -> Dict[str, Tuple[float, int]]:
+        snapshot = {}
+        stack = [str(self.vault_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif self._is_relevant(entry.name):
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _run_polling(self):
+        previous = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            try:
+                current = self._snapshot()
+            except Exception as e:
+                print(f"[Watcher] ⚠️ Erreur scrutation : {e}")
+                continue
+            for path, signature in current.items():
+                if previous.get(path) != signature:
+                    self._touch(path)
+            for path in previous.keys() - current.keys():
+                self._touch(path)
+            previous = current
@@ -1,14 +1,29 @@
-import io
-import wave
+import time
+import threading
 import numpy as np
 from pathlib import Path
-from openai import OpenAI
 from core.settings import settings
+from brain.audio_encoding import AudioEncoder
+from brain.clients import shared_clients
 
 
 class InferenceClient:
-    def __init__(self):
-        self.client = OpenAI(base_url=settings.WHISPER_BASE_URL, api_key="not-needed")
+    def __init__(self, encoding: str = None):
+        self.encoder = AudioEncoder(encoding or settings.WHISPER_UPLOAD_ENCODING)
+        # Client partagé du registre : pool de connexions persistantes (ingestion par lots), sans re-handshake
+        self.client = shared_clients().openai(
+            settings.WHISPER_BASE_URL, api_key="not-needed",
+            max_connections=settings.WHISPER_MAX_CONNECTIONS,
+            timeout=settings.WHISPER_TIMEOUT_SECONDS,
+            keepalive_expiry=settings.WHISPER_KEEPALIVE_EXPIRY_SECONDS
+        )
+
+        # Statistiques d'envoi
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.audio_seconds = 0.0
+        self.round_trip_seconds = 0.0
 
     def warm_up(self, test_file_path: str = "test_segments/warmup.wav"):
         print("[STT] 🔥 Préchauffage du moteur Whisper...")
@@ -35,21 +50,21 @@ class InferenceClient:
 
     def process_audio(self, audio_data: np.ndarray, sample_rate: int):
         """Effectue une requête pour obtenir texte + locuteurs en forçant le Français."""
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes((audio_data * 32767).astype('int16').tobytes())
-        buffer.seek(0)
+        filename, content, content_type = self.encoder.encode(audio_data, sample_rate)
 
         try:
+            started = time.perf_counter()
             response = self.client.audio.transcriptions.create(
                 model=settings.WHISPER_MODEL,
-                file=("audio.wav", buffer),
+                file=(filename, content, content_type),
                 response_format="verbose_json",
                 language="fr"
             )
+            with self._lock:
+                self.requests += 1
+                self.bytes_sent += len(content)
+                self.audio_seconds += len(audio_data) / sample_rate
+                self.round_trip_seconds += time.perf_counter() - started
 
             text = response.text
             speakers = []
@@ -63,4 +78,14 @@ class InferenceClient:
 
         except Exception as e:
             print(f"[Inference] ❌ Erreur API : {e}")
-            return "", ["Utilisateur"]
\ No newline at end of file
+            return "", ["Utilisateur"]
+
+    def stats(self) -> dict:
+        """Octets envoyés et aller-retour moyen, rapportés à la seconde d'audio."""
+        audio = max(self.audio_seconds, 1e-9)
+        return {
+            "encoding": self.encoder.encoding,
+            "requests": self.requests,
+            "bytes_per_audio_second": round(self.bytes_sent / audio),
+            "rtt_ms_per_audio_second": round(1000 * self.round_trip_seconds / audio, 2)
+        }
\ No newline at end of file
@@ -0,0 +1,285 @@
+import json
+import time
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.settings import settings
+from brain.graph.matcher import fold_text
+
+INTENTS = ("[READ]", "[WRITE]", "[CMD]", "[CHAT]")
+
+# Exemples de départ (complétés par les réponses du LLM, journalisées dans LOGS_DIR)
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    "[READ]": [
+        "Qu'est-ce que j'ai noté sur le projet hier ?",
+        "Rappelle-moi ce que dit ma note sur la mémoire de travail.",
+        "Est-ce que j'ai déjà écrit quelque chose sur ce sujet ?",
+        "Que sais-tu de la réunion de lundi ?",
+        "Retrouve-moi mes idées sur l'apprentissage espacé.",
+        "C'est quoi déjà le concept dont on parlait ce matin ?",
+    ],
+    "[WRITE]": [
+        "Note que la réunion avec l'équipe est déplacée à jeudi.",
+        "Idée : relier le jardinage des notes à l'activation du graphe.",
+        "Le chapitre trois traite de la consolidation de la mémoire pendant le sommeil.",
+        "J'ai lu que l'attention se fatigue après quarante minutes de concentration.",
+        "Il faut penser à comparer les deux approches dans la synthèse.",
+        "Le client veut une démonstration avant la fin du mois.",
+    ],
+    "[CMD]": [
+        "Arrête-toi.",
+        "Efface la dernière note.",
+        "Synthétise la session.",
+        "Stop, annule ça.",
+        "Tais-toi s'il te plaît.",
+        "Mets l'enregistrement en pause.",
+    ],
+    "[CHAT]": [
+        "Bonjour Océane, comment vas-tu ?",
+        "Merci beaucoup, c'est gentil.",
+        "Je me demande si tout ça a vraiment du sens.",
+        "Bon, on verra bien.",
+        "Ah oui, je vois ce que tu veux dire.",
+        "Quelle journée fatigante aujourd'hui.",
+    ],
+}
+
+# Règles évidentes (texte replié : minuscules, sans accents)
+# Verbes à l'impératif uniquement : les noms ("pause", "silence") ouvrent aussi des phrases ordinaires
+CMD_VERBS = ("arrete", "arretez", "stop", "stoppe", "efface", "effacez", "supprime", "supprimez",
+             "annule", "annulez", "synthetise", "synthetisez", "tais", "taisez")
+CMD_PAUSE_VERBS = ("mets", "mettez", "met")  # "Mets l'enregistrement en pause"
+# Demandes explicites sur les notes : "c'est quoi", "que sais-tu", "cherche" restent au centroïde / LLM
+READ_OPENERS = ("rappelle-moi", "rappelle moi", "retrouve-moi", "retrouve moi", "que dit ma note",
+                "que disent mes notes", "qu'est-ce que j'ai", "est-ce que j'ai", "qu'ai-je", "ai-je deja")
+READ_REFERENCES = ("note", "notes", "j'ai dit", "j'ai note", "j'ai ecrit", "ma base", "mon vault")
+
+
+class LocalIntentClassifier:
+    """
+    Routage rapide avant le LLM (cascade) :
+      0. phrase identique à un exemple (casse, accents et ponctuation ignorés)
+      1. règles évidentes : verbe d'ordre en tête ([CMD]), demande de recherche dans les notes ([READ])
+      2. centroïde le plus proche : moyenne des embeddings (normalisés) des exemples de chaque
+         intention ; décision si la similarité cosinus et l'écart avec la deuxième intention
+         dépassent INTENT_MIN_SIMILARITY et INTENT_MIN_MARGIN
+    Sinon None : le LLM décide. Sa réponse ne devient un exemple (LOGS_DIR/INTENT_EXAMPLES_FILE) que si
+    le centroïde le plus proche la confirme ; les exemples appris sont bornés par intention
+    (INTENT_MAX_LEARNED_EXAMPLES, les plus anciens sont oubliés).
+    Les embeddings passent par le cache partagé : l'embedding de la phrase sert ensuite au Routage.
+    """
+
+    def __init__(self, router):
+        self.router = router
+        self.path = settings.LOGS_DIR / settings.INTENT_EXAMPLES_FILE
+        self._lock = threading.Lock()
+        self.sums: Dict[str, np.ndarray] = {}
+        self.counts: Dict[str, int] = {intent: 0 for intent in INTENTS}
+        # Phrase repliée -> intention (None si les exemples se contredisent)
+        self.known: Dict[str, Optional[str]] = {}
+        # Exemples appris (hors exemples de départ), du plus ancien au plus récent : (phrase repliée, vecteur)
+        self.learned: Dict[str, Deque[Tuple[str, Optional[np.ndarray]]]] = {intent: deque() for intent in INTENTS}
+
+        # Statistiques
+        self.exact_hits = 0
+        self.rule_hits = 0
+        self.centroid_hits = 0
+        self.llm_calls = 0
+        self.llm_seconds = 0.0
+        self.fast_seconds = 0.0
+        self.learn_rejected = 0
+
+        seeds = [(intent, text) for intent, texts in SEED_EXAMPLES.items() for text in texts]
+        learned = self._load_examples()
+        # Embeddings des exemples en un lot (cache disque ou un seul appel)
+        self.router.prefetch_embeddings(text for _, text in seeds + learned)
+        for intent, text in seeds:
+            self._add(intent, text, self.router.get_embedding(text))
+        for intent, text in learned:
+            self._remember(intent, text, self.router.get_embedding(text))
+        print(f"[Router] ⚡ Classifieur local : {sum(self.counts.values())} exemples "
+              f"({', '.join(f'{i} {n}' for i, n in self.counts.items())}).")
+
+    def classify(self, text: str) -> Optional[str]:
+        """Intention décidée localement, ou None si la confiance est insuffisante."""
+        started = time.perf_counter()
+        intent = self.known.get(self._fold(text))
+        if intent is not None:
+            self.exact_hits += 1
+            self.fast_seconds += time.perf_counter() - started
+            return intent
+        intent = self._rules(text)
+        if intent is not None:
+            self.rule_hits += 1
+        else:
+            intent, _ = self._nearest(text)
+            if intent is not None:
+                self.centroid_hits += 1
+        if intent is not None:
+            self.fast_seconds += time.perf_counter() - started
+        return intent
+
+    def learn(self, text: str, intent: str, llm_seconds: float):
+        """
+        Réponse du LLM : nouvel exemple (centroïde mis à jour et journalisé), seulement si le centroïde
+        le plus proche désigne la même intention. Un désaccord (LLM bavard, repli sur [CHAT],
+        phrase ambiguë) n'est pas appris : il déplacerait les centroïdes sans contrôle.
+        """
+        self.llm_calls += 1
+        self.llm_seconds += llm_seconds
+        if intent not in INTENTS:
+            return
+        vector = self.router.get_embedding(text)
+        if not self._confirms(intent, vector):
+            self.learn_rejected += 1
+            return
+        if not self._remember(intent, text, vector):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"timestamp": datetime.now().isoformat(), "intent": intent, "text": text},
+                                   ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[Router] ⚠️ Exemple non journalisé : {e}")
+
+    def stats(self) -> Dict[str, float]:
+        fast = self.exact_hits + self.rule_hits + self.centroid_hits
+        total = fast + self.llm_calls
+        llm_ms = 1000 * self.llm_seconds / self.llm_calls if self.llm_calls else 0.0
+        fast_ms = 1000 * self.fast_seconds / fast if fast else 0.0
+        return {
+            "utterances": total,
+            "fast_share": round(fast / total, 3) if total else 0.0,
+            "exact_hits": self.exact_hits,
+            "rule_hits": self.rule_hits,
+            "centroid_hits": self.centroid_hits,
+            "llm_calls": self.llm_calls,
+            "learned": sum(len(examples) for examples in self.learned.values()),
+            "learn_rejected": self.learn_rejected,
+            "llm_ms_avg": round(llm_ms, 1),
+            "fast_ms_avg": round(fast_ms, 2),
+            # Estimation : chaque décision locale aurait coûté un appel LLM moyen
+            "saved_s": round(fast * max(0.0, llm_ms - fast_ms) / 1000, 2)
+        }
+
+    @staticmethod
+    def _fold(text: str) -> str:
+        """Minuscules, sans accents, apostrophes unifiées, ponctuation finale et espaces superflus retirés."""
+        return " ".join(fold_text(text).replace("’", "'").strip(" .!?…").split())
+
+    def _rules(self, text: str) -> Optional[str]:
+        folded = self._fold(text)
+        words = folded.split()
+        if not words:
+            return None
+        first = words[0].strip(",;:").split("-")[0]  # "Arrête-toi" -> "arrete"
+        # Une question n'est pas un ordre ("Arrête-t-il vraiment ?")
+        if not text.rstrip().endswith("?") and len(words) <= 6:
+            if first in CMD_VERBS:
+                return "[CMD]"
+            if first in CMD_PAUSE_VERBS and folded.endswith("en pause"):
+                return "[CMD]"
+        if folded.startswith(READ_OPENERS):
+            return "[READ]"
+        if text.rstrip().endswith("?") and any(ref in folded for ref in READ_REFERENCES):
+            return "[READ]"
+        return None
+
+    def _scores(self, vector) -> List[Tuple[float, str]]:
+        """(similarité cosinus, intention) des centroïdes candidats, du plus proche au plus lointain."""
+        vector = self._unit(vector)
+        with self._lock:
+            return sorted(
+                ((float(vector @ self._unit(self.sums[intent])), intent) for intent in INTENTS
+                 if self.counts[intent] >= settings.INTENT_MIN_EXAMPLES),
+                reverse=True
+            )
+
+    def _confirms(self, intent: str, vector) -> bool:
+        """Le centroïde le plus proche (sans seuils) désigne-t-il cette intention ?"""
+        if vector is None:
+            return False
+        scores = self._scores(vector)
+        return bool(scores) and scores[0][1] == intent
+
+    def _nearest(self, text: str) -> Tuple[Optional[str], float]:
+        vector = self.router.get_embedding(text)
+        if vector is None:
+            return None, 0.0
+        scores = self._scores(vector)
+        if len(scores) < 2:
+            return None, 0.0
+        (best, intent), (second, _) = scores[0], scores[1]
+        if best < settings.INTENT_MIN_SIMILARITY or best - second < settings.INTENT_MIN_MARGIN:
+            return None, best
+        return intent, best
+
+    def _add(self, intent: str, text: str, vector) -> Optional[np.ndarray]:
+        """Ajoute un exemple au centroïde ; retourne son vecteur normalisé."""
+        folded = self._fold(text)
+        previous = self.known.get(folded, intent)
+        self.known[folded] = intent if previous == intent else None
+        if vector is None:
+            return None
+        vector = self._unit(vector)
+        with self._lock:
+            if intent in self.sums:
+                self.sums[intent] = self.sums[intent] + vector
+            else:
+                self.sums[intent] = vector.copy()
+            self.counts[intent] += 1
+        return vector
+
+    def _remember(self, intent: str, text: str, vector) -> bool:
+        """
+        Exemple appris : ajouté au centroïde et à la file de l'intention ; au-delà de
+        INTENT_MAX_LEARNED_EXAMPLES, le plus ancien est retiré (centroïde et phrases connues).
+        Une phrase déjà connue n'est pas ajoutée une seconde fois.
+        """
+        folded = self._fold(text)
+        if folded in self.known:
+            return False
+        unit = self._add(intent, text, vector)
+        examples = self.learned[intent]
+        with self._lock:
+            examples.append((folded, unit))
+            while len(examples) > max(0, settings.INTENT_MAX_LEARNED_EXAMPLES):
+                old_folded, old_unit = examples.popleft()
+                self.known.pop(old_folded, None)
+                if old_unit is not None:
+                    self.sums[intent] = self.sums[intent] - old_unit
+                    self.counts[intent] -= 1
+        return True
+
+    def _load_examples(self) -> List[Tuple[str, str]]:
+        if not self.path.exists():
+            return []
+        examples = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        examples.append((entry["intent"], entry["text"]))
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+        except OSError as e:
+            print(f"[Router] ⚠️ Lecture des exemples : {e}")
+        # Seuls les plus récents comptent (file bornée par intention)
+        limit = max(0, settings.INTENT_MAX_LEARNED_EXAMPLES)
+        recent: Dict[str, Deque[str]] = {intent: deque(maxlen=limit) for intent in INTENTS}
+        for intent, text in examples:
+            if intent in recent:
+                recent[intent].append(text)
+        return [(intent, text) for intent, texts in recent.items() for text in texts]
+
+    @staticmethod
+    def _unit(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
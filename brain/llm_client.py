@@ -1,10 +1,10 @@
 import re
-from openai import OpenAI
+from brain.clients import shared_clients
 from core.settings import settings
 
 class LLMClient:
     def __init__(self):
-        self.client = OpenAI(base_url=settings.LLM_BASE_URL, api_key="ollama")
+        self.client = shared_clients().openai(settings.LLM_BASE_URL)
 
     def query(self, context_history: str, user_input: str) -> str:
         messages = [
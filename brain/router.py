@@ -1,6 +1,11 @@
+import time
+import threading
 import numpy as np
-from openai import OpenAI
+from typing import Dict, Iterable, List, Optional, Tuple
 from core.settings import settings
+from brain.embedding_cache import shared_embedding_cache
+from brain.embedding_batcher import shared_embedding_batcher
+from brain.clients import shared_clients
 
 class IntentRouter:
     """
@@ -11,18 +16,60 @@ class IntentRouter:
     2. Filtrer le bruit (phrases trop courtes).
     """
     def __init__(self):
-        self.chat_client = OpenAI(base_url=settings.ROUTER_BASE_URL, api_key="ollama")
+        self.chat_client = shared_clients().openai(settings.ROUTER_BASE_URL)
+        # Cache partagé (mémoire + LOGS_DIR) : le même texte n'est embarqué qu'une fois
+        self.embedding_cache = shared_embedding_cache()
+        # Demandes d'embeddings regroupées en micro-lots (tous les routeurs du processus)
+        self.batcher = shared_embedding_batcher()
+        # Classifieur local (cascade avant le LLM), créé au premier routage
+        self.classifier = None
+        self._classifier_lock = threading.Lock()
 
     def get_embedding(self, text: str):
+        embeddings = self.get_embeddings([text])
+        return None if embeddings is None else embeddings[0]
+
+    def get_embeddings(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embeddings d'un lot de textes : matrice (n, d) dans l'ordre de `texts`, None si le service échoue.
+        Cache partagé d'abord ; les textes inconnus partent en une requête (micro-lot partagé
+        avec les appels simultanés des autres threads).
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        vectors, _ = self._lookup_or_embed(texts)
+        if vectors is None:
+            return None
+        return np.stack([vectors[text] for text in texts])
+
+    def prefetch_embeddings(self, texts: Iterable[str]) -> int:
+        """
+        Prépare les embeddings d'un lot de textes : cache disque chargé en mémoire en une requête,
+        textes inconnus embarqués en un seul appel. Retourne le nombre de textes calculés.
+        """
+        texts = [t for t in dict.fromkeys(texts) if t]
+        if not texts or self.embedding_cache is None:
+            return 0
+        _, computed = self._lookup_or_embed(texts)
+        return computed
+
+    def _lookup_or_embed(self, texts: List[str]) -> Tuple[Optional[Dict[str, np.ndarray]], int]:
+        model = settings.EMBEDDING_MODEL_NAME
+        found = self.embedding_cache.get_many(model, texts) if self.embedding_cache is not None else {}
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if not missing:
+            return found, 0
         try:
-            response = self.chat_client.embeddings.create(
-                model=settings.EMBEDDING_MODEL_NAME,
-                input=text
-            )
-            return np.array(response.data[0].embedding)
+            matrix = self.batcher.embed(missing)
         except Exception as e:
             print(f"[Router] ❌ Erreur Embedding : {e}")
-            return None
+            return None, 0
+        computed = dict(zip(missing, matrix))
+        if self.embedding_cache is not None:
+            computed = self.embedding_cache.put_many(model, computed)
+        found.update(computed)
+        return found, len(missing)
 
     def _precompute_taxonomy(self):
         # OBSOLÈTE avec ADR-026, mais gardé vide pour compatibilité si appelé par main.py
@@ -35,7 +82,15 @@ class IntentRouter:
         """
         if len(text.split()) < 2: return "[CHAT]"  # Trop court
 
+        # Voie rapide : règles évidentes ou centroïde d'exemples assez proche
+        classifier = self._local_classifier()
+        if classifier is not None:
+            intent = classifier.classify(text)
+            if intent is not None:
+                return intent
+
         try:
+            started = time.perf_counter()
             response = self.chat_client.chat.completions.create(
                 model=settings.ROUTER_MODEL_NAME,  # mistral-nemo
                 messages=[
@@ -45,14 +100,28 @@ class IntentRouter:
                 temperature=0.0  # Très déterministe
             )
             intent = response.choices[0].message.content.strip()
+            elapsed = time.perf_counter() - started
 
             # Sécurité si le LLM bavarde
-            if "[READ]" in intent: return "[READ]"
-            if "[WRITE]" in intent: return "[WRITE]"
-            if "[CMD]" in intent: return "[CMD]"
-
-            return "[CHAT]"  # Défaut
+            if "[READ]" in intent: intent = "[READ]"
+            elif "[WRITE]" in intent: intent = "[WRITE]"
+            elif "[CMD]" in intent: intent = "[CMD]"
+            else: intent = "[CHAT]"  # Défaut
 
         except Exception as e:
             print(f"[Router] ⚠️ Erreur classification : {e}")
-            return "[CHAT]"
\ No newline at end of file
+            return "[CHAT]"
+
+        # La réponse du LLM devient un exemple du classifieur local
+        if classifier is not None:
+            classifier.learn(text, intent, elapsed)
+        return intent
+
+    def _local_classifier(self):
+        if not settings.INTENT_FAST_PATH_ENABLED or self.embedding_cache is None:
+            return None
+        with self._classifier_lock:
+            if self.classifier is None:
+                from brain.intent_classifier import LocalIntentClassifier
+                self.classifier = LocalIntentClassifier(self)
+        return self.classifier
\ No newline at end of file
@@ -0,0 +1,78 @@
+import math
+import time
+import string
+from concurrent.futures import Future
+from difflib import SequenceMatcher
+from typing import List, Optional, Set
+
+from brain.graph.matcher import fold_text
+
+
+def _norm(word: str) -> str:
+    return fold_text(word).strip(string.punctuation + "«»…’")
+
+
+class TranscriptStitcher:
+    """
+    Recollage des fenêtres chevauchantes d'une même phrase (transcription en continu).
+    Chaque fenêtre est transcrite séparément ; sa partie initiale recouvre la fin de la
+    précédente. On aligne la fin non stabilisée du texte courant avec le début de la
+    nouvelle fenêtre (plus long bloc de mots communs, casse/accents/ponctuation ignorés) :
+    le texte précédent est conservé jusqu'à la fin de l'alignement, la nouvelle fenêtre
+    (qui a plus de contexte à droite) fournit la suite.
+    Les mots situés hors de la zone de chevauchement ne peuvent plus changer : `stable_text`.
+    """
+
+    # Alignement minimal (en mots) pour accepter un recollage
+    MIN_MATCH = 2
+
+    def __init__(self, utterance_id: int, overlap_seconds: float):
+        self.utterance_id = utterance_id
+        self.overlap = overlap_seconds
+        self.words: List[str] = []
+        self.stable = 0  # Nombre de mots définitifs
+        self.windows = 0
+        self.final = False
+        self.updated_at = time.time()  # Dernière fenêtre reçue (détection des phrases orphelines)
+        # Anticipation côté Cerveau : routage demandé (Future) et notes déjà stimulées
+        self.intent: Optional[Future] = None
+        self.stimulated: Set[str] = set()
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.words)
+
+    @property
+    def stable_text(self) -> str:
+        return " ".join(self.words[:self.stable])
+
+    def add_window(self, text: str, duration: float, is_final: bool) -> str:
+        """Intègre la transcription d'une fenêtre ; retourne le texte complet courant."""
+        new = text.split()
+        self.windows += 1
+        self.updated_at = time.time()
+        if not self.words:
+            self.words = new
+        elif new:
+            self.words = self._merge(new)
+
+        if is_final:
+            self.final = True
+            self.stable = len(self.words)
+        elif new and duration > 0:
+            # Les mots de la fin de fenêtre (zone reprise par la suivante) restent révisables
+            tail = math.ceil(len(new) * min(1.0, self.overlap / duration)) + 1
+            self.stable = max(self.stable, len(self.words) - tail)
+        return self.text
+
+    def _merge(self, new: List[str]) -> List[str]:
+        words = self.words
+        tail_start = self.stable
+        a = [_norm(w) for w in words[tail_start:]]
+        b = [_norm(w) for w in new[:len(a) + self.MIN_MATCH * 2]]
+        match = SequenceMatcher(None, a, b, autojunk=False).find_longest_match(0, len(a), 0, len(b))
+        if match.size >= min(self.MIN_MATCH, len(a), len(b)) and match.size > 0:
+            cut = tail_start + match.a + match.size
+            return words[:cut] + new[match.b + match.size:]
+        # Aucun recouvrement reconnaissable (silence dans la zone commune) : simple ajout
+        return words + new
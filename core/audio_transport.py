@@ -0,0 +1,111 @@
+import queue
+import multiprocessing
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Optional
+
+from core.data_models import AudioPayload, AudioSlotDescriptor
+
+
+class SharedAudioRing:
+    """
+    Transport audio Oreille -> Cerveau par mémoire partagée.
+    Un bloc SharedMemory découpé en `slots` cases de `slot_samples` float32 :
+      - l'Oreille prend une case libre, y écrit le segment une seule fois et
+        n'envoie qu'un AudioSlotDescriptor (case, longueur, horodatage) dans la Queue
+      - le Cerveau lit la case sans copie (vue NumPy) puis la rend avec release()
+    Les cases libres circulent dans une Queue : si le Cerveau a pris du retard et
+    qu'aucune case ne se libère avant `timeout`, l'Oreille abandonne le segment (contre-pression).
+    Le processus principal crée le bloc (create=True) et le détruit avec unlink() ;
+    les processus fils s'y rattachent en recevant l'objet en argument.
+    """
+
+    def __init__(self, slots: int, slot_samples: int, create: bool = False, name: Optional[str] = None):
+        self.slots = slots
+        self.slot_samples = slot_samples
+        size = slots * slot_samples * np.dtype(np.float32).itemsize
+
+        if create:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.free = multiprocessing.Queue()
+            for slot in range(slots):
+                self.free.put(slot)
+        else:
+            self.shm = _attach(name)
+            self.free = None
+        self._owner = create
+        self.samples = np.ndarray((slots, slot_samples), dtype=np.float32, buffer=self.shm.buf)
+
+        # Statistiques (propres à chaque processus)
+        self.sent = 0
+        self.dropped = 0
+        self.waited = 0
+
+    # --- Transmission aux processus fils ---
+    def __getstate__(self):
+        return {"name": self.shm.name, "slots": self.slots, "slot_samples": self.slot_samples, "free": self.free}
+
+    def __setstate__(self, state):
+        self.__init__(state["slots"], state["slot_samples"], name=state["name"])
+        self.free = state["free"]
+
+    # --- Côté Oreille ---
+    def put(self, payload: AudioPayload, timeout: float = 2.0) -> Optional[AudioSlotDescriptor]:
+        """Copie le segment dans une case libre ; None si aucune case ne se libère à temps."""
+        audio = payload.audio_data
+        length = min(len(audio), self.slot_samples)
+        if length == 0:
+            return None
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            # Toutes les cases sont en cours de traitement côté Cerveau
+            self.waited += 1
+            try:
+                slot = self.free.get(timeout=timeout)
+            except queue.Empty:
+                self.dropped += 1
+                print(f"[Oreille] ⚠️ Cerveau saturé : segment de {payload.duration_seconds:.1f}s abandonné.")
+                return None
+
+        self.samples[slot, :length] = audio[:length]
+        self.sent += 1
+        return AudioSlotDescriptor(slot=slot, length=length, sample_rate=payload.sample_rate,
+                                   timestamp=payload.timestamp, utterance_id=payload.utterance_id,
+                                   window_start=payload.window_start, is_final=payload.is_final)
+
+    # --- Côté Cerveau ---
+    def payload(self, descriptor: AudioSlotDescriptor) -> AudioPayload:
+        """AudioPayload dont les données sont une vue sur la case (valide jusqu'à release())."""
+        return AudioPayload(
+            audio_data=self.samples[descriptor.slot, :descriptor.length],
+            sample_rate=descriptor.sample_rate,
+            timestamp=descriptor.timestamp,
+            duration_seconds=descriptor.length / descriptor.sample_rate,
+            utterance_id=descriptor.utterance_id,
+            window_start=descriptor.window_start,
+            is_final=descriptor.is_final
+        )
+
+    def release(self, descriptor: AudioSlotDescriptor):
+        self.free.put(descriptor.slot)
+
+    # --- Fin de vie ---
+    def close(self):
+        self.samples = None
+        self.shm.close()
+
+    def unlink(self):
+        """Destruction du bloc (processus principal, après l'arrêt des fils)."""
+        if self._owner:
+            self.close()
+            self.shm.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python >= 3.13 : le rattachement ne doit pas être suivi par le resource_tracker
+        # (sinon le bloc serait détruit à la sortie du premier processus fils)
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
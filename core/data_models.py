@@ -1,4 +1,6 @@
+from concurrent.futures import Future
 from datetime import datetime
+from typing import Optional, Set
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -13,12 +15,44 @@ class AudioPayload(BaseModel):
     sample_rate: int = Field(..., gt=0)
     timestamp: datetime
     duration_seconds: float = Field(..., gt=0)
+    # Transcription en continu : fenêtres d'une même phrase (0 : segment autonome)
+    utterance_id: int = 0
+    window_start: float = 0.0  # Début de la fenêtre depuis le début de la phrase (s)
+    is_final: bool = True
 
     def validate_payload(self):
         """Vérification manuelle supplémentaire si nécessaire."""
         if self.audio_data is None or self.audio_data.size == 0:
             raise ValueError("AudioPayload vide.")
 
+class AudioSlotDescriptor(BaseModel):
+    """
+    Segment audio déposé dans une case de SharedAudioRing (mémoire partagée).
+    Seul ce descripteur transite par la Queue : les échantillons restent en place.
+    """
+    slot: int = Field(..., ge=0)
+    length: int = Field(..., gt=0)
+    sample_rate: int = Field(..., gt=0)
+    timestamp: datetime
+    utterance_id: int = 0
+    window_start: float = 0.0
+    is_final: bool = True
+
+class Utterance(BaseModel):
+    """
+    Phrase (transcrite ou tapée) qui traverse le pipeline du Cerveau :
+    routage (intention + embedding) puis action.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    text: str
+    source: str
+    timestamp: Optional[datetime] = None  # Instant de l'enregistrement (ingestion), maintenant par défaut
+    intent: Optional[str] = None
+    early_intent: Optional[Future] = None  # Routage anticipé pendant la parole (flux continu)
+    stimulated: Set[str] = Field(default_factory=set)  # Notes déjà stimulées pendant la parole
+    embedding: Optional[np.ndarray] = None
+
 class LogEntry(BaseModel):
     """
     Structure standardisée pour les logs (Journal).
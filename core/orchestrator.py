@@ -1,27 +1,45 @@
 import time
 import queue
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Tuple, Union
 
 from core.settings import settings
-from core.data_models import AudioPayload
+from core.data_models import AudioPayload, AudioSlotDescriptor, Utterance
+from core.pipeline import PipelineStage
 from brain.sanitizer import TextSanitizer
+from brain.transcript_stitcher import TranscriptStitcher
 
 # Modules Métier
 from brain.inference_client import InferenceClient
+from brain.clients import shared_clients
 from brain.router import IntentRouter
 from brain.graph.manager import GraphStateManager
+from brain.graph.watcher import VaultWatcher
+from brain.graph.gardener import Gardener
 from analyst.synthesizer import Synthesizer
 from memory.storage_manager import MemoryManager
 from memory.vector_manager import VectorManager
 from memory.librarian import Librarian
+from memory.writeback import WritebackQueue
 
 
 class BrainOrchestrator:
     # AJOUT de input_queue dans les arguments
-    def __init__(self, audio_queue: queue.Queue, tts_queue: queue.Queue, input_queue: queue.Queue, stop_event):
+    def __init__(self, audio_queue: queue.Queue, tts_queue: queue.Queue, input_queue: queue.Queue, stop_event,
+                 audio_ring=None):
         self.audio_queue = audio_queue
+        # Mémoire partagée de l'Oreille (la Queue audio ne porte que des descripteurs)
+        self.audio_ring = audio_ring
+        # Phrases en cours de transcription continue (utterance_id -> recollage des fenêtres)
+        self.streams: Dict[int, TranscriptStitcher] = {}
+        self._streams_lock = threading.Lock()
+        # Phrases terminées par expiration : leurs fenêtres tardives sont ignorées
+        self._expired_streams = deque(maxlen=64)
         self.tts_queue = tts_queue
         self.input_queue = input_queue  # <--- Nouveau
         self.stop_event = stop_event
@@ -37,12 +55,36 @@ class BrainOrchestrator:
         self.synthesizer = Synthesizer(graph_manager=self.graph)
 
         self.graph.load_state()
+        self.gardener = Gardener(self.graph)
+        self.writeback = WritebackQueue(bridge=self.memory.obsidian)
+        self.vault_watcher = VaultWatcher(
+            settings.OBSIDIAN_VAULT_PATH,
+            debounce=settings.VAULT_WATCH_DEBOUNCE_SECONDS,
+            poll_interval=settings.VAULT_WATCH_POLL_SECONDS
+        )
+        if settings.VAULT_WATCH_ENABLED:
+            self.vault_watcher.start()
         self.inference.warm_up()
         self.graph.export_activity_snapshot(settings.LOGS_DIR / "brain_activity.json")
 
+        # Pipeline : Transcription -> Routage -> Action -> Synthèse de fond.
+        # Les étages réseau ont plusieurs threads ; l'Action reste seule (ordre du journal
+        # et des stimuli) ; le graphe est protégé par graph.lock (tâches de fond, Synthèse).
+        size = settings.PIPELINE_QUEUE_SIZE
+        self.synthesis_stage = PipelineStage("Synthèse", self._synthesize, workers=1, maxsize=1)
+        self.act_stage = PipelineStage("Action", self._execute_intent, workers=1, maxsize=size)
+        self.route_stage = PipelineStage("Routage", self._prepare, emit=self.act_stage.submit,
+                                         workers=settings.PIPELINE_ROUTE_WORKERS, maxsize=size)
+        self.stt_stage = PipelineStage("Transcription", self._transcribe, emit=self._on_transcript,
+                                       workers=settings.PIPELINE_STT_WORKERS, maxsize=size)
+        # Routage anticipé des phrases en continu (hors ordre, résultat attendu par le Routage)
+        self.early_router = ThreadPoolExecutor(max_workers=1, thread_name_prefix="early-route")
+
         self.last_propagation = time.time()
         self.last_decay = time.time()
         self.last_gardening = time.time()
+        self.last_writeback = time.time()
+        self.last_state_save = time.time()
 
         print("[Orchestrator] ✅ Système Prêt.")
 
@@ -62,7 +104,8 @@ class BrainOrchestrator:
                 # On utilise get_nowait ou timeout très court pour ne pas bloquer le texte
                 try:
                     audio_payload = self.audio_queue.get(timeout=0.1)
-                    self.process_interaction(audio_payload)
+                    # Transcription en parallèle (bloque seulement si l'étage est saturé)
+                    self.stt_stage.submit(audio_payload)
                 except queue.Empty:
                     # 3. Tâches de fond (Si rien d'autre)
                     self.process_background_tasks()
@@ -70,16 +113,90 @@ class BrainOrchestrator:
             except Exception as e:
                 print(f"[Orchestrator] Erreur Loop: {e}")
 
+        self.shutdown()
+
+    def shutdown(self):
+        """Arrêt propre : pipeline vidé, surveillance du Vault, écritures différées, état du graphe, connexions."""
+        # Chaque étage termine ce qui lui a été soumis avant la fermeture du suivant
+        self.stt_stage.close()
+        self.early_router.shutdown(wait=True)
+        self.route_stage.close()
+        self.act_stage.close()
+        self.synthesis_stage.close()
+        self.vault_watcher.stop()
+        self.writeback.close()
+        self.graph.save_state(compact=True)
+        if self.router.embedding_cache is not None:
+            stats = self.router.embedding_cache.stats()
+            print(f"[Embeddings] 💾 Cache : {stats['hit_rate']:.0%} de succès "
+                  f"({stats['memory_hits']} mémoire, {stats['disk_hits']} disque, {stats['misses']} calculs)")
+            self.router.embedding_cache.close()
+        stats = self.router.batcher.stats()
+        if stats['batches']:
+            print(f"[Embeddings] 📦 Micro-lots : {stats['calls']} demandes -> {stats['batches']} requêtes "
+                  f"({stats['avg_batch']} textes en moyenne)")
+        if self.router.classifier is not None:
+            stats = self.router.classifier.stats()
+            print(f"[Router] ⚡ Voie rapide : {stats['fast_share']:.0%} de {stats['utterances']} phrases "
+                  f"({stats['exact_hits']} connues, {stats['rule_hits']} règles, {stats['centroid_hits']} centroïdes, {stats['llm_calls']} LLM) "
+                  f"| ~{stats['saved_s']} s économisées")
+        # Connexions partagées (Whisper, Routeur, LLM) : bilan par point d'accès puis fermeture
+        for url, stats in shared_clients().stats().items():
+            print(f"[Clients] 🌐 {url} : {stats['requests']} requêtes, {stats['errors']} erreurs, "
+                  f"{stats['latency_ms_avg']} ms en moyenne (max {stats['latency_ms_max']} ms, "
+                  f"{stats['max_in_flight']} simultanées)")
+        shared_clients().close()
+        if self.audio_ring is not None:
+            self.audio_ring.close()
+
     def process_text_input(self, text: str):
         """Entrée Texte (Clavier)"""
         print(f"\n[Flux Texte] ⌨️ {text}")
-        # On délègue à la logique centrale
-        self._execute_intent(text, source="Clavier")
+        # On délègue à la logique centrale (après les phrases déjà en cours de routage)
+        self.route_stage.submit(Utterance(text=text, source="Clavier"))
 
-    def process_interaction(self, payload: AudioPayload):
-        """Entrée Audio (Microphone)"""
-        # 1. Transcription (Whisper)
-        text, speakers = self.inference.process_audio(payload.audio_data, payload.sample_rate)
+    def ingest_transcript(self, text: str, timestamp: datetime, source: str, route: bool = False):
+        """
+        Entrée Fichier (ingestion par lots, ingest.py) : texte d'un segment enregistré.
+        Par défaut tout est consigné comme prise de notes ([WRITE]) : une réunion enregistrée
+        ne s'adresse pas à Océane. `route=True` passe par le routeur d'intention.
+        """
+        if not TextSanitizer.is_valid(text):
+            return
+        print(f"\n[Flux Fichier] 📼 {timestamp:%Y-%m-%d %H:%M:%S} {text}")
+        utterance = Utterance(text=text, source=source, timestamp=timestamp, intent=None if route else "[WRITE]")
+        self._execute_intent(self._prepare(utterance))
+
+    def _transcribe(self, payload: Union[AudioPayload, AudioSlotDescriptor]) -> Tuple[AudioPayload, str]:
+        """Étage Transcription (Whisper), en parallèle : AudioPayload, ou AudioSlotDescriptor en mémoire partagée."""
+        try:
+            return self._transcribe_payload(payload)
+        except Exception as e:
+            if not payload.utterance_id:
+                raise
+            # Fenêtre d'un flux continu : on la transmet vide pour que la finale termine quand même la phrase
+            print(f"[Orchestrator] ⚠️ Fenêtre {payload.utterance_id} non transcrite : {e}")
+            return payload, ""
+
+    def _transcribe_payload(self, payload: Union[AudioPayload, AudioSlotDescriptor]) -> Tuple[AudioPayload, str]:
+        if isinstance(payload, AudioSlotDescriptor):
+            descriptor = payload
+            try:
+                # Lecture directe de la case (sans copie), rendue à l'Oreille dès la transcription faite
+                payload = self.audio_ring.payload(descriptor)
+                text, speakers = self.inference.process_audio(payload.audio_data, payload.sample_rate)
+            finally:
+                self.audio_ring.release(descriptor)
+        else:
+            text, speakers = self.inference.process_audio(payload.audio_data, payload.sample_rate)
+        return payload, text
+
+    def _on_transcript(self, result: Tuple[AudioPayload, str]):
+        """Sortie de la Transcription, dans l'ordre des segments : Entrée Audio (Microphone)."""
+        payload, text = result
+        if payload.utterance_id:
+            self._process_stream_window(payload, text)
+            return
 
         if not TextSanitizer.is_valid(text):
             return
@@ -87,91 +204,153 @@ class BrainOrchestrator:
         print(f"\n[Flux Audio] 🗣️ {text}")
 
         # On délègue à la logique centrale
-        self._execute_intent(text, source="Vocal")
+        self.route_stage.submit(Utterance(text=text, source="Vocal"))
+
+    def _process_stream_window(self, payload: Union[AudioPayload, AudioSlotDescriptor], text: str):
+        """
+        Transcription en continu : recolle la fenêtre au texte de la phrase.
+        Pendant la parole, le texte stabilisé réveille déjà le graphe (Stimulus) et
+        l'intention est routée dès STT_EARLY_ROUTE_WORDS mots ; la fenêtre finale
+        déclenche l'action avec ce qui a été anticipé.
+        """
+        with self._streams_lock:
+            if payload.utterance_id in self._expired_streams:
+                return  # Phrase déjà terminée par expiration
+            stream = self.streams.get(payload.utterance_id)
+            if stream is None:
+                overlap = max(0.0, settings.STT_PARTIAL_WINDOW_SECONDS - settings.STT_PARTIAL_INTERVAL_SECONDS)
+                stream = self.streams[payload.utterance_id] = TranscriptStitcher(payload.utterance_id, overlap)
+            if payload.is_final:
+                del self.streams[payload.utterance_id]
+        if not TextSanitizer.is_valid(text):
+            text = ""  # Fenêtre de bruit, hallucination ou échec de transcription : ignorée
+        # Fenêtre non lue (échec de la mémoire partagée) : seul le descripteur est connu
+        duration = getattr(payload, "duration_seconds", None) or payload.length / payload.sample_rate
+        stream.add_window(text, duration, payload.is_final)
+
+        if not payload.is_final:
+            print(f"\r[Flux Audio] ⏳ {stream.text}", end="", flush=True)
+            if stream.stable_text:
+                with self.graph.lock:
+                    stream.stimulated |= self.graph.inject_stimulus(stream.stable_text, "", exclude=stream.stimulated)
+            if stream.intent is None and stream.stable >= settings.STT_EARLY_ROUTE_WORDS:
+                stream.intent = self.early_router.submit(self.router.route, stream.stable_text)
+            return
+        self._finish_stream(stream)
+
+    def _finish_stream(self, stream: TranscriptStitcher):
+        """Fin de phrase (fenêtre finale, ou expiration) : routage avec ce qui a été anticipé."""
+        text = stream.text
+        if not TextSanitizer.is_valid(text):
+            return
+        print(f"\n[Flux Audio] 🗣️ {text}")
+        self.route_stage.submit(Utterance(text=text, source="Vocal", early_intent=stream.intent,
+                                          stimulated=stream.stimulated))
 
         # --- LOGIQUE CENTRALE (Cerveau) ---
 
-    def _execute_intent(self, text: str, source: str):
+    def _prepare(self, utterance: Utterance) -> Utterance:
         """
-        Cœur décisionnel : Route -> Agit.
+        Étage Routage, en parallèle : intention (Mistral Nemo) et embedding de la phrase.
+        `early_intent` : intention déjà demandée pendant la parole (flux continu).
         """
         # 1. Identification de l'intention (Mistral Nemo)
-        intent = self.router.route(text)
+        if utterance.intent is None and utterance.early_intent is not None:
+            utterance.intent = utterance.early_intent.result()
+        if utterance.intent is None:
+            utterance.intent = self.router.route(utterance.text)
+        if utterance.intent in ("[READ]", "[WRITE]", "[CHAT]"):
+            utterance.embedding = self.router.get_embedding(utterance.text)
+        return utterance
+
+    def _execute_intent(self, utterance: Utterance):
+        """
+        Cœur décisionnel (étage Action, un seul thread : journal et stimuli dans l'ordre des phrases).
+        `utterance.stimulated` : notes déjà stimulées pendant la parole (flux continu).
+        `utterance.timestamp` : instant de l'enregistrement (ingestion de fichiers), maintenant par défaut.
+        """
+        intent = utterance.intent
         print(f"[Orchestrator] Intention : {intent}")
 
         # 2. Aiguillage
         if intent == "[READ]":
             # Mode Assistant : On répond à l'utilisateur
-            self._handle_read_intent(text, source)
+            self._handle_read_intent(utterance)
 
         elif intent == "[WRITE]":
             # Mode Prise de Note : On enregistre et on se tait
-            self._handle_write_intent(text, source, intent_tag=intent)
+            self._handle_write_intent(utterance)
 
         elif intent == "[CHAT]":
             # Mode Conversation : On enregistre comme du Write pour l'instant
             # (Plus tard on pourra ajouter une réponse "Chat" pure sans note)
-            self._handle_write_intent(text, source, intent_tag=intent)
+            self._handle_write_intent(utterance)
 
         elif intent == "[CMD]":
             print("[Orchestrator] Commande reçue (Non implémenté).")
 
         # --- HANDLERS SPÉCIFIQUES ---
 
-    def _handle_write_intent(self, text: str, source: str, intent_tag: str):
+    def _handle_write_intent(self, utterance: Utterance):
         """
-        Pipeline classique : Stimulus -> Vector -> Dashboard -> Librarian (Inbox)
+        Pipeline classique : Stimulus -> Vector -> (en fond) Dashboard -> Librarian (Inbox)
         """
-        # 1. Injection Stimulus (Réveil Graphe)
-        self.graph.inject_stimulus(text, intent_tag)
+        text, timestamp = utterance.text, utterance.timestamp
+
+        # 1. Injection Stimulus (Réveil Graphe), sauf notes déjà stimulées pendant la parole
+        with self.graph.lock:
+            self.graph.inject_stimulus(text, utterance.intent, exclude=utterance.stimulated)
 
         # 2. Log Journal (Mémoire Court Terme)
-        self.memory.log_event(source=source, text=text, intent=intent_tag)
+        self.memory.log_event(source=utterance.source, text=text, intent=utterance.intent, timestamp=timestamp)
 
-        # 3. Mémoire Vectorielle (Long Terme)
-        embedding = self.router.get_embedding(text)
-        if embedding is not None:
-            self.vectors.add_to_memory(text, embedding, {
-                "timestamp": datetime.now().isoformat(),
+        # 3. Mémoire Vectorielle (Long Terme), embedding calculé au Routage
+        if utterance.embedding is not None:
+            self.vectors.add_to_memory(text, utterance.embedding, {
+                "timestamp": (timestamp or datetime.now()).isoformat(),
                 "session": "current"
             })
 
-        # 4. Synthèse Dashboard (Mise à jour Web)
+        # 4. Synthèse en fond : une seule en attente, elle lira le journal à jour
+        self.synthesis_stage.offer(True)
+
+    def _synthesize(self, _request):
+        """Étage Synthèse de fond : Dashboard (Mise à jour Web) puis Concepts vers 00_Inbox."""
         dashboard_md, concepts = self.synthesizer.generate_summary()
         self.memory.update_dashboard(dashboard_md)
 
         # 5. Extraction de Concepts (Vers 00_Inbox)
         if concepts:
             print(f"[Orchestrator] 💡 {len(concepts)} concepts extraits -> Inbox.")
-            for concept in concepts:
-                self.librarian.process_concept(concept['title'], concept['content'], concept['tags'])
+            # Extraction entière en un lot (embeddings, recherche de doublons, indexation)
+            self.librarian.process_concepts(concepts)
 
-    def _handle_read_intent(self, text: str, source: str):
+    def _handle_read_intent(self, utterance: Utterance):
         """
         Pipeline RAG + TTS : Recherche -> Synthèse -> Parole
         """
+        text = utterance.text
         print("[Orchestrator] 🔍 Recherche d'information...")
 
         # 1. Log de la demande
-        self.memory.log_event(source=source, text=text, intent="[READ]")
+        self.memory.log_event(source=utterance.source, text=text, intent="[READ]", timestamp=utterance.timestamp)
 
         # 2. Recherche RAG (Vecteurs + Graphe)
         context = []
 
-        # A. Vecteurs (Ce qu'on a déjà dit)
-        emb = self.router.get_embedding(text)
+        # A. Vecteurs (Ce qu'on a déjà dit), embedding calculé au Routage
+        emb = utterance.embedding
         if emb is not None:
             res = self.vectors.search_similar(emb, n_results=3)
             if res and res['documents']:
                 context.extend(res['documents'][0])
 
-        # B. Graphe (Ce qui est activé/Relié)
-        # On pourrait chercher les nœuds dont le titre ressemble à la demande
-        # Pour l'instant on prend les nœuds actifs
-        active_nodes = sorted([n for n in self.graph.nodes.values() if n.activation > 0],
-                              key=lambda x: x.activation, reverse=True)[:3]
-        for n in active_nodes:
-            context.append(f"Concept pertinent : {n.title}")
+        # B. Graphe (Ce qui est Relié à la question)
+        # PageRank personnalisé depuis les notes citées (à défaut : les nœuds actifs)
+        with self.graph.lock:
+            related = self.graph.related_notes(text)
+        for node, _score in related:
+            context.append(f"Concept pertinent : {node.title}")
 
         # 3. Génération de la réponse vocale (LLM)
         context_str = "\n".join(context)
@@ -182,8 +361,7 @@ class BrainOrchestrator:
         )
 
         try:
-            from openai import OpenAI  # Import local pour éviter conflit si non chargé globalement
-            client = OpenAI(base_url=settings.LLM_BASE_URL, api_key="ollama")
+            client = shared_clients().openai(settings.LLM_BASE_URL)
 
             response = client.chat.completions.create(
                 model=settings.LLM_MODEL_NAME,
@@ -205,56 +383,82 @@ class BrainOrchestrator:
         except Exception as e:
             print(f"[Orchestrator] Erreur Read Intent: {e}")
 
+    def _sweep_streams(self, now: float):
+        """
+        Phrases orphelines : fenêtre finale perdue (case de mémoire partagée indisponible,
+        segment abandonné par l'Oreille). Sans nouvelle fenêtre depuis STT_STREAM_TIMEOUT_SECONDS,
+        la phrase est terminée avec le texte déjà recollé.
+        """
+        with self._streams_lock:
+            expired = [s for s in self.streams.values()
+                       if now - s.updated_at > settings.STT_STREAM_TIMEOUT_SECONDS]
+            for stream in expired:
+                del self.streams[stream.utterance_id]
+                self._expired_streams.append(stream.utterance_id)
+        for stream in expired:
+            print(f"\n[Orchestrator] ⌛ Phrase {stream.utterance_id} sans fenêtre finale : terminée.")
+            self._finish_stream(stream)
+
     def process_background_tasks(self):
         """Maintenance du système quand l'utilisateur ne parle pas."""
         now = time.time()
 
+        # 0. Transcription continue : phrases dont la fenêtre finale n'est jamais arrivée
+        if self.streams:
+            self._sweep_streams(now)
+
         # A. Propagation de l'Activation (Toutes les 2s)
         if now - self.last_propagation > 2.0:
-            self.graph.propagate_activation()
-            # Export JSON pour le Web
-            self.graph.export_activity_snapshot(settings.LOGS_DIR / "brain_activity.json")
+            with self.graph.lock:
+                self.graph.propagate_activation()
+                # Export JSON pour le Web
+                self.graph.export_activity_snapshot(settings.LOGS_DIR / "brain_activity.json")
             self.last_propagation = now
 
-        # B. Oubli & Fatigue (Toutes les 10s pour être plus réactif)
-        if now - self.last_decay > 10.0:
-            for node in self.graph.nodes.values():
-                node.decay()
-                node.rest()
+        # A'. Vault vivant : notes créées/éditées pendant la session
+        changed_paths = self.vault_watcher.drain()
+        if changed_paths:
+            with self.graph.lock:
+                self.graph.apply_vault_changes(changed_paths)
+
+        # B. Oubli & Fatigue (calcul paresseux : on ne fait qu'élaguer les nœuds éteints)
+        if now - self.last_decay > settings.DECAY_INTERVAL_SECONDS:
+            with self.graph.lock:
+                self.graph.decay_all()
             self.last_decay = now
 
         # C. Jardinage Automatique (Toutes les 60s)
         # C'est ici qu'on applique vos règles (Graine -> Sapling)
-        if now - self.last_gardening > 60.0:
-            self._gardening_cycle()
+        if now - self.last_gardening > settings.GARDENING_INTERVAL_SECONDS:
+            with self.graph.lock:
+                self._gardening_cycle()
             self.last_gardening = now
 
+        # D. Sauvegarde de l'état volatile (journal des seuls nœuds modifiés)
+        if now - self.last_state_save > settings.STATE_SAVE_SECONDS:
+            with self.graph.lock:
+                self.graph.save_state()
+            self.last_state_save = now
+
+        # E. Écriture différée des en-têtes modifiés (lots fusionnés par fichier)
+        if now - self.last_writeback > settings.WRITEBACK_FLUSH_SECONDS:
+            if self.writeback.flush():
+                stats = self.writeback.stats()
+                print(f"[Writeback] 💾 Backlog : {stats['backlog']} | Dernier lot : {stats['last_flush_ms']} ms"
+                      f" | p95 : {stats['p95_latency_ms']} ms | Échecs : {stats['failed']}")
+            self.last_writeback = now
+
     def _gardening_cycle(self):
         """
-        Applique les règles algorithmiques de '00_tags.md'.
+        Applique les règles de cycle de vie (ADR-028) déclarées dans GARDENING_RULES_FILE.
+        Seules les notes modifiées depuis le dernier cycle (ou dont un seuil
+        de durée vient d'être franchi) sont évaluées.
         """
-        # On ne scanne pas tout pour ne pas geler le PC, juste un échantillon ou les actifs
-        # Pour l'instant, on fait un pass sur les nœuds en mémoire RAM
-        changes_count = 0
-
-        for node in self.graph.nodes.values():
-            # RÈGLE 1 : Graine -> Sapling
-            # SI #état/graine ET (liens > 2) -> #état/sapling
-            if "état/graine" in node.tags and len(node.links) > 2:
-                print(f"[Jardinier] 🌱 -> 🌳 Croissance détectée : {node.title}")
-                node.tags.remove("état/graine")
-                node.tags.add("état/sapling")
-                # TODO: Répercuter la modif dans le fichier Markdown physique via Librarian
-                changes_count += 1
-
-            # RÈGLE 2 : Archivage (Apoptose)
-            # SI non modifié depuis 2 ans (730 jours) -> #archives
-            days_inactive = (datetime.now() - node.date_updated).days
-            if days_inactive > 730 and "archives" not in str(node.tags):
-                print(f"[Jardinier] 🍂 Archivage auto : {node.title}")
-                # Logic d'archivage à implémenter
-                pass
-
-        if changes_count > 0:
-            print(f"[Jardinier] {changes_count} mises à jour effectuées.")
-            self.graph.save_state()
\ No newline at end of file
+        changed = self.gardener.run_cycle()
+        # Répercussion dans les fichiers Markdown (en-tête YAML uniquement, par lots)
+        for change in changed:
+            self.writeback.enqueue(change.node.rel_path, add_tags=change.added, remove_tags=change.removed)
+
+        if changed:
+            print(f"[Jardinier] {len(changed)} mises à jour effectuées.")
+            self.graph.save_state()
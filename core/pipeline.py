@@ -0,0 +1,108 @@
+import time
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class PipelineStage:
+    """
+    Étage du pipeline du Cerveau : file d'entrée bornée, `workers` threads, sorties dans l'ordre.
+      - `work(item)` s'exécute en parallèle sur les threads de l'étage (appels réseau : Whisper, LLM...)
+      - `emit(result)` est appelé séquentiellement, dans l'ordre de soumission : un résultat en avance
+        attend dans le tampon de réordonnancement que les précédents soient sortis
+      - `submit` bloque quand la file est pleine : la contre-pression remonte à l'étage précédent
+    Un `work` qui lève une exception ou retourne None ne produit rien (l'ordre est préservé).
+    """
+
+    def __init__(self, name: str, work: Callable[[Any], Any], emit: Optional[Callable[[Any], None]] = None,
+                 workers: int = 1, maxsize: int = 8):
+        self.name = name
+        self.work = work
+        self.emit = emit
+        self.queue: "queue.Queue" = queue.Queue(maxsize)
+
+        # Ordre : numéro de séquence attribué à la soumission, sortie dans le même ordre
+        self._submit_lock = threading.Lock()
+        self._next_in = 0
+        self._next_out = 0
+        self._done: Dict[int, Any] = {}
+        self._done_lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+
+        # Statistiques
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+        self.threads = [threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+                        for i in range(max(1, workers))]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, item: Any, timeout: Optional[float] = None):
+        """Ajoute un élément (bloquant si la file est pleine ; queue.Full après `timeout`)."""
+        with self._submit_lock:
+            self.queue.put((self._next_in, item), timeout=timeout)
+            self._next_in += 1
+
+    def offer(self, item: Any) -> bool:
+        """Ajoute un élément seulement s'il reste de la place (requêtes fusionnables)."""
+        with self._submit_lock:
+            try:
+                self.queue.put_nowait((self._next_in, item))
+            except queue.Full:
+                return False
+            self._next_in += 1
+            return True
+
+    @property
+    def pending(self) -> int:
+        """Éléments soumis et pas encore sortis (en file, en cours ou en attente de leur tour)."""
+        return self._next_in - self._next_out
+
+    def close(self, timeout: Optional[float] = None):
+        """Termine les éléments déjà soumis puis arrête les threads."""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, float]:
+        return {"processed": self.processed, "errors": self.errors, "pending": self.pending,
+                "busy_s": round(self.busy_seconds, 2)}
+
+    def _worker(self):
+        while True:
+            entry = self.queue.get()
+            if entry is None:
+                return
+            seq, item = entry
+            started = time.perf_counter()
+            try:
+                result = self.work(item)
+            except Exception as e:
+                print(f"[Pipeline] ❌ {self.name} : {e}")
+                self.errors += 1
+                result = None
+            self.busy_seconds += time.perf_counter() - started
+            with self._done_lock:
+                self._done[seq] = result
+            self._drain()
+
+    def _drain(self):
+        # Un seul thread sort les résultats à la fois ; chacun vérifie la tête après avoir déposé le sien
+        with self._emit_lock:
+            while True:
+                with self._done_lock:
+                    if self._next_out not in self._done:
+                        return
+                    result = self._done.pop(self._next_out)
+                self.processed += 1
+                if result is not None and self.emit is not None:
+                    try:
+                        self.emit(result)
+                    except Exception as e:
+                        print(f"[Pipeline] ❌ {self.name} (sortie) : {e}")
+                        self.errors += 1
+                with self._done_lock:
+                    self._next_out += 1
@@ -13,6 +13,14 @@ class Settings(BaseSettings):
 
     WHISPER_BASE_URL: str = "http://localhost:8000/v1"
     WHISPER_MODEL: str = "Systran/faster-whisper-large-v3"
+    # Envoi des segments : "wav" (accepté par tout serveur Whisper compatible OpenAI).
+    # Sur option, après vérification que le serveur les décode : "flac" / "opus" (soundfile, repli sur wav)
+    # ou "pcm" (int16 brut). Voir benchmarks/stt_upload.py pour mesurer le gain.
+    WHISPER_UPLOAD_ENCODING: str = "wav"
+    # Pool de connexions HTTP persistantes vers Whisper
+    WHISPER_MAX_CONNECTIONS: int = 8
+    WHISPER_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    WHISPER_TIMEOUT_SECONDS: float = 60.0
 
     ROUTER_BASE_URL: str = "http://localhost:11435/v1"
     ROUTER_MODEL_NAME: str = "mistral-nemo"
@@ -21,11 +29,62 @@ class Settings(BaseSettings):
     CHROMA_HOST: str = "localhost"
     CHROMA_PORT: int = 8001
 
+    # --- CLIENTS HTTP (registre partagé, un pool par point d'accès) ---
+    HTTP_MAX_CONNECTIONS: int = 16
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CONNECT_RETRIES: int = 1  # Échecs d'ouverture de connexion
+    LLM_TIMEOUT_SECONDS: float = 120.0
+    LLM_MAX_RETRIES: int = 2  # Politique du SDK : 429, 5xx, délais dépassés
+
     # --- AUDIO & VAD (P1) ---
     SAMPLE_RATE: int = 16000
     BLOCK_SIZE: int = 512
     VAD_THRESHOLD: float = 0.5
     VAD_MIN_SILENCE_DURATION_MS: int = 1000
+    VAD_PREROLL_MS: int = 200  # Audio conservé avant la détection de parole
+    VAD_MAX_SEGMENT_SECONDS: float = 30.0  # Un segment plus long est coupé
+    VAD_BATCH_CHUNKS: int = 8  # Chunks en attente traités en un seul bloc (retard de l'Oreille)
+    # Transcription en continu : fenêtres chevauchantes émises pendant la parole
+    STT_STREAMING_ENABLED: bool = True
+    STT_PARTIAL_INTERVAL_SECONDS: float = 5.0  # Une fenêtre partielle toutes les N secondes de parole
+    STT_PARTIAL_WINDOW_SECONDS: float = 7.0  # Durée d'une fenêtre (chevauchement = fenêtre - intervalle)
+    STT_EARLY_ROUTE_WORDS: int = 6  # Mots stabilisés avant de router l'intention par anticipation
+    STT_STREAM_TIMEOUT_SECONDS: float = 20.0  # Phrase sans nouvelle fenêtre (finale perdue) : terminée avec ce qu'on a
+    # Transport Oreille -> Cerveau en mémoire partagée (cases de VAD_MAX_SEGMENT_SECONDS)
+    AUDIO_SHM_SLOTS: int = 8
+    AUDIO_SLOT_TIMEOUT_SECONDS: float = 2.0  # Attente max d'une case libre avant abandon du segment
+
+    # --- PIPELINE DU CERVEAU ---
+    # Transcription -> Routage -> Action -> Synthèse de fond, files bornées entre les étages
+    PIPELINE_STT_WORKERS: int = 2  # Requêtes Whisper simultanées
+    PIPELINE_ROUTE_WORKERS: int = 2  # Routages (intention + embedding) simultanés
+    PIPELINE_QUEUE_SIZE: int = 8
+
+    # --- CACHE D'EMBEDDINGS ---
+    # Clé : modèle + texte normalisé ; LRU en mémoire puis SQLite dans LOGS_DIR
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_SIZE: int = 4096
+    EMBEDDING_CACHE_FILE: str = "embeddings.sqlite"
+    # Demandes simultanées regroupées en une requête (fenêtre d'attente après la première)
+    EMBEDDING_BATCH_WINDOW_MS: float = 5.0
+    EMBEDDING_MAX_BATCH: int = 64
+    # Attente maximale d'un micro-lot avant l'appel direct (regroupeur bloqué ou lent)
+    EMBEDDING_BATCH_TIMEOUT_SECONDS: float = 30.0
+
+    # --- ROUTAGE RAPIDE (classifieur local avant le LLM) ---
+    # Règles évidentes puis centroïde d'exemples ; le LLM ne tranche que les cas douteux
+    INTENT_FAST_PATH_ENABLED: bool = True
+    INTENT_MIN_SIMILARITY: float = 0.6  # Similarité cosinus minimale avec le centroïde retenu
+    INTENT_MIN_MARGIN: float = 0.05  # Écart minimal avec la deuxième intention
+    INTENT_MIN_EXAMPLES: int = 5  # Exemples requis pour qu'une intention soit candidate
+    INTENT_EXAMPLES_FILE: str = "intent_examples.jsonl"  # Réponses du LLM journalisées (LOGS_DIR)
+    INTENT_MAX_LEARNED_EXAMPLES: int = 200  # Exemples appris retenus par intention (les plus anciens sont oubliés)
+
+    # --- INGESTION DE FICHIERS (ingest.py) ---
+    INGEST_WORKERS: int = 4  # Requêtes de transcription simultanées
+    INGEST_MAX_PENDING: int = 16  # Segments en vol (transcription + attente de leur tour)
+    INGEST_REPORT_SECONDS: float = 10.0  # Intervalle des rapports de débit
 
     # --- SYNTHÈSE VOCALE (P3) ---
     ENABLE_TTS: bool = True
@@ -63,14 +122,54 @@ class Settings(BaseSettings):
 
     IGNITION_THRESHOLD: float = 60.0
     DECAY_RATE: float = 0.95
+    DECAY_INTERVAL_SECONDS: float = 10.0  # Période d'application de DECAY_RATE (et de la récupération de fatigue)
     FATIGUE_PENALTY: float = 5.0
     FATIGUE_TOLERANCE: float = 4.0
     PROPAGATION_RATE: float = 0.2
 
+    # --- SCANNER (ADR-019) ---
+    # Nombre de processus pour le parsing initial du Vault (0 = nombre de cœurs, 1 = séquentiel)
+    SCANNER_WORKERS: int = 0
+    # Surveillance du Vault en cours de session (inotify sous Linux, scrutation sinon)
+    VAULT_WATCH_ENABLED: bool = True
+    VAULT_WATCH_DEBOUNCE_SECONDS: float = 1.0
+    VAULT_WATCH_POLL_SECONDS: float = 5.0
+
+    # --- NIVEAUX CHAUD / FROID (Vaults de très grande taille) ---
+    # Les notes anciennes et au repos ne gardent qu'un enregistrement sur disque (mmap),
+    # promu en GraphNode complet à la première lecture.
+    # Désactivé par défaut : gain mesuré faible (~4 % de mémoire sur 10k notes)
+    GRAPH_TIERING_ENABLED: bool = False
+    GRAPH_HOT_CAPACITY: int = 50000  # Nœuds chauds max (LRU au-delà)
+    GRAPH_HOT_RECENT_DAYS: int = 180  # Notes modifiées depuis moins longtemps : chaudes au chargement
+    GRAPH_PROMOTE_ACTIVATION: float = 10.0  # Activation reçue par propagation déclenchant la promotion
+
+    # --- RÉCUPÉRATION PAR LE GRAPHE (Intention [READ]) ---
+    # PageRank personnalisé depuis les notes citées dans la question
+    RETRIEVAL_ALPHA: float = 0.25  # Probabilité de retour à la graine
+    RETRIEVAL_TOLERANCE: float = 1e-4  # Arrêt anticipé (delta L1 entre deux itérations)
+    RETRIEVAL_MAX_ITERATIONS: int = 40
+    RETRIEVAL_PRUNE_EPSILON: float = 1e-5  # Scores plus petits abandonnés (frontière bornée, indépendante de la taille du Vault)
+    RETRIEVAL_BUDGET_MS: float = 50.0
+    RETRIEVAL_TOP_K: int = 5
+    RETRIEVAL_CACHE_SIZE: int = 1024  # Graines dont le vecteur PPR est gardé en cache
+    RETRIEVAL_CACHE_ENTRIES: int = 256  # Scores conservés par graine
+
+    # --- JARDINAGE (ADR-028) ---
+    GARDENING_RULES_FILE: Path = Path("brain/graph/gardening_rules.yaml")
+    GARDENING_INTERVAL_SECONDS: float = 60.0
+    # Écriture des tags modifiés dans les notes : "local" (fichier, atomique) ou "rest" (API Obsidian)
+    WRITEBACK_MODE: str = "local"
+    WRITEBACK_MAX_WORKERS: int = 4
+    WRITEBACK_BATCH_SIZE: int = 64
+    WRITEBACK_FLUSH_SECONDS: float = 5.0
+
     # --- LOGGING & PERSISTANCE ---
     ANALYST_UPDATE_INTERVAL_SECONDS: int = 60
     # SESSION_ID sera généré dynamiquement dans le main, pas ici
     LOGS_DIR: Path = Path("logs")
+    # Journalisation des activations modifiées (brain_state.log), compactée à l'arrêt
+    STATE_SAVE_SECONDS: float = 30.0
 
     # --- PROMPTS SYSTEME ---
     # (Je garde les prompts ici pour l'instant pour faciliter la transition,
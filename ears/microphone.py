@@ -43,18 +43,27 @@ class MicrophoneStream:
         # On met une copie des données dans la file d'attente
         self._buff.put(indata.copy())
 
-    def generator(self):
+    def generator(self, max_chunks: int = 1):
         """
         Générateur qui yield les chunks audio.
         Bloque si pas de données, s'arrête si le flux est fermé.
+        Si le consommateur a pris du retard, jusqu'à `max_chunks` chunks déjà
+        disponibles sont regroupés en un seul bloc.
         """
         while not self.closed:
             try:
                 # Récupère un chunk (attend max 1s, sinon vérifie si fermé)
                 chunk = self._buff.get(timeout=1.0)
-                # Aplatir le chunk (de [512, 1] à [512])
-                yield chunk.flatten()
             except queue.Empty:
                 if self.closed:
                     break
-                continue
\ No newline at end of file
+                continue
+
+            chunks = [chunk]
+            while len(chunks) < max_chunks:
+                try:
+                    chunks.append(self._buff.get_nowait())
+                except queue.Empty:
+                    break
+            # Aplatir le chunk (de [512, 1] à [512])
+            yield chunks[0].reshape(-1) if len(chunks) == 1 else np.concatenate(chunks).reshape(-1)
\ No newline at end of file
@@ -0,0 +1,43 @@
+from typing import Optional, Tuple
+
+
+class PartialWindowPlanner:
+    """
+    Découpe d'un segment de parole en fenêtres chevauchantes (transcription en continu).
+    Pendant la parole, une fenêtre de `window_seconds` se terminant à la position courante
+    est due toutes les `interval_seconds` ; la fenêtre finale couvre le reste du segment
+    plus le chevauchement (window - interval) avec la précédente.
+    Les positions sont en échantillons (coordonnées de l'anneau du VADSegmenter).
+    interval_seconds <= 0 : pas de fenêtre partielle (segment entier à la fin).
+    """
+
+    def __init__(self, sample_rate: int, interval_seconds: float, window_seconds: float):
+        self.interval = int(interval_seconds * sample_rate)
+        self.window = max(int(window_seconds * sample_rate), self.interval)
+        self.overlap = self.window - self.interval
+        self.segment_start = 0
+        self.last_end = -1  # Fin de la dernière fenêtre partielle (-1 : aucune)
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def start(self, segment_start: int):
+        self.segment_start = segment_start
+        self.last_end = -1
+
+    def due(self, pos: int) -> Optional[Tuple[int, int]]:
+        """Fenêtre partielle [début, fin) à émettre à la position `pos`, ou None."""
+        if not self.enabled:
+            return None
+        reference = self.segment_start if self.last_end < 0 else self.last_end
+        if pos - reference < self.interval:
+            return None
+        self.last_end = pos
+        return max(self.segment_start, pos - self.window), pos
+
+    def final(self, end: int) -> Tuple[int, int]:
+        """Fenêtre finale du segment (le segment entier si aucune partielle n'a été émise)."""
+        if self.last_end < 0:
+            return self.segment_start, end
+        return max(self.segment_start, self.last_end - self.overlap), end
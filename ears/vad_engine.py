@@ -1,18 +1,34 @@
 import torch
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List
 
 from core.data_models import AudioPayload
+from ears.stream_windows import PartialWindowPlanner
 
 
 class VADSegmenter:
     """
     Gère la détection d'activité vocale (VAD) et l'assemblage des segments audio.
     Utilise Silero VAD pour analyser les chunks entrants.
+
+    L'audio est copié dans un anneau float32 préalloué (aucune allocation par chunk) :
+      - pré-roll : les `preroll_ms` précédant la détection sont inclus dans le segment
+      - un segment est toujours contigu dans l'anneau (relogé au début si besoin) et
+        remis sous forme de vue (sans copie), valide jusqu'au tour d'anneau suivant
+        (au moins un segment plus tard) : le consommateur le copie s'il le garde
+      - le silence est compté en échantillons, un segment est coupé à `max_segment_seconds`
+    Un bloc de plusieurs chunks (retard du consommateur, reprise du PTT) est évalué
+    en une seule inférence Silero quand l'état du modèle vient d'être réinitialisé.
+
+    Transcription en continu (partial_interval_seconds > 0) : pendant la parole, des
+    fenêtres chevauchantes sont émises (is_final=False, même utterance_id) puis la
+    fenêtre finale à la fin du segment ; le Cerveau recolle les textes (TranscriptStitcher).
     """
 
-    def __init__(self, sample_rate: int = 16000, threshold: float = 0.5, min_silence_duration_ms: int = 500):
+    def __init__(self, sample_rate: int = 16000, threshold: float = 0.5, min_silence_duration_ms: int = 500,
+                 chunk_size: int = 512, preroll_ms: int = 200, max_segment_seconds: float = 30.0,
+                 partial_interval_seconds: float = 0.0, partial_window_seconds: float = 0.0):
         self.sample_rate = sample_rate
         self.threshold = threshold
         self.min_silence_duration_ms = min_silence_duration_ms
@@ -34,78 +50,182 @@ class VADSegmenter:
         self.model.eval()  # Mode évaluation
         print("Silero VAD chargé.")
 
+        # Tailles en échantillons
+        self.chunk_size = chunk_size
+        self.min_silence_samples = min_silence_duration_ms * sample_rate / 1000
+        self.preroll = int(preroll_ms * sample_rate / 1000)
+        self.max_segment = int(max_segment_seconds * sample_rate)
+
+        # Anneau : un segment max en écriture, le précédent encore lisible, plus le pré-roll
+        self.ring = np.zeros(3 * self.max_segment + self.preroll + chunk_size, dtype=np.float32)
+        self._carry = np.zeros(chunk_size, dtype=np.float32)  # Reste d'un bloc incomplet
+        self._carry_len = 0
+
         # État interne
-        self.buffer: List[np.ndarray] = []
-        self.is_speaking = False
-        self.silence_counter = 0
+        self.pos = 0  # Position d'écriture dans l'anneau
+        self.valid_from = 0  # Début de l'audio continu (pré-roll disponible)
+        self.segment_start = -1  # Début du segment en cours (-1 : pas de parole)
+        self.silence_samples = 0
         self.segment_start_time = None
+        self._fresh = True  # État Silero réinitialisé : un bloc peut être évalué d'un coup
+
+        # Fenêtres partielles (transcription en continu)
+        self.windows = PartialWindowPlanner(sample_rate, partial_interval_seconds, partial_window_seconds)
+        self.utterance_id = 0
+
+    @property
+    def is_speaking(self) -> bool:
+        return self.segment_start >= 0
+
+    def restart(self):
+        """Reprise du PTT : nouvel état Silero, le pré-roll repart de zéro."""
+        if hasattr(self.model, "reset_states"):
+            self.model.reset_states()
+        self._fresh = True
+        self._carry_len = 0
+        self.valid_from = self.pos
 
     def process_chunk(self, chunk: np.ndarray) -> Optional[AudioPayload]:
         """
         Traite un petit morceau d'audio (chunk).
         Retourne un AudioPayload si une phrase est terminée, sinon None.
         """
-        # 1. Conversion pour Silero (attend du float32)
-        if chunk.dtype != np.float32:
-            chunk = chunk.astype(np.float32)
+        payloads = self.process_block(chunk)
+        return payloads[0] if payloads else None
 
-        # Silero attend un tensor
-        chunk_tensor = torch.from_numpy(chunk)
-
-        # 2. Prédiction (Probabilité que ce soit de la parole)
-        # Note : On met .item() pour récupérer la valeur float du tensor
-        speech_prob = self.model(chunk_tensor, self.sample_rate).item()
-
-        current_is_speech = speech_prob > self.threshold
+    def process_block(self, audio: np.ndarray, received_at: Optional[datetime] = None) -> List[AudioPayload]:
+        """
+        Traite un bloc d'audio (un ou plusieurs chunks, longueur quelconque).
+        Retourne les segments terminés dans ce bloc.
+        `received_at` : instant de la fin du bloc (par défaut maintenant ; fichier : position dans l'enregistrement).
+        """
+        # 1. Conversion pour Silero (attend du float32)
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        received_at = received_at or datetime.now()
+        size = self.chunk_size
+
+        if self._carry_len:
+            head = min(size - self._carry_len, len(audio))
+            self._carry[self._carry_len:self._carry_len + head] = audio[:head]
+            self._carry_len += head
+            audio = audio[head:]
+            if self._carry_len < size:
+                return []
+            audio = np.concatenate([self._carry, audio])
+            self._carry_len = 0
+
+        n_chunks = len(audio) // size
+        rest = len(audio) - n_chunks * size
+        if rest:
+            self._carry[:rest] = audio[n_chunks * size:]
+            self._carry_len = rest
+        if n_chunks == 0:
+            return []
+        chunks = audio[:n_chunks * size].reshape(n_chunks, size)
+
+        # 2. Prédiction (Probabilité que ce soit de la parole), un seul transfert pour le bloc
+        probs = self._speech_probs(chunks)
 
         # 3. Logique de segmentation (Machine à états simplifiée)
-
-        if current_is_speech:
-            # --- Ça parle ---
-            if not self.is_speaking:
-                self.is_speaking = True
-                self.segment_start_time = datetime.now()
-
-            self.silence_counter = 0
-            self.buffer.append(chunk)
-
-        else:
-            # --- Silence ---
-            if self.is_speaking:
-                self.buffer.append(chunk)
-                self.silence_counter += 1
-
-                # Calcul de la durée du silence accumulé
-                chunk_duration_ms = (len(chunk) / self.sample_rate) * 1000
-                current_silence_duration = self.silence_counter * chunk_duration_ms
-
-                if current_silence_duration > self.min_silence_duration_ms:
-                    return self._finalize_segment()
-
+        payloads = []
+        for k in range(n_chunks):
+            self._write(chunks[k])
+
+            if probs[k] > self.threshold:
+                # --- Ça parle ---
+                if self.segment_start < 0:
+                    # Horodatage du chunk dans le bloc (le bloc a pu attendre)
+                    chunk_time = received_at - timedelta(seconds=(n_chunks - k) * size / self.sample_rate)
+                    self._open_segment(chunk_time)
+                self.silence_samples = 0
+
+            elif self.segment_start >= 0:
+                # --- Silence ---
+                self.silence_samples += size
+                if self.silence_samples > self.min_silence_samples:
+                    payloads.append(self._finalize_segment())
+                    continue
+
+            # Segment trop long : coupé (la suite repart avec le pré-roll)
+            if self.segment_start >= 0 and self.pos - self.segment_start >= self.max_segment:
+                payloads.append(self._finalize_segment())
+            elif self.segment_start >= 0:
+                window = self.windows.due(self.pos)
+                if window:
+                    payloads.append(self._window_payload(*window, is_final=False))
+
+        return [p for p in payloads if p is not None]
+
+    def flush(self) -> Optional[AudioPayload]:
+        """Termine le segment en cours (relâchement du PTT)."""
+        if self.segment_start < 0:
+            return None
+        return self._finalize_segment()
+
+    # --- Inférence ---
+    def _speech_probs(self, chunks: np.ndarray) -> np.ndarray:
+        with torch.inference_mode():
+            x = torch.from_numpy(chunks)
+            if self._fresh and len(chunks) > 1 and hasattr(self.model, "audio_forward"):
+                # audio_forward réinitialise l'état puis enchaîne les chunks en un appel
+                probs = self.model.audio_forward(x.reshape(1, -1), self.sample_rate)[0]
             else:
-                pass
-
-        return None
+                probs = torch.cat([self.model(row, self.sample_rate).reshape(-1) for row in x])
+        self._fresh = False
+        return probs.numpy()
+
+    # --- Anneau ---
+    def _write(self, chunk: np.ndarray):
+        n = len(chunk)
+        if self.pos + n > len(self.ring):
+            # Fin d'anneau (jamais pendant un segment) : on ne garde que le pré-roll
+            keep = min(self.preroll, self.pos - self.valid_from)
+            self.ring[:keep] = self.ring[self.pos - keep:self.pos]
+            self.pos, self.valid_from = keep, 0
+        self.ring[self.pos:self.pos + n] = chunk
+        self.pos += n
+
+    def _open_segment(self, chunk_time: datetime):
+        onset = self.pos - self.chunk_size
+        start = max(onset - self.preroll, self.valid_from)
+        if start + self.max_segment + self.chunk_size > len(self.ring):
+            # Relogement au début : le segment doit rester contigu jusqu'à sa taille max
+            length = self.pos - start
+            self.ring[:length] = self.ring[start:self.pos]
+            onset -= start
+            start, self.pos, self.valid_from = 0, length, 0
+        self.segment_start = start
+        self.silence_samples = 0
+        self.segment_start_time = chunk_time - timedelta(seconds=(onset - start) / self.sample_rate)
+        if self.windows.enabled:
+            self.utterance_id += 1
+            self.windows.start(start)
 
     def _finalize_segment(self) -> Optional[AudioPayload]:
-        """Crée l'objet final et nettoie le buffer. Retourne None si vide."""
-        if not self.buffer:
-            return None
-
-        full_audio = np.concatenate(self.buffer)
-        duration = len(full_audio) / self.sample_rate
-
-        payload = AudioPayload(
-            audio_data=full_audio,
-            sample_rate=self.sample_rate,
-            timestamp=self.segment_start_time,
-            duration_seconds=duration
-        )
+        """Crée l'objet final (vue sur l'anneau) et réinitialise l'état. Retourne None si vide."""
+        end = self.pos
+        payload = None
+        if end > self.segment_start:
+            # En continu : seule la fin non encore envoyée (plus le chevauchement) part
+            window_start, _ = self.windows.final(end) if self.windows.enabled else (self.segment_start, end)
+            payload = self._window_payload(window_start, end, is_final=True)
 
         # Reset complet de l'état pour la prochaine phrase
-        self.buffer = []
-        self.is_speaking = False
-        self.silence_counter = 0
+        self.segment_start = -1
+        self.silence_samples = 0
         self.segment_start_time = None
-
-        return payload
\ No newline at end of file
+        return payload
+
+    def _window_payload(self, start: int, end: int, is_final: bool) -> AudioPayload:
+        """Vue sur l'anneau [start, end) du segment en cours."""
+        offset = (start - self.segment_start) / self.sample_rate
+        audio = self.ring[start:end]
+        return AudioPayload(
+            audio_data=audio,
+            sample_rate=self.sample_rate,
+            timestamp=self.segment_start_time + timedelta(seconds=offset),
+            duration_seconds=len(audio) / self.sample_rate,
+            utterance_id=self.utterance_id if self.windows.enabled else 0,
+            window_start=offset,
+            is_final=is_final
+        )
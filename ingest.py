@@ -0,0 +1,373 @@
+"""
+Ingestion par lots d'enregistrements (réunions, mémos) : WAV / FLAC -> VAD -> Whisper -> Cerveau.
+Les fichiers sont traités dans l'ordre chronologique (début d'enregistrement = date de
+modification - durée). Les segments détectés par le VADSegmenter partent vers un pool
+borné de requêtes de transcription ; les textes sont remis à l'orchestrateur dans l'ordre
+des segments, quel que soit l'ordre d'arrivée des réponses.
+La progression (segments remis par fichier) est enregistrée dans LOGS_DIR : une
+exécution interrompue reprend là où elle s'était arrêtée.
+
+Usage : python ingest.py <dossier|fichier> [...] [--workers 4] [--route] [--restart]
+"""
+import os
+import json
+import time
+import wave
+import queue
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.settings import settings
+from ears.vad_engine import VADSegmenter
+
+AUDIO_EXTENSIONS = (".wav", ".flac")
+READ_SECONDS = 10.0  # Taille des blocs lus dans le fichier
+
+
+# --- Lecture des fichiers ---
+class AudioFile:
+    """Fichier audio lu par blocs (mono float32), sans le charger en entier."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._sf = None
+        self._wave = None
+        if path.suffix.lower() == ".wav":
+            try:
+                self._wave = wave.open(str(path), "rb")
+            except wave.Error:
+                pass  # WAV non PCM (float, 24 bits...) : soundfile
+        if self._wave is not None:
+            self.sample_rate = self._wave.getframerate()
+            self.frames = self._wave.getnframes()
+        else:
+            try:
+                import soundfile
+            except ImportError:
+                raise RuntimeError("Lecture FLAC impossible : installer soundfile (pip install soundfile)")
+            self._sf = soundfile.SoundFile(str(path))
+            self.sample_rate = self._sf.samplerate
+            self.frames = self._sf.frames
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+    def blocks(self, seconds: float) -> Iterator[np.ndarray]:
+        n = int(seconds * self.sample_rate)
+        while True:
+            if self._wave is not None:
+                block = self._pcm(self._wave.readframes(n))
+            else:
+                block = self._sf.read(n, dtype="float32", always_2d=True).mean(axis=1)
+            if len(block) == 0:
+                return
+            yield block
+
+    def _pcm(self, raw: bytes) -> np.ndarray:
+        width, channels = self._wave.getsampwidth(), self._wave.getnchannels()
+        if width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+        else:
+            dtype = {2: np.int16, 4: np.int32}[width]
+            data = np.frombuffer(raw, dtype=dtype).astype(np.float32) / np.iinfo(dtype).max
+        return data.reshape(-1, channels).mean(axis=1)
+
+    def close(self):
+        if self._wave is not None:
+            self._wave.close()
+        if self._sf is not None:
+            self._sf.close()
+
+
+class LinearResampler:
+    """
+    Rééchantillonnage par interpolation linéaire, bloc par bloc (continu entre les blocs).
+    Suffisant pour la VAD et Whisper sur de la parole ; les fichiers à SAMPLE_RATE passent tels quels.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int):
+        self.step = source_rate / target_rate
+        self.t = 0.0  # Prochain instant de sortie, en échantillons d'entrée depuis `prev`
+        self.prev = np.zeros(0, dtype=np.float32)
+
+    def __call__(self, block: np.ndarray) -> np.ndarray:
+        if self.step == 1.0:
+            return block
+        buf = np.concatenate([self.prev, block])
+        times = np.arange(self.t, len(buf) - 1, self.step)
+        out = np.interp(times, np.arange(len(buf)), buf).astype(np.float32)
+        # Le dernier échantillon devient l'origine du bloc suivant
+        self.t = (times[-1] + self.step if len(times) else self.t) - (len(buf) - 1)
+        self.prev = buf[-1:]
+        return out
+
+
+# --- Progression ---
+class IngestProgress:
+    """
+    Segments déjà remis au Cerveau, par fichier (clé : chemin, taille, date de modification).
+    Un fichier modifié depuis repart de zéro. Écriture atomique (fichier temporaire + remplacement).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: Dict[str, dict] = {}
+        if path.exists():
+            try:
+                self.files = json.loads(path.read_text(encoding="utf-8")).get("files", {})
+            except Exception as e:
+                print(f"[Ingest] ⚠️ Progression illisible, reprise de zéro : {e}")
+        self._last_save = 0.0
+
+    @staticmethod
+    def key(path: Path) -> str:
+        stat = path.stat()
+        return f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def entry(self, key: str) -> dict:
+        return self.files.setdefault(key, {"segments": 0, "done": False})
+
+    def save(self, force: bool = False):
+        now = time.time()
+        if not force and now - self._last_save < 1.0:
+            return
+        self._last_save = now
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"files": self.files}, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# --- Pipeline ---
+@dataclass
+class PendingSegment:
+    key: str
+    index: int  # Rang du segment dans le fichier
+    timestamp: datetime
+    end_offset: float  # Fin du segment depuis le début du fichier (s)
+    future: Optional[Future] = None  # None : marqueur de fin de fichier
+
+
+class BatchIngestor:
+    """
+    Découpe (VAD, fil principal) -> transcription (pool de INGEST_WORKERS) -> Cerveau (fil principal).
+    La file `pending` est à la fois la limite de segments en vol (INGEST_MAX_PENDING) et le
+    tampon de réordonnancement : seule la tête est remise, une fois sa transcription terminée.
+    """
+
+    def __init__(self, orchestrator, vad: VADSegmenter, progress: IngestProgress,
+                 workers: int, max_pending: int, route: bool = False):
+        self.orchestrator = orchestrator
+        self.vad = vad
+        self.progress = progress
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stt")
+        self.max_pending = max(max_pending, workers)
+        self.route = route
+        self.pending: Deque[PendingSegment] = deque()
+
+        # Débit
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.total_audio = 0.0
+        self.done_audio = 0.0  # Secondes d'enregistrement entièrement remises
+        self.resumed_audio = 0.0  # Déjà faites lors d'une exécution précédente
+        self.offsets: Dict[str, float] = {}  # Position remise dans chaque fichier en cours
+        self.segments = 0
+        self.speech = 0.0
+
+    def run(self, files: List[Tuple[Path, float, datetime]]):
+        self.total_audio = sum(duration for _, duration, _ in files)
+        try:
+            for path, duration, start in files:
+                self._ingest_file(path, duration, start)
+            while self.pending:
+                self._deliver_head()
+        finally:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.progress.save(force=True)
+        self._report(final=True)
+
+    def _ingest_file(self, path: Path, duration: float, start: datetime):
+        key = IngestProgress.key(path)
+        entry = self.progress.entry(key)
+        entry.update(path=str(path), audio_seconds=round(duration, 2))
+        if entry["done"]:
+            self.done_audio += duration
+            self.resumed_audio += duration
+            return
+        skip = entry["segments"]
+        print(f"[Ingest] 📼 {path.name} ({duration / 60:.1f} min, début {start:%Y-%m-%d %H:%M})"
+              + (f" : reprise après {skip} segments" if skip else ""))
+        self.offsets[key] = 0.0
+
+        audio = AudioFile(path)
+        self.vad.restart()
+        resample = LinearResampler(audio.sample_rate, self.vad.sample_rate)
+        index = 0
+        read = 0
+        try:
+            for block in audio.blocks(READ_SECONDS):
+                read += len(block)
+                block_end = start + timedelta(seconds=read / audio.sample_rate)
+                payloads = self.vad.process_block(resample(block), received_at=block_end)
+                for payload in payloads:
+                    index = self._submit(key, index, skip, start, payload)
+                self._deliver_ready()
+            payload = self.vad.flush()
+            if payload is not None:
+                index = self._submit(key, index, skip, start, payload)
+        finally:
+            audio.close()
+        # Marqueur : le fichier est terminé quand tous ses segments ont été remis
+        self._push(PendingSegment(key, index, start, duration))
+
+    def _submit(self, key: str, index: int, skip: int, start: datetime, payload) -> int:
+        end_offset = (payload.timestamp - start).total_seconds() + payload.duration_seconds
+        if index >= skip:
+            # Vue sur l'anneau du VAD : copiée avant que l'anneau ne la recouvre
+            audio = payload.audio_data.copy()
+            future = self.pool.submit(self.orchestrator.inference.process_audio, audio, payload.sample_rate)
+            self.speech += payload.duration_seconds
+            self._push(PendingSegment(key, index, payload.timestamp, end_offset, future))
+        else:
+            # Déjà remis lors d'une exécution précédente : seul le VAD est rejoué
+            advance = self._advance(key, end_offset)
+            self.done_audio += advance
+            self.resumed_audio += advance
+        return index + 1
+
+    def _advance(self, key: str, end_offset: float) -> float:
+        """Avance la position remise du fichier ; retourne les secondes gagnées."""
+        previous = self.offsets[key]
+        self.offsets[key] = max(previous, end_offset)
+        return self.offsets[key] - previous
+
+    def _push(self, segment: PendingSegment):
+        self.pending.append(segment)
+        while len(self.pending) > self.max_pending:
+            self._deliver_head()
+
+    def _deliver_ready(self):
+        while self.pending and (self.pending[0].future is None or self.pending[0].future.done()):
+            self._deliver_head()
+
+    def _deliver_head(self):
+        segment = self.pending.popleft()
+        entry = self.progress.entry(segment.key)
+        if segment.future is None:
+            entry["done"] = True
+            self.done_audio += self._advance(segment.key, segment.end_offset)
+            del self.offsets[segment.key]
+            self.progress.save(force=True)
+            return
+
+        try:
+            text, speakers = segment.future.result()
+        except Exception as e:
+            print(f"[Ingest] ❌ Transcription échouée (segment {segment.index}) : {e}")
+            text, speakers = "", []
+        source = f"Fichier:{Path(entry['path']).name}"
+        try:
+            self.orchestrator.ingest_transcript(text, segment.timestamp, source=source, route=self.route)
+            self.orchestrator.process_background_tasks()
+        except Exception as e:
+            print(f"[Ingest] ❌ Erreur Cerveau (segment {segment.index}) : {e}")
+
+        entry["segments"] = segment.index + 1
+        self.segments += 1
+        self.done_audio += self._advance(segment.key, segment.end_offset)
+        self.progress.save()
+        if time.perf_counter() - self.last_report > settings.INGEST_REPORT_SECONDS:
+            self._report()
+
+    def _report(self, final: bool = False):
+        now = time.perf_counter()
+        self.last_report = now
+        elapsed = max(now - self.started, 1e-6)
+        processed = self.done_audio - self.resumed_audio
+        rate = processed / elapsed
+        remaining = self.total_audio - self.done_audio
+        eta = f"{remaining / rate / 60:.0f} min" if rate > 0 and not final else "-"
+        print(f"\n[Ingest] 📈 {self.done_audio / 3600:.2f} h / {self.total_audio / 3600:.2f} h | "
+              f"{rate:.1f} s audio / s ({self.speech / elapsed:.1f} s de parole / s) | "
+              f"{self.segments} segments | {len(self.pending)} en vol | reste {eta}", flush=True)
+
+
+def collect_files(inputs: List[str]) -> List[Tuple[Path, float, datetime]]:
+    """Fichiers audio triés par début d'enregistrement (date de modification - durée)."""
+    paths = []
+    for item in inputs:
+        root = Path(item)
+        if root.is_dir():
+            paths.extend(p for p in sorted(root.rglob("*")) if p.suffix.lower() in AUDIO_EXTENSIONS)
+        elif root.suffix.lower() in AUDIO_EXTENSIONS:
+            paths.append(root)
+
+    files = []
+    for path in paths:
+        try:
+            audio = AudioFile(path)
+            duration = audio.duration
+            audio.close()
+        except Exception as e:
+            print(f"[Ingest] ⚠️ {path} ignoré : {e}")
+            continue
+        start = datetime.fromtimestamp(path.stat().st_mtime) - timedelta(seconds=duration)
+        files.append((path, duration, start))
+    files.sort(key=lambda f: (f[2], str(f[0])))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion par lots d'enregistrements audio.")
+    parser.add_argument("inputs", nargs="+", help="Dossiers ou fichiers WAV / FLAC")
+    parser.add_argument("--workers", type=int, default=settings.INGEST_WORKERS)
+    parser.add_argument("--max-pending", type=int, default=settings.INGEST_MAX_PENDING)
+    parser.add_argument("--route", action="store_true", help="Router l'intention (défaut : tout en [WRITE])")
+    parser.add_argument("--restart", action="store_true", help="Ignorer la progression enregistrée")
+    args = parser.parse_args()
+
+    settings.LOGS_DIR.mkdir(exist_ok=True)
+    progress_path = settings.LOGS_DIR / "ingest_progress.json"
+    if args.restart and progress_path.exists():
+        progress_path.unlink()
+
+    files = collect_files(args.inputs)
+    if not files:
+        print("[Ingest] Aucun fichier WAV / FLAC trouvé.")
+        return
+    print(f"[Ingest] {len(files)} fichiers, {sum(d for _, d, _ in files) / 3600:.2f} h d'audio.")
+
+    from core.orchestrator import BrainOrchestrator
+
+    # Pas de Bouche ni de micro : les files de l'orchestrateur restent locales
+    orchestrator = BrainOrchestrator(queue.Queue(), queue.Queue(), queue.Queue(), threading.Event())
+    vad = VADSegmenter(
+        sample_rate=settings.SAMPLE_RATE,
+        threshold=settings.VAD_THRESHOLD,
+        min_silence_duration_ms=settings.VAD_MIN_SILENCE_DURATION_MS,
+        chunk_size=settings.BLOCK_SIZE,
+        preroll_ms=settings.VAD_PREROLL_MS,
+        max_segment_seconds=settings.VAD_MAX_SEGMENT_SECONDS
+    )
+    ingestor = BatchIngestor(orchestrator, vad, IngestProgress(progress_path),
+                             workers=args.workers, max_pending=args.max_pending, route=args.route)
+    try:
+        ingestor.run(files)
+    except KeyboardInterrupt:
+        print("\n[Ingest] ⏸️ Interrompu : relancer la même commande pour reprendre.")
+    finally:
+        orchestrator.shutdown()
+
+
+if __name__ == "__main__":
+    main()
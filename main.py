@@ -3,6 +3,7 @@ import time
 import sys
 import uvicorn
 from core.settings import settings
+from core.audio_transport import SharedAudioRing
 from core.orchestrator import BrainOrchestrator
 from ears.microphone import MicrophoneStream
 from ears.vad_engine import VADSegmenter
@@ -10,7 +11,7 @@ from output.speaker import mouth_worker
 
 
 # --- P1 : OREILLE (Avec PTT) ---
-def ear_process(audio_queue, control_queue, stop_event):
+def ear_process(audio_queue, audio_ring, control_queue, stop_event):
     print("[Oreille] Initialisation...")
     try:
         # Par défaut, le micro est coupé (PTT oblige)
@@ -19,13 +20,19 @@ def ear_process(audio_queue, control_queue, stop_event):
         vad = VADSegmenter(
             sample_rate=settings.SAMPLE_RATE,
             threshold=settings.VAD_THRESHOLD,
-            min_silence_duration_ms=settings.VAD_MIN_SILENCE_DURATION_MS
+            min_silence_duration_ms=settings.VAD_MIN_SILENCE_DURATION_MS,
+            chunk_size=settings.BLOCK_SIZE,
+            preroll_ms=settings.VAD_PREROLL_MS,
+            max_segment_seconds=settings.VAD_MAX_SEGMENT_SECONDS,
+            # Transcription en continu : fenêtres partielles pendant la parole
+            partial_interval_seconds=settings.STT_PARTIAL_INTERVAL_SECONDS if settings.STT_STREAMING_ENABLED else 0.0,
+            partial_window_seconds=settings.STT_PARTIAL_WINDOW_SECONDS
         )
 
         with MicrophoneStream(rate=settings.SAMPLE_RATE, block_size=settings.BLOCK_SIZE) as mic:
             print("[Oreille] 🔇 Micro en veille (Attente PTT).")
 
-            for chunk in mic.generator():
+            for block in mic.generator(max_chunks=settings.VAD_BATCH_CHUNKS):
                 if stop_event.is_set(): break
 
                 # 1. Vérification des ordres (PTT Start/Stop)
@@ -34,27 +41,36 @@ def ear_process(audio_queue, control_queue, stop_event):
                     if msg_type == "ptt":
                         if content == "start":
                             is_recording = True
+                            vad.restart()
                             print("\n[Oreille] 🎙️ ON AIR", flush=True)
                         elif content == "stop":
                             is_recording = False
+                            # La phrase en cours part sans attendre le silence
+                            payload = vad.flush()
+                            if payload:
+                                descriptor = audio_ring.put(payload, timeout=settings.AUDIO_SLOT_TIMEOUT_SECONDS)
+                                if descriptor:
+                                    audio_queue.put(descriptor)
                             print("\n[Oreille] 🔇 MUTED", flush=True)
 
                 # 2. Traitement Audio (Seulement si ON AIR)
                 if is_recording:
-                    payload = vad.process_chunk(chunk)
-                    if payload:
-                        audio_queue.put(payload)
-                        print("⚡", end="", flush=True)
+                    for payload in vad.process_block(block):
+                        # Échantillons écrits une fois en mémoire partagée, seul le descripteur transite
+                        descriptor = audio_ring.put(payload, timeout=settings.AUDIO_SLOT_TIMEOUT_SECONDS)
+                        if descriptor:
+                            audio_queue.put(descriptor)
+                            print("⚡", end="", flush=True)
 
     except Exception as e:
         print(f"[Oreille] ❌ Erreur : {e}")
 
 
 # --- P2 : CERVEAU ---
-def brain_process_wrapper(audio_queue, tts_queue, input_queue, stop_event):
+def brain_process_wrapper(audio_queue, audio_ring, tts_queue, input_queue, stop_event):
     try:
         # On passe input_queue à l'orchestrateur
-        orchestrator = BrainOrchestrator(audio_queue, tts_queue, input_queue, stop_event)
+        orchestrator = BrainOrchestrator(audio_queue, tts_queue, input_queue, stop_event, audio_ring=audio_ring)
         orchestrator.run()
     except Exception as e:
         print(f"[Cerveau] ❌ CRASH FATAL : {e}")
@@ -85,7 +101,13 @@ if __name__ == "__main__":
     print(f"--- 🌊 OCÉANE v3.3 (Web Control) ---")
 
     # Queues
-    audio_q = multiprocessing.Queue()  # Oreille -> Cerveau
+    audio_q = multiprocessing.Queue()  # Oreille -> Cerveau (descripteurs)
+    # Oreille -> Cerveau (échantillons) : une case par segment, un segment max par case
+    audio_ring = SharedAudioRing(
+        slots=settings.AUDIO_SHM_SLOTS,
+        slot_samples=int(settings.VAD_MAX_SEGMENT_SECONDS * settings.SAMPLE_RATE) + settings.BLOCK_SIZE,
+        create=True
+    )
     tts_q = multiprocessing.Queue()  # Cerveau -> Bouche
     input_q = multiprocessing.Queue()  # Web (Texte) -> Cerveau
     control_q = multiprocessing.Queue()  # Web (PTT) -> Oreille
@@ -94,8 +116,9 @@ if __name__ == "__main__":
 
     # Processus
     processes = [
-        multiprocessing.Process(target=ear_process, args=(audio_q, control_q, stop_ev), name="Oreille"),
-        multiprocessing.Process(target=brain_process_wrapper, args=(audio_q, tts_q, input_q, stop_ev), name="Cerveau"),
+        multiprocessing.Process(target=ear_process, args=(audio_q, audio_ring, control_q, stop_ev), name="Oreille"),
+        multiprocessing.Process(target=brain_process_wrapper, args=(audio_q, audio_ring, tts_q, input_q, stop_ev),
+                                name="Cerveau"),
         multiprocessing.Process(target=mouth_worker, args=(tts_q, stop_ev), name="Bouche"),
         multiprocessing.Process(target=server_process_wrapper, args=(input_q, control_q, stop_ev), name="Web")
     ]
@@ -117,4 +140,5 @@ if __name__ == "__main__":
         for p in processes:
             if p.is_alive(): p.terminate()
             p.join()
+        audio_ring.unlink()
         print("Système éteint.")
\ No newline at end of file
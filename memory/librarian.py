@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from datetime import datetime
 from pathlib import Path
 
@@ -27,35 +28,82 @@ class Librarian:
         Point d'entrée principal pour l'Analyste.
         Décide s'il faut créer ou mettre à jour une note.
         """
+        return self.process_concepts([{"title": title, "content": content, "tags": tags}])[0]
+
+    def process_concepts(self, concepts: list) -> list:
+        """
+        Traite une extraction complète de l'Analyste (liste de {title, content, tags}) :
+        un seul lot d'embeddings, une seule recherche de doublons Chroma, une seule indexation.
+        Mêmes décisions que process_concept appelé concept par concept, y compris le
+        rapprochement avec un concept créé plus tôt dans le même lot.
+        """
+        threshold = 0.15
+        results = [None] * len(concepts)
+
+        # 1. Fichiers existants : enrichissement direct
+        pending = []
+        for i, concept in enumerate(concepts):
+            filename = self._filename(concept['title'])
+            if self.storage.obsidian.file_exists(filename):
+                print(f"[Librarian] 📂 Enrichissement note existante : '{filename}'")
+                self._update_garden_zone(filename, concept['content'])
+                results[i] = filename
+            else:
+                pending.append(i)
+        if not pending:
+            return results
+
+        # 2. Doublons sémantiques : une requête d'embeddings, une requête Chroma
+        embeddings = self.router.get_embeddings([concepts[i]['content'] for i in pending])
+        if embeddings is not None:
+            existing = self.vectors.find_existing_concepts(embeddings, threshold=threshold)
+            units = embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        else:
+            existing = [None] * len(pending)
+
+        # 3. Fusion ou création
+        created = []  # (rang dans pending, fichier créé)
+        for j, i in enumerate(pending):
+            concept = concepts[i]
+            target = existing[j]
+            if target is None and embeddings is not None:
+                # Concept créé plus tôt dans ce lot (pas encore indexé) : distance cosinus
+                target = next((fname for k, fname in created if 1.0 - float(units[j] @ units[k]) < threshold), None)
+            if target:
+                print(f"[Librarian] 🔄 Fusion sémantique vers : '{target}'")
+                self._update_garden_zone(target, concept['content'])
+                results[i] = target
+                continue
+
+            # Même titre qu'une note créée plus tôt dans ce lot : enrichissement, comme
+            # l'aurait fait l'étape 1 concept par concept (un seul id par note pour Chroma)
+            filename = self._filename(concept['title'])
+            if any(fname == filename for _, fname in created):
+                print(f"[Librarian] 📂 Enrichissement note existante : '{filename}'")
+                self._update_garden_zone(filename, concept['content'])
+                results[i] = filename
+                continue
+
+            print(f"[Librarian] ✨ Nouvelle note : '{concept['title']}'")
+            results[i] = self.storage.create_atomic_note(concept['title'], concept['content'], concept['tags'])
+            created.append((j, results[i]))
+
+        # 4. Indexation groupée des nouveaux concepts
+        if embeddings is not None and created:
+            rows = [j for j, _ in created]
+            self.vectors.index_concepts(
+                [fname for _, fname in created],
+                [concepts[pending[j]]['content'] for j in rows],
+                embeddings[rows],
+                [concepts[pending[j]]['tags'] for j in rows]
+            )
+        return results
+
+    @staticmethod
+    def _filename(title: str) -> str:
+        """Nom de fichier d'un concept (même assainissement que MemoryManager.create_atomic_note)."""
         safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '_', '-')]).strip()
-        filename = f"{safe_title}.md"
-
-        # 1. Le fichier existe-t-il physiquement ?
-        if self.storage.obsidian.file_exists(filename):
-            print(f"[Librarian] 📂 Enrichissement note existante : '{filename}'")
-            self._update_garden_zone(filename, content)
-            return filename
-
-        # 2. Sinon, est-ce un doublon sémantique ? (Vecteurs)
-        embedding = self.router.get_embedding(content)
-        existing_filename = None
-        if embedding is not None:
-            existing_filename = self.vectors.find_existing_concept(embedding, threshold=0.15)
-
-        if existing_filename:
-            print(f"[Librarian] 🔄 Fusion sémantique vers : '{existing_filename}'")
-            self._update_garden_zone(existing_filename, content)
-            return existing_filename
-
-        # 3. Création pure
-        print(f"[Librarian] ✨ Nouvelle note : '{title}'")
-        real_filename = self.storage.create_atomic_note(title, content, tags)
-
-        # Indexation immédiate
-        if embedding is not None:
-            self.vectors.index_concept(real_filename, content, embedding, tags)
-
-        return real_filename
+        return f"{safe_title}.md"
 
     def _update_garden_zone(self, filename: str, new_ai_content: str):
         """
@@ -18,9 +18,9 @@ class MemoryManager:
         else:
             print("[Mémoire] 🟠 Obsidian non détecté (Mode Backup Local).")
 
-    def log_event(self, source, text, intent="FLUX LIBRE", extra=None):
+    def log_event(self, source, text, intent="FLUX LIBRE", extra=None, timestamp=None):
         payload = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (timestamp or datetime.now()).isoformat(),
             "source": source,
             "text": text,
             "intent_tag": intent,
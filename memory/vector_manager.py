@@ -66,26 +66,32 @@ class VectorManager:
         """
         Cherche un concept sémantiquement proche.
         """
-        if not self.concept_collection: return None
+        return self.find_existing_concepts([embedding], threshold)[0]
+
+    def find_existing_concepts(self, embeddings, threshold: float = 0.15) -> list:
+        """
+        Version par lot : une seule requête Chroma pour tous les embeddings (matrice (n, d) ou liste).
+        Retourne, pour chacun, le nom du fichier du concept le plus proche sous le seuil, ou None.
+        """
+        if len(embeddings) == 0:
+            return []
+        if not self.concept_collection: return [None] * len(embeddings)
         try:
-            safe_embedding = embedding.tolist() if hasattr(embedding, 'tolist') else embedding
+            safe_embeddings = [e.tolist() if hasattr(e, 'tolist') else e for e in embeddings]
 
             results = self.concept_collection.query(
-                query_embeddings=[safe_embedding],
+                query_embeddings=safe_embeddings,
                 n_results=1
             )
 
-            if results['distances'] and len(results['distances'][0]) > 0:
-                distance = results['distances'][0][0]
-                existing_id = results['ids'][0][0]  # L'ID est le nom du fichier
-
-                if distance < threshold:
-                    return existing_id  # On retourne le nom du fichier existant
-
-            return None
+            found = []
+            for distances, ids in zip(results['distances'] or [], results['ids'] or []):
+                # L'ID est le nom du fichier
+                found.append(ids[0] if distances and distances[0] < threshold else None)
+            return found + [None] * (len(embeddings) - len(found))
         except Exception as e:
             print(f"[Vecteur] ⚠️ Erreur recherche concept : {e}")
-            return None
+            return [None] * len(embeddings)
 
     def index_concept(self, filename: str, content: str, embedding: list, tags: list):
         """Enregistre un nouveau concept dans l'index."""
@@ -101,4 +107,18 @@ class VectorManager:
             )
             print(f"[Vecteur] 🧠 Concept indexé : {filename}")
         except Exception as e:
-            print(f"[Vecteur] ❌ Erreur indexation concept : {e}")
\ No newline at end of file
+            print(f"[Vecteur] ❌ Erreur indexation concept : {e}")
+
+    def index_concepts(self, filenames: list, contents: list, embeddings, tags: list):
+        """Version par lot de index_concept (un seul ajout Chroma)."""
+        if not self.concept_collection or not filenames: return
+        try:
+            self.concept_collection.add(
+                ids=list(filenames),
+                embeddings=[e.tolist() if hasattr(e, 'tolist') else e for e in embeddings],
+                documents=list(contents),
+                metadatas=[{"tags": str(t)} for t in tags]
+            )
+            print(f"[Vecteur] 🧠 {len(filenames)} concepts indexés : {', '.join(filenames)}")
+        except Exception as e:
+            print(f"[Vecteur] ❌ Erreur indexation concepts : {e}")
\ No newline at end of file
@@ -0,0 +1,258 @@
+import os
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from core.settings import settings
+from brain.graph.frontmatter import load_frontmatter
+
+SAFETY_MARKER = "<!-- AI_GARDEN_START -->"  # Cf. Librarian (ADR-025)
+FRONTMATTER_PATTERN = re.compile(r'^---\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|$)', re.DOTALL)
+KEY_LINE = re.compile(r'^([A-Za-z_][\w-]*)\s*:')
+
+
+@dataclass
+class FrontmatterEdit:
+    """Modifications en attente sur l'en-tête d'une note (fusionnées par fichier)."""
+    add_tags: Set[str] = field(default_factory=set)
+    remove_tags: Set[str] = field(default_factory=set)
+    fields: Dict[str, str] = field(default_factory=dict)  # clé -> valeur YAML déjà rendue
+    queued_at: float = field(default_factory=time.monotonic)
+
+    def merge(self, add_tags: Iterable[str] = (), remove_tags: Iterable[str] = (),
+              fields: Optional[Dict[str, str]] = None):
+        # La dernière demande l'emporte : un ajout annule un retrait antérieur et inversement
+        for tag in remove_tags:
+            self.add_tags.discard(tag)
+            self.remove_tags.add(tag)
+        for tag in add_tags:
+            self.remove_tags.discard(tag)
+            self.add_tags.add(tag)
+        self.fields.update(fields or {})
+
+
+class WritebackQueue:
+    """
+    File d'écriture des modifications de Frontmatter vers le Vault (Jardinier -> Markdown).
+    - Les demandes sont fusionnées par fichier : une note modifiée N fois n'est écrite qu'une fois.
+    - flush() envoie les fichiers en attente par lots vers un pool de threads borné.
+    - Chaque écriture ne touche qu'à l'en-tête YAML : le corps de la note (zone humaine
+      et zone <!-- AI_GARDEN_START -->) est conservé octet pour octet.
+    - Mode "local" : réécriture atomique (fichier temporaire + os.replace) ;
+      mode "rest" : un GET puis un seul PUT par fichier via l'API Obsidian.
+    """
+
+    def __init__(self, mode: Optional[str] = None, bridge=None, vault_path: Optional[Path] = None):
+        self.mode = mode or settings.WRITEBACK_MODE
+        self.bridge = bridge
+        self.vault_path = Path(vault_path or settings.OBSIDIAN_VAULT_PATH)
+        self.batch_size = settings.WRITEBACK_BATCH_SIZE
+        self.pool = ThreadPoolExecutor(max_workers=settings.WRITEBACK_MAX_WORKERS,
+                                       thread_name_prefix="Writeback")
+
+        self._pending: Dict[str, FrontmatterEdit] = {}
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+
+        # Statistiques
+        self.written = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.last_flush_ms = 0.0
+        self._latencies: List[float] = []  # Attente + écriture par fichier (ms), fenêtre glissante
+
+    # --- API ---
+    def enqueue(self, rel_path: str, add_tags: Iterable[str] = (), remove_tags: Iterable[str] = (),
+                fields: Optional[Dict[str, str]] = None):
+        """Ajoute (ou fusionne) une modification d'en-tête pour la note `rel_path` (relatif au Vault)."""
+        with self._lock:
+            edit = self._pending.get(rel_path)
+            if edit is None:
+                edit = self._pending[rel_path] = FrontmatterEdit()
+            edit.merge(add_tags, remove_tags, fields)
+
+    def backlog(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._in_flight)
+
+    def flush(self) -> int:
+        """
+        Soumet un lot de fichiers au pool (non bloquant). Un fichier déjà en cours
+        d'écriture reste en attente pour le lot suivant. Retourne la taille du lot.
+        """
+        with self._lock:
+            ready = [p for p in self._pending if p not in self._in_flight][:self.batch_size]
+            batch = [(p, self._pending.pop(p)) for p in ready]
+            self._in_flight.update(ready)
+        if not batch:
+            return 0
+
+        started = time.perf_counter()
+        remaining = [len(batch)]
+
+        def done(_future):
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    self.last_flush_ms = (time.perf_counter() - started) * 1000.0
+
+        for rel_path, edit in batch:
+            self.pool.submit(self._write_one, rel_path, edit).add_done_callback(done)
+        return len(batch)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            backlog = len(self._pending) + len(self._in_flight)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+        return {
+            "backlog": backlog,
+            "written": self.written,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "p95_latency_ms": round(p95, 1)
+        }
+
+    def close(self, timeout: float = 10.0):
+        """Vide la file avant l'arrêt (appelé en fin de session)."""
+        deadline = time.monotonic() + timeout
+        while self.backlog() and time.monotonic() < deadline:
+            self.flush()
+            time.sleep(0.05)
+        self.pool.shutdown(wait=True)
+
+    # --- Écriture d'un fichier ---
+    def _write_one(self, rel_path: str, edit: FrontmatterEdit):
+        requeue = False
+        try:
+            if self.mode == "rest":
+                status = self._write_rest(rel_path, edit)
+            else:
+                status = self._write_local(rel_path, edit)
+            requeue = status == "retry"
+        except Exception as e:
+            status = "failed"
+            print(f"[Writeback] ❌ Écriture impossible ({rel_path}) : {e}")
+
+        with self._lock:
+            self._in_flight.discard(rel_path)
+            if requeue:
+                # Fichier modifié pendant l'écriture : on retente au prochain lot
+                pending = self._pending.get(rel_path)
+                if pending is None:
+                    self._pending[rel_path] = edit
+                else:
+                    edit.merge(pending.add_tags, pending.remove_tags, pending.fields)
+                    self._pending[rel_path] = edit
+                return
+            if status == "written":
+                self.written += 1
+            elif status == "unchanged":
+                self.unchanged += 1
+            else:
+                self.failed += 1
+            self._latencies.append((time.monotonic() - edit.queued_at) * 1000.0)
+            del self._latencies[:-500]
+
+    def _write_local(self, rel_path: str, edit: FrontmatterEdit) -> str:
+        path = self.vault_path / rel_path
+        try:
+            before = os.stat(path)
+        except FileNotFoundError:
+            return "failed"  # Note supprimée ou déplacée entre-temps
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            text = f.read()
+
+        updated = apply_edit(text, edit)
+        if updated is None:
+            return "unchanged"
+
+        tmp_path = path.with_name(f".{path.name}.writeback.tmp")
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(updated)
+        # L'utilisateur a enregistré la note pendant notre lecture : on ne l'écrase pas
+        after = os.stat(path)
+        if (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size):
+            os.remove(tmp_path)
+            return "retry"
+        os.replace(tmp_path, path)
+        return "written"
+
+    def _write_rest(self, rel_path: str, edit: FrontmatterEdit) -> str:
+        bridge = self.bridge
+        endpoint = bridge._get_endpoint(rel_path)
+        response = bridge.client.get(endpoint, headers=bridge.headers)
+        if response.status_code != 200:
+            return "failed"
+
+        updated = apply_edit(response.text, edit)
+        if updated is None:
+            return "unchanged"
+        response = bridge.client.put(endpoint, content=updated.encode("utf-8"), headers=bridge.headers)
+        return "written" if response.status_code < 300 else "failed"
+
+
+def apply_edit(text: str, edit: FrontmatterEdit) -> Optional[str]:
+    """
+    Applique les modifications à l'en-tête YAML de `text`.
+    Retourne None si rien ne change. Seules les lignes des clés modifiées
+    sont réécrites ; le reste de l'en-tête et tout le corps sont conservés.
+    """
+    match = FRONTMATTER_PATTERN.match(text)
+    header = match.group(1) if match else ""
+    body = text[match.end():] if match else text
+    if SAFETY_MARKER in header:
+        raise ValueError("Marqueur AI_GARDEN_START dans l'en-tête : note ignorée")
+    newline = "\r\n" if "\r\n" in (header or text[:200]) else "\n"
+
+    # Parse complet : le chemin rapide du Scanner ne garde que FAST_KEYS
+    meta = load_frontmatter(header) if header.strip() else {}
+    if meta is None:
+        raise ValueError("En-tête YAML illisible : note ignorée")
+    lines = header.split(newline) if header else []
+    changed = False
+
+    if edit.add_tags or edit.remove_tags:
+        current = meta.get("tags") or []
+        if isinstance(current, str):
+            current = [current]
+        # "  - #projet" : élément réduit à un commentaire (None), ignoré
+        current = [str(t) for t in current if t is not None]
+        tags = [t for t in current if t not in edit.remove_tags]
+        tags += sorted(t for t in edit.add_tags if t not in tags)
+        if tags != current:
+            lines = _replace_key(lines, "tags", ["tags:"] + [f"  - {t}" for t in tags])
+            changed = True
+
+    for key, value in edit.fields.items():
+        if str(meta.get(key)) != value:
+            lines = _replace_key(lines, key, [f"{key}: {value}"])
+            changed = True
+
+    if not changed:
+        return None
+    header_block = "---" + newline + newline.join(lines) + newline + "---" + newline
+    if match is None and body and not body.startswith(("\n", "\r\n")):
+        header_block += newline
+    return header_block + body
+
+
+def _replace_key(lines: List[str], key: str, rendered: List[str]) -> List[str]:
+    """Remplace la clé `key` (et ses lignes de continuation) ou l'ajoute en fin d'en-tête."""
+    start = None
+    for i, line in enumerate(lines):
+        m = KEY_LINE.match(line)
+        if m and m.group(1) == key:
+            start = i
+            break
+    if start is None:
+        return lines + rendered
+    end = start + 1
+    while end < len(lines) and lines[end][:1] in (" ", "-", "\t"):
+        end += 1
+    return lines[:start] + rendered + lines[end:]
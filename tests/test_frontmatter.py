@@ -0,0 +1,112 @@
+"""
+Chemin rapide du Frontmatter : comparaison différentielle avec yaml.safe_load sur les FAST_KEYS.
+Un bloc que PyYAML rejette doit donner {} (comportement de référence du Scanner).
+"""
+import random
+
+import pytest
+import yaml
+
+from brain.graph.frontmatter import FAST_KEYS, fast_frontmatter, parse_frontmatter
+
+
+def reference(block: str):
+    try:
+        data = yaml.safe_load(block) or {}
+    except yaml.YAMLError:
+        return {}
+    except ValueError as e:  # Date impossible : PyYAML lève aussi hors YAMLError
+        return type(e)
+    if not isinstance(data, dict):
+        return data
+    return {k: v for k, v in data.items() if k in FAST_KEYS}
+
+
+def parsed(block: str):
+    try:
+        meta = parse_frontmatter(block)
+    except ValueError as e:
+        return type(e)
+    if not isinstance(meta, dict):
+        return meta
+    return {k: v for k, v in meta.items() if k in FAST_KEYS}
+
+
+CASES = [
+    # En-têtes Obsidian usuels
+    "title: Ma note\ntags:\n  - projet\n  - idée\nuid: 20240101\n",
+    "title: 'L''apostrophe'\naliases: [un, deux]\npoids: 1.5\ndate_updated: 2024-03-02\n",
+    'title: "Guillemets"\ntags: [a, b, c]\nstatut: graine\n',
+    "tags:\n- sans\n- indentation\n",
+    "tags:\n  - a # commentaire\n  - b\n",
+    "tags: # commentaire\n  - a\n",
+    "tags:\n",
+    "title: ~\npoids: null\nuid: yes\n",
+    "title: 12:30\n",
+    "title: 0x1F\npoids: .inf\n",
+    "date_updated: 2024-03-02T10:00:00\n",
+    "cssclasses:\n  - large\ntitle: Après une liste ignorée\n",
+    "tags:\n  -\n  - b\n",
+    # Signalés en revue
+    "tags:\n  - #projet\n",
+    "tags:\n  - #projet\n  - b\n",
+    "tags:\n  - a\n    - b\n",
+    "tags:\n    - a\n  - b\n",
+    "other:\n  - a\n    - b\ntitle: x\n",
+    "title: ok\nother: @x\n",
+    "title: ok\nother: - x\n",
+    "title: ok\nother: `x`\n",
+    "title: ok\nother: [a, b\n",
+    "title: ok\nother: a: b\n",
+    # Structures hors du sous-ensemble (repli)
+    "title: ok\nother:\n  nested: 1\n",
+    "title: ok\nother: x\n  suite\n",
+    "tags: [a, #b]\n",
+    "title: |\n  bloc\n",
+    "title: &ancre x\nuid: *ancre\n",
+    "- a\n- b\n",
+    "title: 'non fermée\n",
+    "title: a\ttab\n",
+]
+
+
+@pytest.mark.parametrize("block", CASES)
+def test_matches_pyyaml(block):
+    assert parsed(block) == reference(block)
+
+
+def test_comment_list_item_is_none():
+    assert parse_frontmatter("tags:\n  - #projet\n") == {"tags": [None]}
+
+
+@pytest.mark.parametrize("block", [
+    "tags:\n  - a\n    - b\n",
+    "tags:\n    - a\n  - b\n",
+    "title: ok\nother: @x\n",
+    "title: ok\nother: - x\n",
+])
+def test_rejected_by_fast_path(block):
+    # Indentation incohérente ou valeur douteuse sous une clé ignorée : PyYAML décide
+    assert fast_frontmatter(block) is None
+
+
+def test_fast_path_still_used_for_common_headers():
+    block = "title: Note\ntags:\n  - projet\naliases: [N]\nstatut: graine\ncssclasses:\n  - large\n"
+    assert fast_frontmatter(block) == reference(block)
+
+
+FRAGMENTS = [
+    "title: Note", "title: 'x''y'", 'title: "q"', "title: 12", "title: 1.5", "title: 2024-01-02",
+    "title: yes", "title: ~", "title: a #c", "title:", "uid: 0o17", "uid: 1e3", "uid: 1.0e+3",
+    "tags:", "tags: [a, b]", "tags: []", "tags: x", "  - a", "  - #c", "  - 3", "- b", "    - c",
+    "  - a: b", "aliases:", "aliases: [x]", "other: @x", "other: - x", "other: ok", "other:",
+    "  nested: 1", "# commentaire", "", "poids: -2", "poids: +.5", "poids: .5", "date_updated: 2024-13-01",
+    "title: =", "title: <<", "tags: [a, ]", "title: a: b", "title: x:", "title: 1_000", "title: 012",
+]
+
+
+def test_random_differential():
+    rng = random.Random(4)
+    for _ in range(3000):
+        block = "\n".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6))) + "\n"
+        assert parsed(block) == reference(block), block
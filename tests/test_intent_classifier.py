@@ -0,0 +1,160 @@
+"""
+Classifieur d'intention local : cascade (phrase connue -> règles -> centroïde), seuils
+INTENT_MIN_SIMILARITY / INTENT_MIN_MARGIN / INTENT_MIN_EXAMPLES et apprentissage contrôlé.
+Les embeddings sont des sacs de mots hachés (déterministes) : des phrases qui partagent
+des mots ont des vecteurs proches.
+"""
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+from core.settings import settings
+from brain.graph.matcher import fold_text
+from brain.intent_classifier import LocalIntentClassifier, SEED_EXAMPLES
+
+DIM = 512
+
+
+class FakeRouter:
+    def __init__(self):
+        self.calls = 0
+
+    def prefetch_embeddings(self, texts):
+        list(texts)
+
+    def get_embedding(self, text):
+        self.calls += 1
+        vector = np.zeros(DIM, dtype=np.float32)
+        for word in fold_text(text).replace("'", " ").replace("-", " ").split():
+            word = word.strip(",;:.!?…")
+            if word:
+                vector[zlib.crc32(word.encode("utf-8")) % DIM] += 1.0
+        return vector
+
+
+@pytest.fixture
+def classifier(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOGS_DIR", tmp_path)
+    return LocalIntentClassifier(FakeRouter())
+
+
+def learned_lines(classifier):
+    if not classifier.path.exists():
+        return []
+    with open(classifier.path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+# --- Cascade ---
+def test_known_phrase_ignores_case_accents_and_punctuation(classifier):
+    assert classifier.classify("efface LA derniere note") == "[CMD]"
+    assert classifier.exact_hits == 1
+    assert classifier.router.calls == sum(len(t) for t in SEED_EXAMPLES.values())  # Aucun embedding
+
+
+@pytest.mark.parametrize("text", [
+    "Arrête-toi maintenant.",
+    "Stop !",
+    "Supprime le brouillon d'hier.",
+    "Taisez-vous un instant.",
+    "Mets la dictée en pause.",
+])
+def test_imperative_verbs_are_commands(classifier, text):
+    assert classifier._rules(text) == "[CMD]"
+
+
+@pytest.mark.parametrize("text", [
+    "Pause café, on reprend après.",
+    "Silence radio de sa part depuis lundi.",
+    "Arrête-t-il vraiment ?",
+    "Efface la note, puis relie les deux idées sur la mémoire et la fatigue de l'attention.",
+])
+def test_nouns_questions_and_long_sentences_are_not_commands(classifier, text):
+    assert classifier._rules(text) != "[CMD]"
+
+
+@pytest.mark.parametrize("text", [
+    "Rappelle-moi ce que j'ai dit sur le sommeil.",
+    "Qu'est-ce que j'ai écrit hier ?",
+    "Retrouve-moi la réunion de lundi.",
+    "Tu as une note sur l'attention ?",
+])
+def test_explicit_note_requests_are_reads(classifier, text):
+    assert classifier._rules(text) == "[READ]"
+
+
+@pytest.mark.parametrize("text", [
+    "C'est quoi ce bruit ?",
+    "Que sais-tu de Spinoza ?",
+    "Cherche pas, c'est réglé.",
+])
+def test_ambiguous_openers_are_left_to_centroid(classifier, text):
+    assert classifier._rules(text) is None
+
+
+# --- Seuils du centroïde ---
+def test_centroid_decides_above_thresholds(classifier, monkeypatch):
+    monkeypatch.setattr(settings, "INTENT_MIN_SIMILARITY", 0.0)
+    monkeypatch.setattr(settings, "INTENT_MIN_MARGIN", 0.0)
+    text = "Le client veut une démonstration du chapitre trois."
+    best = classifier._scores(classifier.router.get_embedding(text))[0][1]
+    assert classifier.classify(text) == best == "[WRITE]"
+    assert classifier.centroid_hits == 1
+
+
+def test_centroid_abstains_below_similarity(classifier, monkeypatch):
+    monkeypatch.setattr(settings, "INTENT_MIN_SIMILARITY", 1.01)
+    monkeypatch.setattr(settings, "INTENT_MIN_MARGIN", 0.0)
+    assert classifier.classify("Le client veut une démonstration du chapitre trois.") is None
+
+
+def test_centroid_abstains_below_margin(classifier, monkeypatch):
+    monkeypatch.setattr(settings, "INTENT_MIN_SIMILARITY", 0.0)
+    monkeypatch.setattr(settings, "INTENT_MIN_MARGIN", 1.0)
+    assert classifier.classify("Le client veut une démonstration du chapitre trois.") is None
+
+
+def test_intents_need_min_examples(classifier, monkeypatch):
+    monkeypatch.setattr(settings, "INTENT_MIN_SIMILARITY", 0.0)
+    monkeypatch.setattr(settings, "INTENT_MIN_MARGIN", 0.0)
+    monkeypatch.setattr(settings, "INTENT_MIN_EXAMPLES", len(SEED_EXAMPLES["[WRITE]"]) + 1)
+    assert classifier._scores(classifier.router.get_embedding("Le client veut une démo.")) == []
+    assert classifier.classify("Le client veut une démo.") is None
+
+
+# --- Apprentissage ---
+def test_learn_rejects_disagreement_with_centroid(classifier):
+    text = "Le client veut une démonstration du chapitre trois."
+    counts = dict(classifier.counts)
+    classifier.learn(text, "[CHAT]", 0.5)
+    assert classifier.counts == counts
+    assert classifier.learn_rejected == 1
+    assert learned_lines(classifier) == []
+    assert classifier._fold(text) not in classifier.known
+
+
+def test_learn_accepts_confirmed_answer(classifier):
+    text = "Le client veut une démonstration du chapitre trois."
+    classifier.learn(text, "[WRITE]", 0.5)
+    assert classifier.counts["[WRITE]"] == len(SEED_EXAMPLES["[WRITE]"]) + 1
+    assert [line["intent"] for line in learned_lines(classifier)] == ["[WRITE]"]
+    assert classifier.classify(text) == "[WRITE]"  # Désormais phrase connue
+    classifier.learn(text, "[WRITE]", 0.5)  # Pas de doublon
+    assert len(learned_lines(classifier)) == 1
+
+
+def test_learned_examples_are_bounded(classifier, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "INTENT_MAX_LEARNED_EXAMPLES", 2)
+    texts = [f"Le client {n} veut une démonstration du chapitre trois." for n in ("A", "B", "C")]
+    for text in texts:
+        classifier.learn(text, "[WRITE]", 0.5)
+    seeds = len(SEED_EXAMPLES["[WRITE]"])
+    assert classifier.counts["[WRITE]"] == seeds + 2
+    assert classifier._fold(texts[0]) not in classifier.known
+    assert classifier._fold(texts[2]) in classifier.known
+    # Le centroïde ne garde aucune trace de l'exemple oublié
+    reference = LocalIntentClassifier(FakeRouter())
+    assert reference.counts["[WRITE]"] == seeds + 2
+    np.testing.assert_allclose(classifier.sums["[WRITE]"], reference.sums["[WRITE]"], atol=1e-5)
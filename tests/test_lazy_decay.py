@@ -0,0 +1,148 @@
+"""
+Oubli paresseux (ActivationEngine) : la forme close
+    A = A0 * DECAY_RATE^k (éteinte sous 0.1),  F = max(0, F0 - k)
+doit reproduire les passes discrètes GraphNode.decay()/rest() appliquées tick par tick.
+"""
+import random
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from core.settings import settings
+from brain.graph.engine import ActivationEngine
+from brain.graph.node import GraphNode
+
+PERIOD = settings.DECAY_INTERVAL_SECONDS
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000 * PERIOD):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_node(name: str) -> GraphNode:
+    return GraphNode(Path(settings.OBSIDIAN_VAULT_PATH) / f"{name}.md", f"{name}.md", name, name,
+                     tags=(), links=(), base_weight=1.0, date_updated=datetime.now())
+
+
+def make_engine(count: int):
+    """Moteur à horloge factice + nœuds de référence non rattachés (passes discrètes)."""
+    clock = FakeClock()
+    engine = ActivationEngine(clock=clock)
+    nodes = {f"n{i}.md": make_node(f"n{i}") for i in range(count)}
+    engine.compile(nodes, {})
+    reference = [make_node(f"r{i}") for i in range(count)]
+    return clock, engine, list(nodes.values()), reference
+
+
+def tick(reference):
+    for node in reference:
+        node.decay()
+        node.rest()
+
+
+def assert_same(bound, reference):
+    for node, ref in zip(bound, reference):
+        assert node.activation == pytest.approx(ref.activation, rel=1e-9, abs=1e-12)
+        assert node.consecutive_activations == ref.consecutive_activations
+
+
+@pytest.mark.parametrize("a0, f0", [(5.0, 3), (1.0, 0), (0.0, 7), (50.0, 20)])
+def test_closed_form_matches_discrete_ticks(a0, f0):
+    clock, engine, (node,), (ref,) = make_engine(1)
+    node.activation, node.consecutive_activations = a0, f0
+    ref.activation, ref.consecutive_activations = a0, f0
+
+    for k in range(1, 120):
+        clock.now += PERIOD
+        tick([ref])
+        assert node.activation == pytest.approx(ref.activation, rel=1e-9, abs=1e-12)
+        assert node.consecutive_activations == ref.consecutive_activations
+        assert node.activation == pytest.approx(
+            0.0 if a0 * settings.DECAY_RATE ** k < ActivationEngine.ACTIVATION_FLOOR else a0 * settings.DECAY_RATE ** k)
+        assert node.consecutive_activations == max(0, f0 - k)
+
+
+def test_single_jump_equals_many_ticks():
+    # Aucune lecture intermédiaire : une seule matérialisation après N ticks
+    clock, engine, (node,), (ref,) = make_engine(1)
+    node.activation = ref.activation = 8.0
+    node.consecutive_activations = ref.consecutive_activations = 5
+    for _ in range(13):
+        tick([ref])
+    clock.now += 13 * PERIOD
+    assert_same([node], [ref])
+
+
+def test_zero_cutoff_boundary():
+    clock, engine, nodes, refs = make_engine(3)
+    floor = ActivationEngine.ACTIVATION_FLOOR
+    # Exactement au seuil (conservé), juste au-dessus après un tick, juste en dessous après un tick
+    starts = [floor, floor / settings.DECAY_RATE * 1.001, floor / settings.DECAY_RATE * 0.999]
+    for node, ref, a0 in zip(nodes, refs, starts):
+        node.activation = ref.activation = a0
+    assert_same(nodes, refs)
+    assert nodes[0].activation == floor
+
+    clock.now += PERIOD
+    tick(refs)
+    assert_same(nodes, refs)
+    assert [n.activation > 0 for n in nodes] == [False, True, False]
+
+    # Une fois éteinte, l'activation reste nulle
+    clock.now += 5 * PERIOD
+    for _ in range(5):
+        tick(refs)
+    assert_same(nodes, refs)
+    assert all(n.activation == 0.0 for n in nodes)
+
+
+def test_partial_periods_do_not_decay():
+    clock, engine, (node,), (ref,) = make_engine(1)
+    clock.now = (clock.now // PERIOD) * PERIOD  # Début de période
+    node.activation = ref.activation = 3.0
+    clock.now += 0.99 * PERIOD
+    assert node.activation == 3.0
+    clock.now += 0.02 * PERIOD
+    tick([ref])
+    assert_same([node], [ref])
+
+
+def test_irregular_reads_and_stimuli_between_syncs():
+    """Lectures, stimulations et fatigue arrivant entre les ticks, vectorisé (sync) et scalaire (sync_one)."""
+    rng = random.Random(7)
+    clock, engine, nodes, refs = make_engine(12)
+    clock.now = (clock.now // PERIOD) * PERIOD
+    last_tick = engine.current_tick()
+
+    for step in range(400):
+        clock.now += rng.uniform(0.0, 3.5) * PERIOD
+        for _ in range(engine.current_tick() - last_tick):
+            tick(refs)
+        last_tick = engine.current_tick()
+
+        i = rng.randrange(len(nodes))
+        action = rng.random()
+        if action < 0.3:
+            amount = rng.uniform(0.05, 10.0)
+            nodes[i].stimulate(amount)
+            refs[i].stimulate(amount)
+        elif action < 0.45:
+            nodes[i].register_activation()
+            refs[i].register_activation()
+        elif action < 0.6:
+            engine.settle()  # Matérialisation vectorielle des nœuds actifs
+        elif action < 0.7:
+            engine.propagate(rate=0.0)  # Passe qui synchronise les actifs sans rien diffuser
+
+        if step % 25 == 0:
+            ids = np.arange(len(nodes))
+            engine.sync(ids)
+            assert np.allclose(engine.activation, [r.activation for r in refs], rtol=1e-9, atol=1e-12)
+            assert engine.fatigue.tolist() == [r.consecutive_activations for r in refs]
+    assert_same(nodes, refs)
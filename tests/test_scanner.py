@@ -0,0 +1,36 @@
+"""
+Scanner : le fichier est lu en octets (hash), puis décodé ; le résultat doit être celui
+d'une lecture en mode texte, y compris pour les notes CRLF (Windows).
+"""
+import pytest
+
+from brain.graph.scanner import VaultScanner, _load_entry
+
+NOTE = "---\ntitle: Hello\ntags: [a, b]\npoids: 5.0\n---\nCorps avec [[Autre note]].\n"
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_load_entry_matches_text_mode(tmp_path, newline):
+    path = tmp_path / "n.md"
+    path.write_bytes(NOTE.replace("\n", newline).encode("utf-8"))
+
+    entry, was_parsed = _load_entry(str(path), None)
+
+    assert was_parsed
+    record = entry["node"]
+    assert record["title"] == "Hello"
+    assert record["tags"] == ["a", "b"]
+    assert record["base_weight"] == 5.0
+    assert record["links"] == ["Autre note.md"]
+    with open(path, "r", encoding="utf-8") as f:
+        assert record == VaultScanner()._parse_record(f.read(), "n.md")
+
+
+def test_unchanged_hash_skips_parsing(tmp_path):
+    path = tmp_path / "n.md"
+    path.write_bytes(NOTE.replace("\n", "\r\n").encode("utf-8"))
+    entry, _ = _load_entry(str(path), None)
+
+    again, was_parsed = _load_entry(str(path), entry["hash"])
+
+    assert not was_parsed and again["node"] is None
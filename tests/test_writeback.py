@@ -0,0 +1,38 @@
+"""
+Réécriture de l'en-tête (apply_edit) : seules les clés modifiées changent, sur la base
+d'un parse YAML complet (pas seulement des FAST_KEYS du Scanner).
+"""
+import pytest
+
+from memory.writeback import FrontmatterEdit, apply_edit
+
+
+def test_header_without_fast_keys_is_readable():
+    text = "---\ncssclasses: wide\nstatut: graine\n---\nCorps\n"
+    updated = apply_edit(text, FrontmatterEdit(add_tags={"archives"}))
+    assert updated == "---\ncssclasses: wide\nstatut: graine\ntags:\n  - archives\n---\nCorps\n"
+
+
+def test_unreadable_header_is_rejected():
+    with pytest.raises(ValueError):
+        apply_edit("---\ntitle: [non fermé\n---\nCorps\n", FrontmatterEdit(add_tags={"a"}))
+
+
+def test_comment_list_item_is_not_a_tag():
+    text = "---\ntags:\n  - #projet\n  - a\n---\nCorps\n"
+    updated = apply_edit(text, FrontmatterEdit(add_tags={"archives"}))
+    assert updated == "---\ntags:\n  - a\n  - archives\n---\nCorps\n"
+    assert apply_edit(text, FrontmatterEdit(add_tags={"a"})) is None
+
+
+def test_unchanged_non_fast_field_is_not_rewritten():
+    text = "---\ntitle: Note\nstatut: graine\n---\nCorps\n"
+    assert apply_edit(text, FrontmatterEdit(fields={"statut": "graine"})) is None
+    assert apply_edit(text, FrontmatterEdit(fields={"statut": "arbre"})) == \
+        "---\ntitle: Note\nstatut: arbre\n---\nCorps\n"
+
+
+def test_crlf_header_keeps_line_endings():
+    text = "---\r\ntitle: Note\r\ntags: [a]\r\n---\r\nCorps\r\n"
+    assert apply_edit(text, FrontmatterEdit(add_tags={"b"})) == \
+        "---\r\ntitle: Note\r\ntags:\r\n  - a\r\n  - b\r\n---\r\nCorps\r\n"